@@ -1,30 +1,84 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import plotly.graph_objects as go
 from src.benchmarks.benchmark import Benchmark
+from src.benchmarks.adaptive import AdaptiveSampler
+from src.benchmarks.scheduler import BudgetScheduler
+from src.utils.results_db import ResultsDB
+from src.utils.run_store import RunStore, prune_runs
+from src.utils.workloads import KEY_DISTRIBUTIONS
+import os
 import time
 
 st.set_page_config(page_title="Structure Showdown", page_icon="🧱", layout="wide")
 
+CHART_POINTS = 1500       # trial timeline is downsampled to roughly screen width
+CSV_ROW_LIMIT = 200_000   # larger runs are exported as Parquet only
+RUNS_TO_KEEP = 20         # Parquet run files kept under results/runs
+# shape stats recorded by BST / HashTable / Graph operations, with chart labels
+STRUCTURE_STATS = {
+    'height': 'Height', 'avg_depth': 'Mean depth',
+    'load_factor': 'Load factor', 'max_chain': 'Max chain', 'mean_chain': 'Mean chain',
+    'max_degree': 'Max degree', 'mean_degree': 'Mean degree',
+}
+
 # Big-O reference for all operations
 BIG_O_REFERENCE = {
     "Array: insert_end": "O(1) amortized",
     "Array: insert_front": "O(n)",
     "Array: search": "O(n)",
     "Array: delete": "O(n)",
+    "Array: insert_middle": "O(n)",
+    "Deque: insert_front": "O(1)",
+    "Deque: insert_middle": "O(n)",
+    "Deque: search": "O(n)",
+    "GapBuffer: insert_front": "O(1) amortized at cursor",
+    "GapBuffer: insert_middle": "O(1) amortized at cursor",
+    "GapBuffer: search": "O(n)",
+    "SortedArray: insert": "O(log n) search + O(n) shift",
+    "SortedArray: search": "O(log n)",
+    "SortedArray: search_many": "O(m log n)",
+    "SortedArray: delete": "O(log n) search + O(n) shift",
+    "NumpyArray: insert_end": "O(1) amortized",
+    "NumpyArray: search": "O(n) vectorized",
+    "NumpyArray: search_many": "O((n + m) log n) vectorized",
+    "NumpyArray: remove_many": "O((n + m) log n) vectorized",
     "LinkedList: insert_tail": "O(n)",
     "LinkedList: search": "O(n)",
     "LinkedList: delete": "O(n)",
+    "UnrolledList: insert_tail": "O(1) amortized",
+    "UnrolledList: search": "O(n), n/B node hops",
+    "UnrolledList: delete": "O(n), n/B node hops",
     "BST: insert": "O(log n) avg, O(n) worst",
     "BST: insert_ordered": "O(n) worst case",
     "BST: search": "O(log n) avg, O(n) worst",
     "BST: delete": "O(log n) avg",
+    "BST: search_many": "O(m log n) avg",
+    "BTree: insert": "O(log n), log_B n node levels",
+    "BTree: search_many": "O(m log n), log_B n node levels",
+    "BTree: delete": "O(log n) + O(B) shift",
+    "BTree: range_scan": "O(log n + k) via leaf links",
     "HashTable: put": "O(1) avg",
     "HashTable: get": "O(1) avg",
     "HashTable: delete": "O(1) avg",
+    "Snapshot: open(HashTable)": "O(1) mmap attach",
+    "Snapshot: open(BST)": "O(1) mmap attach",
+    "Snapshot: open(BTree)": "O(1) mmap attach",
+    "FrozenHashTable: get_many": "O(1) avg per lookup",
+    "FrozenBST: search_many": "O(log n) avg per lookup",
+    "FrozenBTree: search_many": "O(log n) per lookup",
     "Graph: add_edges(line)": "O(1) per edge",
     "Graph: bfs_search(end)": "O(V + E)",
     "Graph: delete_node": "O(degree)",
+    "Graph: connected(union-find)": "O(α(n)) per query",
+    "Graph: connected(bfs)": "O(V + E) per query",
+    "Graph: dijkstra(indexed heap)": "O((V + E) log V) per query",
+    "Graph: dijkstra(lazy heap)": "O(E log E) per query",
+    "Graph: astar(manhattan)": "O(E log V) worst, settles fewer nodes",
+    "Cache: LRU replay": "O(1) per request",
+    "Cache: LFU replay": "O(1) per request",
+    "Cache: CLOCK replay": "O(1) amortized per request",
 }
 
 st.title("🧱 Structure Showdown")
@@ -39,23 +93,66 @@ operation_map = {
     "Array: insert_front": "Array (Python list)",
     "Array: search": "Array (Python list)",
     "Array: delete": "Array (Python list)",
+    "Array: insert_middle": "Array (Python list)",
+    # Front/middle-edit arrays
+    "Deque: insert_front": "Deque (collections.deque)",
+    "Deque: insert_middle": "Deque (collections.deque)",
+    "Deque: search": "Deque (collections.deque)",
+    "GapBuffer: insert_front": "Gap Buffer",
+    "GapBuffer: insert_middle": "Gap Buffer",
+    "GapBuffer: search": "Gap Buffer",
+    # Sorted / typed arrays
+    "SortedArray: insert": "Sorted Array (bisect)",
+    "SortedArray: search": "Sorted Array (bisect)",
+    "SortedArray: search_many": "Sorted Array (bisect)",
+    "SortedArray: delete": "Sorted Array (bisect)",
+    "NumpyArray: insert_end": "NumPy int64 Array",
+    "NumpyArray: search": "NumPy int64 Array",
+    "NumpyArray: search_many": "NumPy int64 Array",
+    "NumpyArray: remove_many": "NumPy int64 Array",
     # Linked List
     "LinkedList: insert_tail": "Linked List",
     "LinkedList: search": "Linked List",
     "LinkedList: delete": "Linked List",
+    # Unrolled Linked List
+    "UnrolledList: insert_tail": "Unrolled Linked List",
+    "UnrolledList: search": "Unrolled Linked List",
+    "UnrolledList: delete": "Unrolled Linked List",
     # BST
     "BST: insert": "Binary Search Tree",
     "BST: insert_ordered": "Binary Search Tree (ordered)",
     "BST: search": "Binary Search Tree",
     "BST: delete": "Binary Search Tree",
+    "BST: search_many": "Binary Search Tree",
+    # B+-tree
+    "BTree: insert": "B+-Tree (bisect nodes)",
+    "BTree: search_many": "B+-Tree (bisect nodes)",
+    "BTree: delete": "B+-Tree (bisect nodes)",
+    "BTree: range_scan": "B+-Tree (bisect nodes)",
     # Hash Table
     "HashTable: put": "Hash Table",
     "HashTable: get": "Hash Table",
     "HashTable: delete": "Hash Table",
+    # mmap snapshots
+    "Snapshot: open(HashTable)": "Hash Table snapshot (CSR arrays)",
+    "Snapshot: open(BST)": "BST snapshot (key/child arrays)",
+    "Snapshot: open(BTree)": "B+-Tree snapshot (sorted keys)",
+    "FrozenHashTable: get_many": "Hash Table snapshot (CSR arrays)",
+    "FrozenBST: search_many": "BST snapshot (key/child arrays)",
+    "FrozenBTree: search_many": "B+-Tree snapshot (sorted keys)",
     # Graph
     "Graph: add_edges(line)": "Graph (Adjacency List)",
     "Graph: bfs_search(end)": "Graph (Adjacency List)",
     "Graph: delete_node": "Graph (Adjacency List)",
+    "Graph: connected(union-find)": "Graph + Union-Find index",
+    "Graph: connected(bfs)": "Graph (Adjacency List)",
+    "Graph: dijkstra(indexed heap)": "Weighted Graph + indexed heap",
+    "Graph: dijkstra(lazy heap)": "Weighted Graph + heapq",
+    "Graph: astar(manhattan)": "Weighted Graph + indexed heap",
+    # Caches
+    "Cache: LRU replay": "LRU Cache (HashTable + list)",
+    "Cache: LFU replay": "LFU Cache (HashTable + freq lists)",
+    "Cache: CLOCK replay": "CLOCK Cache (slot ring)",
 }
 
 op = st.sidebar.selectbox("📊 Benchmark Operation", list(operation_map.keys()), index=0)
@@ -84,7 +181,39 @@ else:
         step = st.number_input("step", value=500, min_value=10, step=10)
     sizes = list(range(int(start), int(stop) + 1, int(step)))
 
-trials = st.sidebar.slider("🔄 Trials per size", min_value=1, max_value=20, value=5)
+distribution_choice = st.sidebar.selectbox(
+    "🎲 Key distribution",
+    ["default"] + list(KEY_DISTRIBUTIONS),
+    index=0,
+    help="'default' keeps each operation's standard input (sorted keys, shuffled for BST)",
+)
+distribution = None if distribution_choice == "default" else distribution_choice
+
+sampling_mode = st.sidebar.radio(
+    "🎯 Sampling mode",
+    ["Fixed trials", "Adaptive (target CI)"],
+    index=0,
+    help="Adaptive keeps sampling each size until the median's confidence interval is tight enough",
+)
+if sampling_mode == "Fixed trials":
+    trials = st.sidebar.slider("🔄 Trials per size", min_value=1, max_value=20, value=5)
+    adaptive = None
+    budget_s = None
+    if st.sidebar.checkbox("⏱️ Limit sweep time", value=False,
+                           help="Run small sizes first, predict the rest and skip or trim sizes that would overrun"):
+        budget_s = float(st.sidebar.number_input("Budget (s)", value=60, min_value=1, step=10))
+else:
+    budget_s = None
+    trials = st.sidebar.slider("🔄 Minimum trials per size", min_value=2, max_value=20, value=5)
+    adaptive = {
+        'target_rel_ci': st.sidebar.slider("Target CI (± % of median)", 1, 20, 5) / 100.0,
+        'max_trials': st.sidebar.slider("Max trials per size", 10, 500, 100, step=10),
+        'max_time_s': float(st.sidebar.number_input("Time cap (s)", value=30, min_value=1, step=5)),
+    }
+measure_memory = st.sidebar.checkbox("🧠 Measure peak memory", value=False,
+                                     help="Track allocations with tracemalloc (slows timings slightly)")
+save_history = st.sidebar.checkbox("💾 Save run to history", value=True,
+                                   help="Record every measurement in the local SQLite results store")
 
 st.sidebar.markdown("---")
 run_button = st.sidebar.button("🚀 Run Benchmark", type="primary", use_container_width=True)
@@ -99,10 +228,9 @@ if st.session_state.get('last_run'):
             st.markdown(f"**Sizes:** {last['sizes']}")
             st.markdown(f"**Trials:** {last['trials']}")
             st.markdown(f"**Duration:** {last['duration']:.3f} s")
-            st.markdown(f"**Measurements:** {len(last.get('result_df', []))}")
-            if 'result_df' in last and hasattr(last['result_df'], 'head'):
-                st.markdown("**Preview (first 5 rows)**")
-                st.dataframe(last['result_df'].head(5), use_container_width=True)
+            st.markdown(f"**Measurements:** {last['n_trials']:,}")
+            st.markdown("**Preview (first 5 rows)**")
+            st.dataframe(RunStore(last['run_path']).page(0, 5), use_container_width=True)
         except Exception:
             st.write("(Could not render last run preview)")
         if st.button("🗑️ Clear last run", key="clear_last_run"):
@@ -124,45 +252,102 @@ st.markdown("---")
 with st.expander(f"📏 Input sizes to test ({len(sizes)} points)", expanded=False):
     st.write(sizes)
 
-def _execute_benchmark(op_name, sizes_list, trials_count):
-    """Run the benchmark and capture result dataframe, stats and logs."""
+def _execute_benchmark(op_name, sizes_list, trials_count, measure_memory=False, save_history=False, adaptive=None,
+                       budget_s=None, distribution=None):
+    """Run the benchmark, store the raw trials as Parquet and return (store, stats, logs, duration)."""
     logs = []
     start_t = time.perf_counter()
     logs.append(f"Starting benchmark for '{op_name}'")
     logs.append(f"Sizes: {sizes_list}")
-    logs.append(f"Trials per size: {trials_count}")
+    logs.append(f"Trials per size: {trials_count}" + (" (minimum, adaptive)" if adaptive else ""))
+    logs.append(f"Key distribution: {distribution or 'default'}")
     try:
-        bench = Benchmark(sizes=sizes_list, trials=int(trials_count))
-        result_df = bench.run(op_name)
-        logs.append(f"Raw trials collected: {len(result_df)}")
-
-        stats_df = result_df.groupby('size')['time_ms'].agg([
-            ('Mean', 'mean'),
-            ('Median', 'median'),
-            ('Std Dev', 'std'),
-            ('Min', 'min'),
-            ('Max', 'max')
-        ]).reset_index()
+        if adaptive:
+            sampler = AdaptiveSampler(sizes_list, min_trials=int(trials_count),
+                                      measure_memory=measure_memory, distribution=distribution, **adaptive)
+            result_df = sampler.run(op_name)
+            for row in sampler.summary.itertuples():
+                logs.append(f"n={row.size}: {row.trials} trials, median {row.median_ms:.4f} ms "
+                            f"±{row.rel_ci * 100:.1f}% ({row.status}, {row.outliers} outliers)")
+        elif budget_s:
+            scheduler = BudgetScheduler(sizes_list, trials=int(trials_count), budget_s=budget_s,
+                                        measure_memory=measure_memory, distribution=distribution)
+            result_df = scheduler.run(op_name)
+            for row in scheduler.plan.itertuples():
+                predicted = f", predicted {row.predicted_ms:.4f} ms" if pd.notna(row.predicted_ms) else ""
+                logs.append(f"n={row.size}: {row.status}, {row.trials_run}/{row.trials_planned} trials{predicted}")
+        else:
+            bench = Benchmark(sizes=sizes_list, trials=int(trials_count), measure_memory=measure_memory,
+                              distribution=distribution)
+            result_df = bench.run(op_name)
+        extrapolated = result_df['extrapolated'] if 'extrapolated' in result_df.columns else pd.Series(False, index=result_df.index)
+        logs.append(f"Raw trials collected: {int((~extrapolated).sum())}")
+        if extrapolated.all():
+            raise RuntimeError("No size could be measured within the time budget")
+
+        # raw trials go to Parquet; everything shown later is aggregated or paged from the file
+        store = RunStore.write(result_df)
+        prune_runs(keep=RUNS_TO_KEEP)
+        logs.append(f"Raw trials stored at {store.path}")
+        agg = store.aggregate('time_ms', by='size', percentiles=(50, 90, 99))
+        agg = agg[agg['count'] > 0]  # extrapolated sizes have a prediction but no measured time
+        stats_df = pd.DataFrame({
+            'size': agg['size'],
+            'Mean': agg['mean'],
+            'Median': agg['p50'],
+            'Std Dev': agg['stddev'],
+            'Min': agg['min'],
+            'Max': agg['max'],
+            'P90': agg['p90'],
+            'P99': agg['p99'],
+        })
 
         end_t = time.perf_counter()
         duration = end_t - start_t
         logs.append(f"Benchmark completed in {duration:.3f} seconds")
 
-        return result_df, stats_df, logs, duration
+        if save_history:
+            try:
+                with ResultsDB() as db:
+                    run_id = db.record_run(result_df, sizes=sizes_list, trials=int(trials_count),
+                                           duration_s=duration,
+                                           params={"measure_memory": measure_memory, "adaptive": adaptive,
+                                                   "budget_s": budget_s, "distribution": distribution})
+                logs.append(f"Saved to history as run #{run_id}")
+            except Exception as e:
+                logs.append(f"Could not save run to history: {e}")
+
+        return store, stats_df, logs, duration
     except Exception as e:
         logs.append(f"Benchmark failed: {e}")
         raise
 
 
-def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, trials_count):
+def _display_results(store, stats_df, logs, duration, op_name, sizes_list, trials_count, adaptive_params=None,
+                     budget_s=None, distribution=None):
     """Display results using the existing UI layout (charts, stats, downloads, insights)."""
-    st.success(f"✅ Benchmark completed! {len(result_df)} trials executed successfully.")
-    # store last run parameters and results in session state for re-run or inspection
+    columns = store.columns
+    n_rows = store.num_rows
+    predicted_df = pd.DataFrame(columns=['size', 'predicted_ms'])
+    if 'extrapolated' in columns:
+        flags = store.to_pandas(['size', 'predicted_ms', 'extrapolated'])
+        predicted_df = flags[flags['extrapolated']][['size', 'predicted_ms']].reset_index(drop=True)
+    n_trials = n_rows - len(predicted_df)
+    st.success(f"✅ Benchmark completed! {n_trials:,} trials executed successfully.")
+    if not predicted_df.empty:
+        st.warning(f"⏱️ Sizes {predicted_df['size'].tolist()} would have overrun the {budget_s:.0f}s budget; "
+                   "they are shown as extrapolated predictions and left out of the statistics and history.")
+    # store last run parameters in session state for re-run or inspection; raw rows stay on disk
     st.session_state['last_run'] = {
         'op': op_name,
         'sizes': sizes_list,
         'trials': trials_count,
-        'result_df': result_df,
+        'measure_memory': 'memory_kb' in columns,
+        'adaptive': adaptive_params,
+        'budget_s': budget_s,
+        'distribution': distribution,
+        'run_path': store.path,
+        'n_trials': n_trials,
         'stats_df': stats_df,
         'logs': logs,
         'duration': duration,
@@ -175,18 +360,50 @@ def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, t
         st.subheader("Performance vs Input Size")
         # Line chart with mean
         chart_df = stats_df[['size', 'Mean']].copy()
-        st.line_chart(chart_df.set_index('size'), height=400)
-        st.caption("Mean execution time across trials")
+        if predicted_df.empty:
+            st.line_chart(chart_df.set_index('size'), height=400)
+            st.caption("Mean execution time across trials")
+        else:
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=chart_df['size'], y=chart_df['Mean'], mode='lines+markers', name='Mean'))
+            # join the last measured point to the predictions so the dashed line continues the curve
+            tail = pd.concat([chart_df.tail(1).rename(columns={'Mean': 'predicted_ms'}), predicted_df.dropna()])
+            fig.add_trace(go.Scatter(x=tail['size'], y=tail['predicted_ms'], mode='lines+markers',
+                                     name='Predicted (extrapolated)', line=dict(dash='dash'),
+                                     marker=dict(symbol='circle-open')))
+            fig.update_layout(xaxis_title='size', yaxis_title='Time (ms)', height=400)
+            st.plotly_chart(fig, use_container_width=True)
+            st.caption("Mean execution time across trials; dashed points are the growth model's "
+                       "predictions for sizes skipped to stay within the budget")
         # Bar chart showing min/mean/max
         st.subheader("Range Visualization")
         range_df = stats_df[['size', 'Min', 'Mean', 'Max']].set_index('size')
         st.bar_chart(range_df, height=300)
         st.caption("Min, Mean, and Max times per input size")
+        st.subheader("Trial Timeline")
+        timeline = store.downsample('time_ms', max_points=CHART_POINTS)
+        st.line_chart(timeline.set_index('sample')[['min', 'max']], height=300)
+        st.caption(f"Per-trial time in execution order, min/max envelope of {n_trials:,} trials "
+                   f"downsampled to at most {CHART_POINTS} points")
+        if 'memory_kb' in columns:
+            st.subheader("Peak Memory")
+            mem_df = store.aggregate('memory_kb', stats=('mean',)).set_index('size')['mean'].rename('Peak KB')
+            st.line_chart(mem_df, height=300)
+            st.caption("Mean peak traced allocation per trial (tracemalloc)")
+        shape_cols = [c for c in STRUCTURE_STATS if c in columns]
+        if shape_cols:
+            st.subheader("Structure Health")
+            shape_df = pd.concat(
+                [store.aggregate(c, stats=('mean',)).set_index('size')['mean'].rename(STRUCTURE_STATS[c])
+                 for c in shape_cols], axis=1)
+            st.line_chart(shape_df, height=300)
+            st.caption("Shape of the structure after each trial: tree depth, hash chain lengths or node degrees")
 
     with tab2:
         st.subheader("Statistical Summary")
         display_stats = stats_df.copy()
-        display_stats.columns = ['Size', 'Mean (ms)', 'Median (ms)', 'Std Dev (ms)', 'Min (ms)', 'Max (ms)']
+        display_stats.columns = ['Size', 'Mean (ms)', 'Median (ms)', 'Std Dev (ms)', 'Min (ms)', 'Max (ms)',
+                                 'P90 (ms)', 'P99 (ms)']
         st.dataframe(
             display_stats.style.format({
                 'Mean (ms)': '{:.4f}',
@@ -194,9 +411,21 @@ def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, t
                 'Std Dev (ms)': '{:.4f}',
                 'Min (ms)': '{:.4f}',
                 'Max (ms)': '{:.4f}',
+                'P90 (ms)': '{:.4f}',
+                'P99 (ms)': '{:.4f}',
             }).background_gradient(subset=['Mean (ms)'], cmap='RdYlGn_r'),
             use_container_width=True
         )
+        if not predicted_df.empty:
+            st.markdown("**Extrapolated sizes** (predicted, not measured; excluded from the statistics above)")
+            st.dataframe(predicted_df.rename(columns={'size': 'Size', 'predicted_ms': 'Predicted (ms)'}),
+                         use_container_width=True)
+        if 'outlier' in columns:
+            st.markdown("**Adaptive sampling**")
+            sampling_df = store.aggregate('outlier', stats=('count', 'sum')).rename(
+                columns={'size': 'Size', 'count': 'Trials', 'sum': 'Outliers'})
+            st.dataframe(sampling_df, use_container_width=True)
+            st.caption("Outliers are flagged with Tukey fences (1.5 × IQR) and kept in the raw data")
         # Overall metrics
         st.markdown("---")
         st.subheader("Overall Metrics")
@@ -205,8 +434,7 @@ def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, t
             avg_time = stats_df['Mean'].mean()
             st.metric("⏱️ Avg Time", f"{avg_time:.4f} ms")
         with col2:
-            total_trials = len(result_df)
-            st.metric("🔄 Total Trials", total_trials)
+            st.metric("🔄 Total Trials", f"{n_trials:,}")
         with col3:
             if len(stats_df) > 1:
                 growth = stats_df['Mean'].iloc[-1] / stats_df['Mean'].iloc[0]
@@ -220,18 +448,38 @@ def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, t
 
     with tab3:
         st.subheader("Raw Trial Data")
-        st.dataframe(result_df, use_container_width=True, height=400)
+        # only the visible page is read from the Parquet file and sent to the browser
+        pcol1, pcol2 = st.columns([1, 3])
+        with pcol1:
+            page_size = st.selectbox("Rows per page", [100, 500, 1000, 5000], index=1, key="raw_page_size")
+        n_pages = max(1, -(-n_rows // page_size))
+        with pcol2:
+            page_no = st.number_input(f"Page (of {n_pages:,})", min_value=1, max_value=n_pages, value=1,
+                                      key="raw_page_no")
+        st.dataframe(store.page((int(page_no) - 1) * page_size, page_size), use_container_width=True, height=400)
         st.markdown("---")
-        col1, col2 = st.columns(2)
+        file_stem = f"benchmark_{op_name.replace(':', '_').replace(' ', '_')}"
+        col1, col2, col3 = st.columns(3)
         with col1:
-            csv = result_df.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                label="📥 Download Raw Data (CSV)",
-                data=csv,
-                file_name=f"benchmark_{op_name.replace(':', '_').replace(' ', '_')}_raw.csv",
-                mime="text/csv",
-            )
+            with open(store.path, 'rb') as fh:
+                st.download_button(
+                    label="📥 Download Raw Data (Parquet)",
+                    data=fh.read(),
+                    file_name=f"{file_stem}_raw.parquet",
+                    mime="application/octet-stream",
+                )
         with col2:
+            if n_rows <= CSV_ROW_LIMIT:
+                csv = store.to_pandas().to_csv(index=False).encode('utf-8')
+                st.download_button(
+                    label="📥 Download Raw Data (CSV)",
+                    data=csv,
+                    file_name=f"{file_stem}_raw.csv",
+                    mime="text/csv",
+                )
+            else:
+                st.caption(f"CSV export is limited to {CSV_ROW_LIMIT:,} rows; use the Parquet file")
+        with col3:
             stats_csv = display_stats.to_csv(index=False).encode('utf-8')
             st.download_button(
                 label="📥 Download Statistics (CSV)",
@@ -245,7 +493,8 @@ def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, t
         st.markdown(f"""
         **Operation:** `{op_name}`  
         **Data Structure:** `{operation_map[op_name]}`  
-        **Expected Complexity:** `{BIG_O_REFERENCE.get(op_name, 'N/A')}`
+        **Expected Complexity:** `{BIG_O_REFERENCE.get(op_name, 'N/A')}`  
+        **Key Distribution:** `{distribution or 'default'}`
         """)
         st.markdown("---")
         st.markdown("#### Performance Summary")
@@ -255,7 +504,7 @@ def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, t
             st.write(f"- Sizes tested: {len(sizes_list)} points")
             st.write(f"- Range: {min(sizes_list):,} to {max(sizes_list):,}")
             st.write(f"- Trials per size: {trials_count}")
-            st.write(f"- Total measurements: {len(result_df)}")
+            st.write(f"- Total measurements: {n_trials:,}")
         with col2:
             st.write("**Results:")
             st.write(f"- Mean time: {stats_df['Mean'].mean():.4f} ms")
@@ -265,11 +514,29 @@ def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, t
             st.write(f"- Variability (CV): {cv:.1f}%")
         st.markdown("---")
         st.markdown("#### Interpretation")
-        # preserve the existing insights logic
-        if "Array: insert_end" in op_name:
+        # preserve the existing insights logic (SortedArray/NumpyArray first: "Array: ..." is a substring of their names)
+        if "SortedArray: search" in op_name:
+            st.success("🔎 **Binary search**: bisect halves the range each step, so lookups stay O(log n) even for millions of keys.")
+        elif "SortedArray" in op_name:
+            st.info("🔎 **Cheap to find, costly to shift**: bisect locates the slot in O(log n), but the list still shifts O(n) elements on insert/delete.")
+        elif "NumpyArray: search_many" in op_name or "NumpyArray: remove_many" in op_name:
+            st.success("🚀 **Vectorized bulk ops**: np.isin sorts once and answers every key in C, avoiding a Python call per lookup.")
+        elif "NumpyArray" in op_name:
+            st.info("🚀 **Typed buffer**: Values live unboxed in an int64 buffer; single-element Python calls pay NumPy overhead, bulk calls win.")
+        elif "Deque: insert_front" in op_name:
+            st.success("↔️ **O(1) at both ends**: deque is a linked list of fixed-size blocks, so appendleft never shifts existing elements.")
+        elif "Deque: insert_middle" in op_name:
+            st.warning("↔️ **Middle is still O(n)**: deque.insert rotates elements to reach the position, often slower than list.insert.")
+        elif "GapBuffer: insert" in op_name:
+            st.success("✂️ **Edits at the cursor**: Inserting fills the gap in O(1); moving the cursor costs only the distance moved, so local edits stay cheap.")
+        elif "Deque: search" in op_name or "GapBuffer: search" in op_name:
+            st.info("🔍 **Linear search**: Same O(n) scan as a list; these variants only change the cost of edits.")
+        elif "Array: insert_middle" in op_name:
+            st.warning("⚠️ **Shifts half the list**: Every middle insert moves n/2 elements. Compare with GapBuffer: insert_middle.")
+        elif "Array: insert_end" in op_name:
             st.success("✅ **Excellent performance**: Python lists use dynamic arrays with amortized O(1) append. Periodic resizing causes occasional spikes.")
         elif "Array: insert_front" in op_name:
-            st.warning("⚠️ **Slow operation**: Inserting at the front requires shifting all n elements. Consider using collections.deque for front insertions.")
+            st.warning("⚠️ **Slow operation**: Inserting at the front requires shifting all n elements. Compare Deque: insert_front and GapBuffer: insert_front for measured alternatives.")
         elif "Array: search" in op_name:
             st.info("🔍 **Linear search**: Must check each element sequentially. For large datasets, consider sorted arrays + binary search or hash tables.")
         elif "Array: delete" in op_name:
@@ -280,14 +547,30 @@ def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, t
             st.info("📎 **Sequential access**: Poor cache locality makes linked lists slower than arrays for search despite same O(n) complexity.")
         elif "LinkedList: delete" in op_name:
             st.info("📎 **Fast once found**: Deletion is O(1) if you have the node reference, but finding it is O(n).")
+        elif "UnrolledList: insert_tail" in op_name:
+            st.success("🧩 **Tail pointer + chunks**: Appends fill the tail node's array in place; a new node is only allocated every B values.")
+        elif "UnrolledList: search" in op_name:
+            st.success("🧩 **Cache-friendlier scan**: Each node is scanned as a contiguous array, so search makes n/B pointer hops instead of n.")
+        elif "UnrolledList: delete" in op_name:
+            st.info("🧩 **Shift within a chunk**: Deleting shifts at most B values, then under-full nodes borrow from or merge with their neighbour.")
         elif "BST: insert_ordered" in op_name:
             st.error("🚨 **Degenerate tree**: Ordered insertions create a linked list (O(n) height). Use AVL/Red-Black trees for guaranteed O(log n).")
         elif "BST: insert" in op_name:
             st.success("🌲 **Balanced performance**: Random insertions keep tree relatively balanced, achieving O(log n) average case.")
+        elif "BST: search_many" in op_name:
+            st.info("🌲 **One object per level**: Each lookup chases ~2 ln n node pointers. Compare BTree: search_many on the same keys.")
         elif "BST: search" in op_name:
             st.success("🌲 **Logarithmic search**: Efficient for sorted data. Unbalanced trees degrade to O(n).")
         elif "BST: delete" in op_name:
             st.info("🌲 **Complex operation**: Deletion requires finding node, handling 3 cases (leaf, 1 child, 2 children).")
+        elif "BTree: range_scan" in op_name:
+            st.success("🌳 **Linked leaves**: A range scan descends once, then slices sorted leaf arrays and follows sibling links.")
+        elif "BTree" in op_name:
+            st.success("🌳 **Fewer, wider levels**: Each node is a sorted list searched with bisect in C, so a lookup visits log_B n nodes instead of ~2 ln n.")
+        elif "Snapshot: open" in op_name:
+            st.success("💾 **Attach, don't rebuild**: The fixture is saved once as flat int64 arrays; opening it maps the files, so cost is independent of n.")
+        elif "Frozen" in op_name:
+            st.info("💾 **Lookups on mapped arrays**: Reads go straight to page-cache memory shared across processes; compare with the object-based structure's search_many.")
         elif "HashTable: put" in op_name:
             st.success("⚡ **Near-constant time**: Hash tables provide O(1) average insertions. Performance depends on load factor and hash function quality.")
         elif "HashTable: get" in op_name:
@@ -298,8 +581,48 @@ def _display_results(result_df, stats_df, logs, duration, op_name, sizes_list, t
             st.info("🕸️ **Efficient edge insertion**: Adjacency list provides O(1) edge additions. Adjacency matrix would be O(1) but uses O(V²) space.")
         elif "Graph: bfs_search" in op_name:
             st.info("🕸️ **BFS traversal**: O(V + E) time visits all reachable vertices and edges. Good for shortest path in unweighted graphs.")
+        elif "Graph: connected(union-find)" in op_name:
+            st.success("🔗 **Near-constant queries**: The union-find index is updated on every add_edge, so connected() is two finds with path compression.")
+        elif "Graph: connected(bfs)" in op_name:
+            st.warning("🔗 **Traversal per query**: Each reachability check walks the whole component from u. Compare Graph: connected(union-find).")
+        elif "Graph: dijkstra(indexed heap)" in op_name:
+            st.info("🧭 **Decrease-key**: Each node sits in the heap once and moves up when a shorter path appears, but every sift runs in Python.")
+        elif "Graph: dijkstra(lazy heap)" in op_name:
+            st.success("🧭 **Lazy deletion**: Duplicates are pushed onto a C-implemented heapq and stale pops skipped; more heap entries, less Python work each.")
+        elif "Graph: astar" in op_name:
+            st.success("🧭 **Goal-directed**: The Manhattan heuristic steers the search toward the target, settling fewer nodes than Dijkstra for the same path.")
         elif "Graph: delete_node" in op_name:
             st.warning("⚠️ **Moderate cost**: Must remove node and update all adjacent nodes. Time proportional to node degree.")
+        elif "Cache: LRU" in op_name:
+            st.success("🗃️ **Recency wins on skew**: LRU keeps the hot Zipf keys resident, but a scan larger than the cache flushes them all.")
+        elif "Cache: LFU" in op_name:
+            st.info("🗃️ **Frequency resists scans**: LFU keeps long-lived hot keys through scans, at the cost of extra bookkeeping per hit.")
+        elif "Cache: CLOCK" in op_name:
+            st.info("🗃️ **Cheap approximation**: CLOCK sets a reference bit on hits instead of relinking nodes, trading a little hit ratio for less work per hit.")
+        if 'lookups_per_s' in columns:
+            st.metric("🔎 Lookups / second (median)", f"{store.overall('lookups_per_s')['median']:,.0f}")
+        if 'settled_per_query' in columns:
+            st.metric("🧭 Nodes settled / query (mean)", f"{store.overall('settled_per_query')['mean']:,.0f}")
+        if 'queries_per_s' in columns:
+            st.metric("🔗 Queries / second (median)", f"{store.overall('queries_per_s')['median']:,.0f}")
+        if 'hit_ratio' in columns:
+            st.metric("🎯 Mean hit ratio", f"{store.overall('hit_ratio')['mean']:.1%}")
+        if 'max_chain' in columns:
+            load = store.overall('load_factor')['max']
+            longest = store.overall('max_chain')['max']
+            st.metric("⛓️ Longest chain / load factor", f"{longest:,.0f} / {load:.2f}")
+            if longest > 8 * max(1.0, load):
+                st.warning("⛓️ **Clustered buckets**: The longest chain is far above the load factor, so keys hash unevenly. Slow gets come from the hash function, not the table size.")
+            elif load > 2:
+                st.warning("⛓️ **Overfull table**: Every bucket holds several entries. Slow gets come from the fixed capacity; resizing would restore O(1).")
+        if 'height' in columns and 'avg_depth' in columns:
+            largest = int(stats_df['size'].max())
+            height = store.aggregate('height', stats=('max',)).set_index('size')['max'][largest]
+            st.metric("🌳 Height at largest size", f"{height:,.0f}",
+                      delta=f"{height / max(1.0, np.log2(largest + 1)):.1f}× log₂(n)", delta_color="off")
+        if 'max_degree' in columns:
+            st.metric("🕸️ Max degree / mean degree",
+                      f"{store.overall('max_degree')['max']:,.0f} / {store.overall('mean_degree')['mean']:.2f}")
 
     # show logs panel below tabs
     with st.expander("📝 Benchmark Logs", expanded=False):
@@ -318,8 +641,14 @@ if re_run_button and st.session_state.get('last_run'):
     trials_to_use = last['trials']
     with st.spinner(f"⏳ Re-running benchmark for **{op_to_use}** across {len(sizes_to_use)} sizes × {trials_to_use} trials..."):
         try:
-            result_df, stats_df, logs, duration = _execute_benchmark(op_to_use, sizes_to_use, trials_to_use)
-            _display_results(result_df, stats_df, logs, duration, op_to_use, sizes_to_use, trials_to_use)
+            store, stats_df, logs, duration = _execute_benchmark(
+                op_to_use, sizes_to_use, trials_to_use,
+                measure_memory=last.get('measure_memory', False), save_history=save_history,
+                adaptive=last.get('adaptive'), budget_s=last.get('budget_s'),
+                distribution=last.get('distribution'))
+            _display_results(store, stats_df, logs, duration, op_to_use, sizes_to_use, trials_to_use,
+                             adaptive_params=last.get('adaptive'), budget_s=last.get('budget_s'),
+                             distribution=last.get('distribution'))
         except Exception as e:
             st.error(f"❌ Re-run failed: {e}")
             with st.expander("🐛 Error Details"):
@@ -329,8 +658,11 @@ if re_run_button and st.session_state.get('last_run'):
 if run_button:
     with st.spinner(f"⏳ Running benchmark for **{op}** across {len(sizes)} sizes × {trials} trials..."):
         try:
-            result_df, stats_df, logs, duration = _execute_benchmark(op, sizes, trials)
-            _display_results(result_df, stats_df, logs, duration, op, sizes, trials)
+            store, stats_df, logs, duration = _execute_benchmark(
+                op, sizes, trials, measure_memory=measure_memory, save_history=save_history,
+                adaptive=adaptive, budget_s=budget_s, distribution=distribution)
+            _display_results(store, stats_df, logs, duration, op, sizes, trials,
+                             adaptive_params=adaptive, budget_s=budget_s, distribution=distribution)
         except Exception as e:
             st.error(f"❌ Benchmark failed: {str(e)}")
             with st.expander("🐛 Error Details"):
@@ -340,7 +672,18 @@ if run_button:
             with st.expander("🐛 Error Details"):
                 st.exception(e)
 
+elif st.session_state.get('last_run') and os.path.exists(st.session_state['last_run']['run_path']):
+    # widget interactions (e.g. paging the raw table) rerun the script; redraw from the stored run
+    last = st.session_state['last_run']
+    _display_results(RunStore(last['run_path']), last['stats_df'], last['logs'], last['duration'], last['op'],
+                     last['sizes'], last['trials'], adaptive_params=last.get('adaptive'),
+                     budget_s=last.get('budget_s'), distribution=last.get('distribution'))
+
 else:
+    if st.session_state.get('last_run'):
+        # the run file was pruned (e.g. by many runs in other sessions); only the summary survives
+        st.warning("⚠️ The raw trials of the last run are no longer on disk. Run the benchmark again to view them.")
+        st.session_state['last_run'] = None
     st.info("👈 Configure parameters in the sidebar and click **🚀 Run Benchmark** to start analysis.")
     
     st.markdown("---")
@@ -349,10 +692,10 @@ else:
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
+        st.markdown(f"""
         #### Features
-        - 🔬 **5 Data Structures**: Arrays, Linked Lists, BST, Hash Tables, Graphs
-        - 📊 **17 Operations**: Insertion, deletion, search across all structures
+        - 🔬 **Data Structures**: Arrays (list, sorted, NumPy, deque, gap buffer), Linked Lists (plain, unrolled), BST, Hash Tables, Graphs, Caches
+        - 📊 **{len(operation_map)} Operations**: Insertion, deletion, search across all structures
         - 📈 **Statistical Analysis**: Mean, median, std dev, min/max
         - 💾 **Export Results**: Download CSV for external analysis
         - 💡 **Learning Tools**: Big-O reference and trade-off explanations
@@ -0,0 +1,3 @@
+from src.utils.history import show_history_page
+
+show_history_page()
@@ -0,0 +1,3 @@
+from src.utils.distribution_matrix import show_distribution_page
+
+show_distribution_page()
@@ -0,0 +1,3 @@
+from src.utils.throughput import show_throughput_page
+
+show_throughput_page()
@@ -0,0 +1,3 @@
+from src.utils.eviction import show_eviction_page
+
+show_eviction_page()
@@ -0,0 +1,3 @@
+from src.utils.chunk_sweep import show_chunk_sweep_page
+
+show_chunk_sweep_page()
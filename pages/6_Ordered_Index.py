@@ -0,0 +1,3 @@
+from src.utils.index_compare import show_index_compare_page
+
+show_index_compare_page()
@@ -0,0 +1,3 @@
+from src.utils.interpreter_compare import show_interpreter_page
+
+show_interpreter_page()
@@ -0,0 +1,78 @@
+from time import perf_counter
+import random
+import pandas as pd
+
+from src.benchmarks.benchmark import Benchmark
+from src.utils.stats import median_ci, relative_ci_width, tukey_outliers
+
+
+class AdaptiveSampler:
+    """
+    Samples each (operation, size) cell until the median's relative confidence
+    interval is below `target_rel_ci`, or a trial / wall-clock cap is hit.
+    Sizes are visited in a freshly shuffled order every round so slow drift
+    (thermal, background load) is spread across sizes instead of biasing one.
+    """
+    def __init__(self, sizes, target_rel_ci=0.05, min_trials=5, max_trials=100,
+                 max_time_s=30.0, confidence=0.95, seed=None, measure_memory=False, distribution=None):
+        if min_trials < 2:
+            raise ValueError("min_trials must be at least 2")
+        self.sizes = sizes
+        self.target_rel_ci = target_rel_ci
+        self.min_trials = min_trials
+        self.max_trials = max(max_trials, min_trials)
+        self.max_time_s = max_time_s
+        self.confidence = confidence
+        self.rng = random.Random(seed)
+        self.bench = Benchmark(sizes, trials=1, measure_memory=measure_memory,
+                               distribution=distribution)
+        self.summary = None
+
+    def run(self, target: str):
+        if target not in self.bench.operations():
+            raise KeyError(target)
+        samples = {n: [] for n in self.sizes}
+        status = {}
+        records = []
+        start = perf_counter()
+        round_no = 0
+        while len(status) < len(samples):
+            round_no += 1
+            order = [n for n in samples if n not in status]
+            self.rng.shuffle(order)
+            for n in order:
+                record = self.bench.measure(target, n, len(samples[n]) + 1)
+                record["round"] = round_no
+                records.append(record)
+                samples[n].append(record["time_ms"])
+            timed_out = perf_counter() - start >= self.max_time_s
+            for n in order:
+                count = len(samples[n])
+                if count >= self.min_trials and relative_ci_width(samples[n], self.confidence) <= self.target_rel_ci:
+                    status[n] = "converged"
+                elif count >= self.max_trials:
+                    status[n] = "trial_cap"
+                elif timed_out:
+                    status[n] = "time_cap"
+
+        df = pd.DataFrame.from_records(records)
+        df["outlier"] = False
+        for n, group in df.groupby("size"):
+            df.loc[group.index, "outlier"] = tukey_outliers(group["time_ms"].tolist())
+        df = df.sort_values(["size", "trial"]).reset_index(drop=True)
+
+        rows = []
+        for n in self.sizes:
+            lo, hi = median_ci(samples[n], self.confidence)
+            rows.append({
+                "size": n,
+                "trials": len(samples[n]),
+                "median_ms": float(pd.Series(samples[n]).median()),
+                "ci_low_ms": lo,
+                "ci_high_ms": hi,
+                "rel_ci": relative_ci_width(samples[n], self.confidence),
+                "outliers": int(df.loc[df["size"] == n, "outlier"].sum()),
+                "status": status[n],
+            })
+        self.summary = pd.DataFrame(rows)
+        return df
@@ -1,161 +1,544 @@
 from time import perf_counter
-import random
+import tracemalloc
 import pandas as pd
 
-from src.ds.array_ds import ArrayDS
+from src.ds.array_ds import ArrayDS, SortedArrayDS, DequeArrayDS
+from src.ds.gap_buffer import GapBufferArrayDS
+from src.ds.numpy_array import NumpyArrayDS
 from src.ds.linked_list import LinkedList
+from src.ds.unrolled_linked_list import UnrolledLinkedList
 from src.ds.bst import BinarySearchTree
+from src.ds.btree import BPlusTree
 from src.ds.hash_table import HashTable
 from src.ds.graph import Graph
+from src.ds.cache import LRUCache, LFUCache, ClockCache
+from src.utils import snapshot, workloads
 
-RANDOM_SEED = 1337
-random.seed(RANDOM_SEED)
+RANDOM_SEED = workloads.DEFAULT_SEED
+# input orders most operations default to; worth publishing to worker processes up front
+DEFAULT_WORKLOADS = ("sorted", "shuffled")
 
 class Benchmark:
-    def __init__(self, sizes, trials=3):
+    def __init__(self, sizes, trials=3, measure_memory=False, seed=RANDOM_SEED, distribution=None,
+                 chunk_size=64, btree_order=64, fixture_dir=None, track_stats=False):
         self.sizes = sizes
         self.trials = trials
+        self.measure_memory = measure_memory
+        self.seed = seed
+        self.distribution = distribution  # None keeps each operation's default input order
+        self.chunk_size = chunk_size  # values per node for the unrolled linked list
+        self.btree_order = btree_order  # max keys per B+-tree node
+        self.fixture_dir = fixture_dir  # snapshot cache; None uses results/fixtures
+        # Structures keep their shape stats incrementally, but inside insert/put/delete/add_edge that
+        # bookkeeping costs 5-12%, which would shift every timing in the history. So ops whose timed
+        # block mutates the structure build it untracked (unless track_stats) and _with_stats recounts
+        # once after timing; ops that only read build it tracked, untimed, and read the counters.
+        self.track_stats = track_stats
+        self._last_memory_kb = None
 
     def _timeit(self, fn):
-        start = perf_counter()
-        fn()
-        return (perf_counter() - start) * 1000.0  # ms
+        if not self.measure_memory:
+            start = perf_counter()
+            fn()
+            return (perf_counter() - start) * 1000.0  # ms
+        # tracemalloc slows allocation-heavy code, so memory runs are opt-in
+        tracemalloc.start()
+        try:
+            start = perf_counter()
+            fn()
+            elapsed = (perf_counter() - start) * 1000.0
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self._last_memory_kb = peak / 1024.0
+        return elapsed
+
+    def _keys(self, n, default):
+        """Input keys for one trial: the operation's historic default unless a distribution is set."""
+        return workloads.generate_list(self.distribution or default, n, self.seed)
+
+    def workload_keys(self, sizes=None):
+        """
+        Workload cache keys the operations will ask for at `sizes`, for
+        workloads.SharedWorkloads; rarer inputs are generated where needed.
+        """
+        distributions = (self.distribution,) if self.distribution else DEFAULT_WORKLOADS
+        return [(d, int(n), self.seed, None) for d in distributions for n in (sizes or self.sizes)]
+
+    @staticmethod
+    def _with_stats(result, structure):
+        """Attach the structure's shape stats (read, or recounted, after the timed block) to an op's result."""
+        ms, extra = result if isinstance(result, tuple) else (result, None)
+        return ms, {**(extra or {}), **structure.stats()}
+
+    @staticmethod
+    def _every_hundredth(keys):
+        return keys[::max(1, len(keys) // 100)]  # ~1% of elements, spread across the input
 
     def array_insert_end(self, n):
         arr = ArrayDS()
-        return self._timeit(lambda: [arr.append(i) for i in range(n)])
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [arr.append(k) for k in keys])
 
     def array_insert_front(self, n):
         arr = ArrayDS()
-        return self._timeit(lambda: [arr.insert_front(i) for i in range(n)])
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [arr.insert_front(k) for k in keys])
 
     def array_search(self, n):
-        data = list(range(n))
-        arr = ArrayDS(data)
-        target = n - 1
+        keys = self._keys(n, "sorted")
+        arr = ArrayDS(keys)
+        target = keys[-1]
         return self._timeit(lambda: arr.search_linear(target))
 
     def array_delete(self, n):
-        arr = ArrayDS(range(n))
-        targets = list(range(0, n, max(1, n // 100)))  # Delete ~1% of elements
-        return self._timeit(lambda: [arr.remove_value(t) for t in targets if t < len(arr.data)])
+        keys = self._keys(n, "sorted")
+        arr = ArrayDS(keys)
+        targets = self._every_hundredth(keys)  # Delete ~1% of elements
+        return self._timeit(lambda: [arr.remove_value(t) for t in targets])
+
+    def array_insert_middle(self, n):
+        arr = ArrayDS()
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [arr.insert_at(len(arr) // 2, k) for k in keys])
+
+    def deque_insert_front(self, n):
+        arr = DequeArrayDS()
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [arr.insert_front(k) for k in keys])
+
+    def deque_insert_middle(self, n):
+        arr = DequeArrayDS()
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [arr.insert_at(len(arr) // 2, k) for k in keys])
+
+    def deque_search(self, n):
+        keys = self._keys(n, "sorted")
+        arr = DequeArrayDS(keys)
+        target = keys[-1]
+        return self._timeit(lambda: arr.search_linear(target))
+
+    def gap_buffer_insert_front(self, n):
+        arr = GapBufferArrayDS()
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [arr.insert_front(k) for k in keys])
+
+    def gap_buffer_insert_middle(self, n):
+        arr = GapBufferArrayDS()
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [arr.insert_at(len(arr) // 2, k) for k in keys])
+
+    def gap_buffer_search(self, n):
+        keys = self._keys(n, "sorted")
+        arr = GapBufferArrayDS(keys)
+        target = keys[-1]
+        return self._timeit(lambda: arr.search_linear(target))
+
+    def sorted_array_insert(self, n):
+        arr = SortedArrayDS()
+        keys = self._keys(n, "shuffled")
+        return self._timeit(lambda: [arr.insert(k) for k in keys])
+
+    def sorted_array_search(self, n):
+        keys = self._keys(n, "shuffled")
+        arr = SortedArrayDS(keys)
+        target = keys[-1]
+        return self._timeit(lambda: arr.search_binary(target))
+
+    def sorted_array_search_many(self, n):
+        keys = self._keys(n, "shuffled")
+        arr = SortedArrayDS(keys)
+        ms = self._timeit(lambda: arr.search_many(keys))
+        return ms, {"lookups_per_s": n / (ms / 1000.0) if ms > 0 else float("nan")}
+
+    def sorted_array_delete(self, n):
+        keys = self._keys(n, "shuffled")
+        arr = SortedArrayDS(keys)
+        targets = self._every_hundredth(keys)
+        return self._timeit(lambda: [arr.remove_value(t) for t in targets])
+
+    def numpy_array_insert_end(self, n):
+        arr = NumpyArrayDS()
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [arr.append(k) for k in keys])
+
+    def numpy_array_search(self, n):
+        keys = self._keys(n, "sorted")
+        arr = NumpyArrayDS(keys)
+        target = keys[-1]
+        return self._timeit(lambda: arr.search_linear(target))
+
+    def numpy_array_search_many(self, n):
+        keys = self._keys(n, "sorted")
+        arr = NumpyArrayDS(keys)
+        probe = workloads.generate(self.distribution or "shuffled", n, self.seed)
+        ms = self._timeit(lambda: arr.search_many(probe))
+        return ms, {"lookups_per_s": n / (ms / 1000.0) if ms > 0 else float("nan")}
+
+    def numpy_array_remove_many(self, n):
+        keys = self._keys(n, "sorted")
+        arr = NumpyArrayDS(keys)
+        targets = self._every_hundredth(keys)
+        return self._timeit(lambda: arr.remove_many(targets))
 
     def ll_insert_tail(self, n):
         ll = LinkedList()
-        return self._timeit(lambda: [ll.append(i) for i in range(n)])
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [ll.append(k) for k in keys])
 
     def ll_search(self, n):
-        ll = LinkedList(range(n))
-        target = n - 1
+        keys = self._keys(n, "sorted")
+        ll = LinkedList(keys)
+        target = keys[-1]
         return self._timeit(lambda: ll.find(target))
 
     def ll_delete(self, n):
-        ll = LinkedList(range(n))
-        targets = list(range(0, n, max(1, n // 100)))
+        keys = self._keys(n, "sorted")
+        ll = LinkedList(keys)
+        targets = self._every_hundredth(keys)
         return self._timeit(lambda: [ll.delete(t) for t in targets])
 
+    def ull_insert_tail(self, n):
+        ull = UnrolledLinkedList(chunk_size=self.chunk_size)
+        keys = self._keys(n, "sorted")
+        return self._timeit(lambda: [ull.append(k) for k in keys])
+
+    def ull_search(self, n):
+        keys = self._keys(n, "sorted")
+        ull = UnrolledLinkedList(keys, chunk_size=self.chunk_size)
+        target = keys[-1]
+        return self._timeit(lambda: ull.find(target))
+
+    def ull_delete(self, n):
+        keys = self._keys(n, "sorted")
+        ull = UnrolledLinkedList(keys, chunk_size=self.chunk_size)
+        targets = self._every_hundredth(keys)
+        return self._timeit(lambda: [ull.delete(t) for t in targets])
+
     def bst_insert(self, n):
-        bst = BinarySearchTree()
-        data = list(range(n))
-        random.shuffle(data)
-        return self._timeit(lambda: [bst.insert(x) for x in data])
+        bst = BinarySearchTree(track_stats=self.track_stats)
+        data = self._keys(n, "shuffled")
+        return self._with_stats(self._timeit(lambda: [bst.insert(x) for x in data]), bst)
 
     def bst_insert_ordered(self, n):
         """Worst case: ordered insertion creates degenerate tree"""
-        bst = BinarySearchTree()
-        data = list(range(n))
-        return self._timeit(lambda: [bst.insert(x) for x in data])
+        bst = BinarySearchTree(track_stats=self.track_stats)
+        data = workloads.generate_list("sorted", n, self.seed)
+        return self._with_stats(self._timeit(lambda: [bst.insert(x) for x in data]), bst)
 
     def bst_search(self, n):
         bst = BinarySearchTree()
-        data = list(range(n))
-        random.shuffle(data)
+        data = self._keys(n, "shuffled")
         for x in data:
             bst.insert(x)
         target = data[-1]
-        return self._timeit(lambda: bst.search(target))
+        return self._with_stats(self._timeit(lambda: bst.search(target)), bst)
 
     def bst_delete(self, n):
-        bst = BinarySearchTree()
-        data = list(range(n))
-        random.shuffle(data)
+        bst = BinarySearchTree(track_stats=self.track_stats)
+        data = self._keys(n, "shuffled")
         for x in data:
             bst.insert(x)
         targets = data[:max(1, n // 100)]  # Delete ~1% of nodes
-        return self._timeit(lambda: [bst.delete(t) for t in targets])
+        return self._with_stats(self._timeit(lambda: [bst.delete(t) for t in targets]), bst)
+
+    def bst_search_many(self, n):
+        bst = BinarySearchTree()
+        data = self._keys(n, "shuffled")
+        for x in data:
+            bst.insert(x)
+        probes = self._every_hundredth(data)
+        ms = self._timeit(lambda: [bst.search(p) for p in probes])
+        return self._with_stats((ms, {"lookups_per_s": len(probes) / (ms / 1000.0) if ms > 0 else float("nan")}), bst)
+
+    def _btree(self, data):
+        tree = BPlusTree(order=self.btree_order)
+        for x in data:
+            tree.insert(x)
+        return tree
+
+    def btree_insert(self, n):
+        tree = BPlusTree(order=self.btree_order)
+        data = self._keys(n, "shuffled")
+        ms = self._timeit(lambda: [tree.insert(x) for x in data])
+        return ms, {"height": tree.height}
+
+    def btree_search_many(self, n):
+        data = self._keys(n, "shuffled")
+        tree = self._btree(data)
+        probes = self._every_hundredth(data)
+        ms = self._timeit(lambda: [tree.search(p) for p in probes])
+        return ms, {"lookups_per_s": len(probes) / (ms / 1000.0) if ms > 0 else float("nan"),
+                    "height": tree.height}
+
+    def btree_delete(self, n):
+        data = self._keys(n, "shuffled")
+        tree = self._btree(data)
+        targets = data[:max(1, n // 100)]  # Delete ~1% of keys, same targets as BST: delete
+        return self._timeit(lambda: [tree.delete(t) for t in targets])
+
+    def btree_range_scan(self, n):
+        data = self._keys(n, "shuffled")
+        tree = self._btree(data)
+        lo, hi = min(data), max(data)
+        width = max(1, (hi - lo) // 100)  # ~1% of the key range per scan
+        starts = data[:10]
+        return self._timeit(lambda: [tree.range_scan(s, s + width) for s in starts])
 
     def ht_put(self, n):
-        ht = HashTable(capacity=max(1024, n * 2))
-        keys = list(range(n))
-        return self._timeit(lambda: [ht.put(k, k) for k in keys])
+        ht = HashTable(capacity=max(1024, n * 2), track_stats=self.track_stats)
+        keys = self._keys(n, "sorted")
+        return self._with_stats(self._timeit(lambda: [ht.put(k, k) for k in keys]), ht)
 
     def ht_get(self, n):
         ht = HashTable(capacity=max(1024, n * 2))
-        keys = list(range(n))
+        keys = self._keys(n, "sorted")
         for k in keys:
             ht.put(k, k)
         target = keys[-1]
-        return self._timeit(lambda: ht.get(target))
+        return self._with_stats(self._timeit(lambda: ht.get(target)), ht)
 
     def ht_delete(self, n):
-        ht = HashTable(capacity=max(1024, n * 2))
-        keys = list(range(n))
+        ht = HashTable(capacity=max(1024, n * 2), track_stats=self.track_stats)
+        keys = self._keys(n, "sorted")
         for k in keys:
             ht.put(k, k)
         targets = keys[:max(1, n // 100)]
-        return self._timeit(lambda: [ht.delete(t) for t in targets])
+        return self._with_stats(self._timeit(lambda: [ht.delete(t) for t in targets]), ht)
 
     def graph_add_edges_linear(self, n):
-        g = Graph()
-        return self._timeit(lambda: [g.add_edge(i, i+1) for i in range(n-1)])
+        g = Graph(track_stats=self.track_stats)
+        keys = self._keys(n, "sorted")
+        return self._with_stats(self._timeit(lambda: [g.add_edge(keys[i], keys[i+1]) for i in range(n-1)]), g)
 
     def graph_bfs_search_end(self, n):
         g = Graph()
+        keys = self._keys(n, "sorted")
         for i in range(n-1):
-            g.add_edge(i, i+1)
-        return self._timeit(lambda: g.bfs_search(n-1))
+            g.add_edge(keys[i], keys[i+1])
+        target = keys[-1]
+        return self._with_stats(self._timeit(lambda: g.bfs_search(target)), g)
 
     def graph_delete_node(self, n):
-        g = Graph()
+        g = Graph(track_stats=self.track_stats)
+        keys = self._keys(n, "sorted")
         for i in range(n-1):
-            g.add_edge(i, i+1)
-        targets = list(range(0, n, max(1, n // 100)))
-        return self._timeit(lambda: [g.delete_node(t) for t in targets if t in g.adj])
+            g.add_edge(keys[i], keys[i+1])
+        targets = self._every_hundredth(keys)
+        return self._with_stats(self._timeit(lambda: [g.delete_node(t) for t in targets if t in g.adj]), g)
 
-    def run(self, target: str):
-        ops = {
+    def _random_graph(self, n):
+        """n nodes and n random edges (mean degree 2: one giant component plus small ones)."""
+        g = Graph()
+        keys = self._keys(n, "shuffled")
+        for k in keys:
+            g.add_node(k)
+        rng = workloads.make_rng(self.seed)
+        for a, b in rng.integers(0, n, size=(n, 2)).tolist():
+            if a != b:
+                g.add_edge(keys[a], keys[b])
+        pairs = [(keys[a], keys[b]) for a, b in rng.integers(0, n, size=(100, 2)).tolist()]
+        return g, pairs
+
+    def graph_connected_dsu(self, n):
+        g, pairs = self._random_graph(n)
+        ms = self._timeit(lambda: [g.connected(u, v) for u, v in pairs])
+        return self._with_stats((ms, {"queries_per_s": len(pairs) / (ms / 1000.0) if ms > 0 else float("nan"),
+                                      "components": g.component_count()}), g)
+
+    def graph_connected_bfs(self, n):
+        g, pairs = self._random_graph(n)
+        ms = self._timeit(lambda: [g.bfs_search(v, start=u) for u, v in pairs])
+        return self._with_stats((ms, {"queries_per_s": len(pairs) / (ms / 1000.0) if ms > 0 else float("nan")}), g)
+
+    def _weighted_grid(self, n):
+        """~n-node 4-connected grid with seeded integer weights 1..10, plus 5 random query pairs."""
+        side = max(2, int(n ** 0.5))
+        g = Graph()
+        rng = workloads.make_rng(self.seed)
+        right = rng.integers(1, 11, size=side * side).tolist()
+        down = rng.integers(1, 11, size=side * side).tolist()
+        for r in range(side):
+            for c in range(side):
+                u = r * side + c
+                if c + 1 < side:
+                    g.add_edge(u, u + 1, right[u])
+                if r + 1 < side:
+                    g.add_edge(u, u + side, down[u])
+        pairs = rng.integers(0, side * side, size=(5, 2)).tolist()
+        return g, side, pairs
+
+    def _time_queries(self, pairs, search):
+        """Time search(s, t) over every pair; search returns the nodes it settled."""
+        settled = []
+        ms = self._timeit(lambda: [settled.append(search(s, t)) for s, t in pairs])
+        return ms, {"settled_per_query": sum(settled) / len(settled),
+                    "ms_per_query": ms / len(pairs)}
+
+    def graph_dijkstra_indexed(self, n):
+        g, _, pairs = self._weighted_grid(n)
+        return self._time_queries(pairs, lambda s, t: g.dijkstra(s, t)[1])
+
+    def graph_dijkstra_lazy(self, n):
+        g, _, pairs = self._weighted_grid(n)
+        return self._time_queries(pairs, lambda s, t: g.dijkstra(s, t, lazy=True)[1])
+
+    def graph_astar(self, n):
+        g, side, pairs = self._weighted_grid(n)
+        def manhattan(u, v):  # every weight is >= 1, so grid distance never overestimates
+            return abs(u // side - v // side) + abs(u % side - v % side)
+        return self._time_queries(pairs, lambda s, t: g.astar(s, t, manhattan)[1])
+
+    def _fixture_path(self, kind, n, default):
+        """Snapshot path for this trial's keys, built on first use (outside any timing)."""
+        dist = self.distribution or default
+        snapshot.fixture(kind, n, dist, self.seed, root=self.fixture_dir)
+        return snapshot.fixture_path(kind, n, dist, self.seed, root=self.fixture_dir)
+
+    def _snapshot_open(self, kind, n, default):
+        path = self._fixture_path(kind, n, default)
+        ms = self._timeit(lambda: snapshot.open_snapshot(path))
+        return ms, {"fixture_mb": snapshot.snapshot_bytes(path) / 2**20}
+
+    def snapshot_open_hash_table(self, n):
+        return self._snapshot_open("hash_table", n, "sorted")
+
+    def snapshot_open_bst(self, n):
+        return self._snapshot_open("bst", n, "shuffled")
+
+    def snapshot_open_btree(self, n):
+        return self._snapshot_open("btree", n, "shuffled")
+
+    def _frozen_lookups(self, kind, n, default, method):
+        frozen = snapshot.open_snapshot(self._fixture_path(kind, n, default))
+        probes = self._every_hundredth(self._keys(n, default))
+        lookup = getattr(frozen, method)
+        ms = self._timeit(lambda: [lookup(p) for p in probes])
+        return ms, {"lookups_per_s": len(probes) / (ms / 1000.0) if ms > 0 else float("nan")}
+
+    def frozen_ht_get_many(self, n):
+        return self._frozen_lookups("hash_table", n, "sorted", "get")
+
+    def frozen_bst_search_many(self, n):
+        return self._frozen_lookups("bst", n, "shuffled", "search")
+
+    def frozen_btree_search_many(self, n):
+        return self._frozen_lookups("btree", n, "shuffled", "search")
+
+    def _cache_replay(self, cache_cls, n):
+        """Read-through replay of n requests through a cache holding 10% of the key space."""
+        cache = cache_cls(max(1, n // 10))
+        keys = self._keys(n, "zipf")
+        def replay():
+            for k in keys:
+                if cache.get(k) is None:
+                    cache.put(k, k)
+        ms = self._timeit(replay)
+        return ms, {"hit_ratio": cache.hit_ratio()}
+
+    def cache_lru(self, n):
+        return self._cache_replay(LRUCache, n)
+
+    def cache_lfu(self, n):
+        return self._cache_replay(LFUCache, n)
+
+    def cache_clock(self, n):
+        return self._cache_replay(ClockCache, n)
+
+    def operations(self):
+        return {
             # arrays
             "Array: insert_end": self.array_insert_end,
             "Array: insert_front": self.array_insert_front,
             "Array: search": self.array_search,
             "Array: delete": self.array_delete,
+            "Array: insert_middle": self.array_insert_middle,
+            # front/middle-edit array variants
+            "Deque: insert_front": self.deque_insert_front,
+            "Deque: insert_middle": self.deque_insert_middle,
+            "Deque: search": self.deque_search,
+            "GapBuffer: insert_front": self.gap_buffer_insert_front,
+            "GapBuffer: insert_middle": self.gap_buffer_insert_middle,
+            "GapBuffer: search": self.gap_buffer_search,
+            # sorted array (bisect)
+            "SortedArray: insert": self.sorted_array_insert,
+            "SortedArray: search": self.sorted_array_search,
+            "SortedArray: search_many": self.sorted_array_search_many,
+            "SortedArray: delete": self.sorted_array_delete,
+            # numpy-backed array
+            "NumpyArray: insert_end": self.numpy_array_insert_end,
+            "NumpyArray: search": self.numpy_array_search,
+            "NumpyArray: search_many": self.numpy_array_search_many,
+            "NumpyArray: remove_many": self.numpy_array_remove_many,
             # linked list
             "LinkedList: insert_tail": self.ll_insert_tail,
             "LinkedList: search": self.ll_search,
             "LinkedList: delete": self.ll_delete,
+            # unrolled linked list
+            "UnrolledList: insert_tail": self.ull_insert_tail,
+            "UnrolledList: search": self.ull_search,
+            "UnrolledList: delete": self.ull_delete,
             # bst
             "BST: insert": self.bst_insert,
             "BST: insert_ordered": self.bst_insert_ordered,
             "BST: search": self.bst_search,
             "BST: delete": self.bst_delete,
+            "BST: search_many": self.bst_search_many,
+            # b+-tree
+            "BTree: insert": self.btree_insert,
+            "BTree: search_many": self.btree_search_many,
+            "BTree: delete": self.btree_delete,
+            "BTree: range_scan": self.btree_range_scan,
             # hash table
             "HashTable: put": self.ht_put,
             "HashTable: get": self.ht_get,
             "HashTable: delete": self.ht_delete,
+            # mmap snapshots (fixture built once, then attached)
+            "Snapshot: open(HashTable)": self.snapshot_open_hash_table,
+            "Snapshot: open(BST)": self.snapshot_open_bst,
+            "Snapshot: open(BTree)": self.snapshot_open_btree,
+            "FrozenHashTable: get_many": self.frozen_ht_get_many,
+            "FrozenBST: search_many": self.frozen_bst_search_many,
+            "FrozenBTree: search_many": self.frozen_btree_search_many,
             # graph
             "Graph: add_edges(line)": self.graph_add_edges_linear,
             "Graph: bfs_search(end)": self.graph_bfs_search_end,
             "Graph: delete_node": self.graph_delete_node,
+            "Graph: connected(union-find)": self.graph_connected_dsu,
+            "Graph: connected(bfs)": self.graph_connected_bfs,
+            "Graph: dijkstra(indexed heap)": self.graph_dijkstra_indexed,
+            "Graph: dijkstra(lazy heap)": self.graph_dijkstra_lazy,
+            "Graph: astar(manhattan)": self.graph_astar,
+            # caches (timing plus hit_ratio)
+            "Cache: LRU replay": self.cache_lru,
+            "Cache: LFU replay": self.cache_lfu,
+            "Cache: CLOCK replay": self.cache_clock,
+        }
+
+    def measure(self, target: str, n: int, trial: int):
+        """Run one trial of `target` at size n and return its result record."""
+        result = self.operations()[target](n)
+        # operations may return (ms, {extra metrics}) to report more than a timing
+        ms, extra = result if isinstance(result, tuple) else (result, None)
+        record = {
+            "size": n,
+            "trial": trial,
+            "time_ms": ms,
+            "operation": target,
         }
-        fn = ops[target]
+        if extra:
+            record.update(extra)
+        if self.distribution:
+            record["distribution"] = self.distribution
+        if self.measure_memory:
+            record["memory_kb"] = self._last_memory_kb
+        return record
+
+    def run(self, target: str):
+        if target not in self.operations():
+            raise KeyError(target)
         records = []
         for n in self.sizes:
             for t in range(1, self.trials + 1):
-                ms = fn(n)
-                records.append({
-                    "size": n,
-                    "trial": t,
-                    "time_ms": ms,
-                    "operation": target,
-                })
+                records.append(self.measure(target, n, t))
         return pd.DataFrame.from_records(records)
@@ -0,0 +1,91 @@
+from time import perf_counter
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+from src.ds.cache import LRUCache, LFUCache, ClockCache
+from src.utils import workloads
+
+CACHE_POLICIES = {
+    "LRU": LRUCache,
+    "LFU": LFUCache,
+    "CLOCK": ClockCache,
+}
+
+KEY_STREAMS = ("zipf", "scan", "zipf_scan")
+
+
+def key_stream(kind, n_requests, key_space, seed=workloads.DEFAULT_SEED, zipf_a=1.1):
+    """
+    Request keys for a cache replay:
+    - zipf: skewed popularity, a small hot set gets most requests
+    - scan: cyclic sequential scan over the whole key space (defeats LRU when larger than the cache)
+    - zipf_scan: zipf traffic with a one-off scan burst every few thousand requests
+    """
+    rng = workloads.make_rng(seed)
+    if kind == "zipf":
+        keys = (rng.zipf(zipf_a, size=n_requests) - 1) % key_space
+    elif kind == "scan":
+        keys = np.arange(n_requests) % key_space
+    elif kind == "zipf_scan":
+        keys = (rng.zipf(zipf_a, size=n_requests) - 1) % key_space
+        burst = min(key_space, max(1, n_requests // 10))
+        period = burst * 4
+        scan_base = key_space  # scan keys outside the zipf range so they never hit
+        for start in range(period - burst, n_requests, period):
+            stop = min(start + burst, n_requests)
+            keys[start:stop] = scan_base + np.arange(stop - start)
+            scan_base += stop - start
+    else:
+        raise ValueError(f"Unknown key stream {kind!r}; expected one of {KEY_STREAMS}")
+    return keys.astype(np.int64).tolist()
+
+
+def replay(cache, keys):
+    """Read-through replay: a miss loads the key. Returns elapsed seconds."""
+    get, put = cache.get, cache.put
+    start = perf_counter()
+    for k in keys:
+        if get(k) is None:
+            put(k, k)
+    return perf_counter() - start
+
+
+def memory_per_entry(policy, capacity):
+    """Bytes allocated per cached entry once the cache is full (tracemalloc)."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        cache = CACHE_POLICIES[policy](capacity)
+        for k in range(capacity):
+            cache.put(k, k)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / capacity
+
+
+def cache_benchmark(policies=tuple(CACHE_POLICIES), streams=KEY_STREAMS, capacity=1_000,
+                    n_requests=100_000, key_space=20_000, trials=3, seed=workloads.DEFAULT_SEED):
+    """Replay each key stream through each policy; reports hit ratio, ops/s and bytes per entry."""
+    records = []
+    bytes_per_entry = {p: memory_per_entry(p, capacity) for p in policies}
+    for stream in streams:
+        keys = key_stream(stream, n_requests, key_space, seed)
+        for policy in policies:
+            for t in range(1, trials + 1):
+                cache = CACHE_POLICIES[policy](capacity)
+                seconds = replay(cache, keys)
+                records.append({
+                    "policy": policy,
+                    "stream": stream,
+                    "trial": t,
+                    "capacity": capacity,
+                    "requests": n_requests,
+                    "hit_ratio": cache.hit_ratio(),
+                    "evictions": cache.evictions,
+                    "seconds": seconds,
+                    "ops_per_s": n_requests / seconds if seconds > 0 else float("inf"),
+                    "bytes_per_entry": bytes_per_entry[policy],
+                })
+    return pd.DataFrame.from_records(records)
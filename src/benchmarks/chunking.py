@@ -0,0 +1,39 @@
+import pandas as pd
+
+from src.benchmarks.benchmark import Benchmark
+
+CHUNK_OPERATIONS = {
+    "search": ("LinkedList: search", "UnrolledList: search"),
+    "delete": ("LinkedList: delete", "UnrolledList: delete"),
+}
+
+
+def chunk_size_sweep(sizes, chunk_sizes=(4, 16, 64, 256, 1024), operations=("search", "delete"),
+                     trials=3, distribution=None):
+    """
+    Time the unrolled list at each chunk size next to the one-value-per-node
+    LinkedList baseline (reported as chunk_size 1).
+    """
+    frames = []
+    for kind in operations:
+        baseline_op, unrolled_op = CHUNK_OPERATIONS[kind]
+        df = Benchmark(sizes, trials, distribution=distribution).run(baseline_op)
+        frames.append(df.assign(structure="LinkedList", kind=kind, chunk_size=1))
+        for chunk in chunk_sizes:
+            df = Benchmark(sizes, trials, distribution=distribution, chunk_size=chunk).run(unrolled_op)
+            frames.append(df.assign(structure="UnrolledList", kind=kind, chunk_size=chunk))
+    return pd.concat(frames, ignore_index=True)
+
+
+def sweep_summary(sweep_df):
+    """Median time and ops/s per (kind, chunk_size, size) with speedup over the LinkedList baseline."""
+    summary = sweep_df.groupby(["kind", "structure", "chunk_size", "size"])["time_ms"].median().reset_index()
+    # one find per search trial; delete trials remove every hundredth key
+    ops = [1 if r.kind == "search" else len(range(0, r.size, max(1, r.size // 100))) for r in summary.itertuples()]
+    summary["ops_per_s"] = [o / (t / 1000.0) if t > 0 else float("nan") for o, t in zip(ops, summary["time_ms"])]
+    base = summary[summary["structure"] == "LinkedList"].set_index(["kind", "size"])["time_ms"]
+    summary["speedup_vs_linked_list"] = [
+        base[(r.kind, r.size)] / r.time_ms if r.time_ms > 0 else float("nan")
+        for r in summary.itertuples()
+    ]
+    return summary
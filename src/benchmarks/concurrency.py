@@ -0,0 +1,91 @@
+from time import perf_counter
+import sys
+import threading
+import pandas as pd
+
+from src.ds.concurrent_hash_table import ConcurrentHashTable, GlobalLockHashTable
+from src.utils import workloads
+
+TABLE_IMPLEMENTATIONS = {
+    "striped": lambda capacity, stripes: ConcurrentHashTable(capacity=capacity, stripes=stripes),
+    "global_lock": lambda capacity, stripes: GlobalLockHashTable(capacity=capacity),
+}
+
+
+def gil_enabled():
+    """False only on free-threaded builds running with the GIL disabled."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def _op_streams(threads, ops_per_thread, key_space, read_ratio, seed):
+    rng = workloads.make_rng(seed)
+    streams = []
+    for _ in range(threads):
+        keys = rng.integers(0, key_space, size=ops_per_thread).tolist()
+        reads = (rng.random(ops_per_thread) < read_ratio).tolist()
+        streams.append(list(zip(keys, reads)))
+    return streams
+
+
+def _worker(table, stream, barrier):
+    get, put = table.get, table.put
+    barrier.wait()
+    for key, is_read in stream:
+        if is_read:
+            get(key)
+        else:
+            put(key, key)
+
+
+def run_throughput(table, threads, read_ratio=0.9, ops_per_thread=20_000, key_space=10_000,
+                   seed=workloads.DEFAULT_SEED):
+    """Run `threads` workers against one shared table and return aggregate throughput."""
+    for k in range(0, key_space, 2):  # half the key space is present up front
+        table.put(k, k)
+    streams = _op_streams(threads, ops_per_thread, key_space, read_ratio, seed)
+    barrier = threading.Barrier(threads + 1)
+    workers = [threading.Thread(target=_worker, args=(table, s, barrier)) for s in streams]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = perf_counter()
+    for w in workers:
+        w.join()
+    seconds = perf_counter() - start
+    total = threads * ops_per_thread
+    return {
+        "threads": threads,
+        "read_ratio": read_ratio,
+        "total_ops": total,
+        "seconds": seconds,
+        "ops_per_s": total / seconds if seconds > 0 else float("inf"),
+    }
+
+
+def scaling_benchmark(thread_counts=(1, 2, 4, 8), read_ratios=(0.9, 0.5), ops_per_thread=20_000,
+                      key_space=10_000, stripes=16, implementations=("striped", "global_lock"),
+                      trials=3, seed=workloads.DEFAULT_SEED):
+    """
+    Throughput of each table implementation across thread counts and read/write
+    mixes. `scaling` is ops/s relative to the same implementation on one thread;
+    that baseline is always measured, but only `thread_counts` rows are returned.
+    """
+    records = []
+    for impl in implementations:
+        factory = TABLE_IMPLEMENTATIONS[impl]
+        for ratio in read_ratios:
+            for threads in sorted(set(thread_counts) | {1}):
+                for t in range(1, trials + 1):
+                    table = factory(max(1024, key_space * 2), stripes)
+                    row = run_throughput(table, threads, ratio, ops_per_thread, key_space, seed + t)
+                    row.update({"implementation": impl, "trial": t})
+                    records.append(row)
+    df = pd.DataFrame.from_records(records)
+    base = df[df["threads"] == 1].groupby(["implementation", "read_ratio"])["ops_per_s"].median()
+    df = df[df["threads"].isin(thread_counts)].reset_index(drop=True)
+    df["scaling"] = [
+        r.ops_per_s / base[(r.implementation, r.read_ratio)] for r in df.itertuples()
+    ]
+    df["gil_enabled"] = gil_enabled()
+    return df
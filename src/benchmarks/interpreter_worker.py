@@ -0,0 +1,62 @@
+"""
+Subprocess entry point for cross-interpreter runs: measures operations with the
+running interpreter and writes one JSON object per line to stdout.
+
+    python -m src.benchmarks.interpreter_worker --probe
+    python -m src.benchmarks.interpreter_worker --op "BST: insert" --sizes 1000,5000 --trials 3
+"""
+import argparse
+import json
+import sys
+
+
+def interpreter_info():
+    """Identity of this interpreter, including whether it is a free-threaded build"""
+    from src.utils.env_info import run_metadata
+    meta = run_metadata()
+    check = getattr(sys, "_is_gil_enabled", None)
+    meta["gil_enabled"] = True if check is None else check()
+    return meta
+
+
+def _emit(obj):
+    # NumPy scalars in extras are not JSON-serializable; every value we emit is numeric or text
+    sys.stdout.write(json.dumps(obj, default=lambda v: v.item() if hasattr(v, "item") else str(v)) + "\n")
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--probe", action="store_true", help="only report interpreter details")
+    parser.add_argument("--op", action="append", default=[], help="operation name (repeatable)")
+    parser.add_argument("--sizes", default="1000", help="comma-separated input sizes")
+    parser.add_argument("--trials", type=int, default=3)
+    parser.add_argument("--distribution", default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    # importing the suite here also checks that its dependencies exist for this interpreter
+    from src.benchmarks.benchmark import Benchmark
+    from src.utils import workloads
+    _emit({"type": "meta", **interpreter_info()})
+    if args.probe:
+        return 0
+    workloads.attach_shared()  # input keys the parent published, instead of regenerating them
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    kwargs = {"distribution": args.distribution}
+    if args.seed is not None:
+        kwargs["seed"] = args.seed
+    bench = Benchmark(sizes, args.trials, **kwargs)
+    for op in args.op:
+        try:
+            for n in sizes:
+                for t in range(1, args.trials + 1):
+                    _emit({"type": "record", **bench.measure(op, n, t)})
+        except Exception as exc:  # keep going with the remaining operations
+            _emit({"type": "error", "operation": op, "message": f"{type(exc).__name__}: {exc}"})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
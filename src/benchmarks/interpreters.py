@@ -0,0 +1,181 @@
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pandas as pd
+
+from src.utils.env_info import REPO_ROOT
+from src.utils.workloads import SharedWorkloads
+
+WORKER_MODULE = "src.benchmarks.interpreter_worker"
+# executable names looked up on PATH in addition to pyenv installs and the current interpreter
+CANDIDATE_NAMES = (
+    ["python3", "python"]
+    + [f"python3.{minor}" for minor in range(8, 16)]
+    + [f"python3.{minor}t" for minor in range(13, 16)]
+    + ["pypy3", "pypy"]
+)
+TAG_COLUMNS = ("interpreter", "python_version", "python_implementation", "free_threaded")
+
+
+def _candidates(extra=()):
+    paths = [sys.executable, *extra]
+    paths += [p for p in (shutil.which(name) for name in CANDIDATE_NAMES) if p]
+    pyenv_root = os.environ.get("PYENV_ROOT", os.path.expanduser("~/.pyenv"))
+    paths += sorted(glob.glob(os.path.join(pyenv_root, "versions", "*", "bin", "python")))
+    seen, unique = set(), []
+    for path in paths:
+        real = os.path.realpath(path)
+        if os.path.basename(os.path.dirname(path)) == "shims":
+            continue  # pyenv shims dispatch to the versions already globbed above
+        if real not in seen and os.access(real, os.X_OK):
+            seen.add(real)
+            unique.append(path)
+    return unique
+
+
+def _parse(stdout):
+    if isinstance(stdout, bytes):  # TimeoutExpired keeps raw bytes even with text=True
+        stdout = stdout.decode(errors="replace")
+    lines = []
+    for line in (stdout or "").splitlines():
+        try:
+            lines.append(json.loads(line))
+        except ValueError:
+            continue  # stray prints from the code under test, or a line cut off by a timeout
+    return lines
+
+
+def _worker(executable, args, timeout, env=None):
+    """
+    Run the worker module under `executable` from the repo root; returns parsed
+    JSON lines. On timeout the lines streamed so far are kept and a
+    {"type": "timeout"} line is appended.
+    """
+    try:
+        proc = subprocess.run(
+            [executable, "-m", WORKER_MODULE, *args],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=timeout,
+            env={**os.environ, **(env or {}), "PYTHONPATH": REPO_ROOT},
+        )
+    except subprocess.TimeoutExpired as exc:
+        return _parse(exc.stdout) + [{"type": "timeout", "message": f"timed out after {timeout:g}s"}]
+    lines = _parse(proc.stdout)
+    if proc.returncode != 0 and not lines:
+        err = proc.stderr.strip().splitlines()
+        raise RuntimeError(err[-1] if err else f"worker exited with status {proc.returncode}")
+    return lines
+
+
+def probe(executable, timeout=60):
+    """Interpreter details, or a record with usable=False and the reason it cannot run the suite."""
+    try:
+        lines = _worker(executable, ["--probe"], timeout)
+        meta = next((line for line in lines if line.get("type") == "meta"), None)
+        if meta is None:
+            raise RuntimeError(lines[-1]["message"] if lines else "worker reported nothing")
+    except (OSError, subprocess.SubprocessError, RuntimeError) as exc:
+        return {"executable": executable, "usable": False, "reason": str(exc) or type(exc).__name__}
+    meta.pop("type")
+    return {"executable": executable, "usable": True, "reason": "", **meta}
+
+
+def discover_interpreters(extra=(), timeout=60):
+    """
+    Probe the current interpreter, python* executables on PATH and pyenv
+    installs. Interpreters missing the suite's dependencies are kept with
+    usable=False so the UI can say why they were skipped.
+    """
+    return pd.DataFrame([probe(path, timeout) for path in _candidates(extra)])
+
+
+def run_on_interpreter(executable, operations, sizes, trials=3, distribution=None, seed=None, timeout=600):
+    """
+    Measure `operations` in subprocesses under `executable`, one worker per
+    operation so `timeout` (seconds) applies to each operation on its own; a
+    timed-out operation keeps the trials it finished. Input keys are
+    generated once here and mapped read-only into every worker through
+    shared memory. Returns (records, errors, meta): records carry the usual
+    Benchmark columns plus the interpreter tags, errors lists operations that
+    failed there and meta is the worker's run_metadata().
+    """
+    from src.benchmarks.benchmark import Benchmark
+    args = ["--sizes", ",".join(str(int(n)) for n in sizes), "--trials", str(int(trials))]
+    if distribution:
+        args += ["--distribution", distribution]
+    if seed is not None:
+        args += ["--seed", str(seed)]
+    bench = Benchmark(sizes, trials, distribution=distribution, **({} if seed is None else {"seed": seed}))
+    meta, records, failures = {}, [], []
+    with SharedWorkloads(bench.workload_keys()) as shared:
+        for op in operations:
+            lines = _worker(executable, [*args, "--op", op], timeout, env=shared.env())
+            meta = meta or next((line for line in lines if line.get("type") == "meta"), {})
+            records += [{k: v for k, v in line.items() if k != "type"}
+                        for line in lines if line.get("type") == "record"]
+            failures += [(op, line["message"]) for line in lines if line.get("type") in ("error", "timeout")]
+    tags = {col: meta.get(col) for col in TAG_COLUMNS}
+    tags["python_executable"] = executable
+    errors = [{"interpreter": tags["interpreter"] or executable, "python_executable": executable,
+               "operation": op, "message": message} for op, message in failures]
+    return pd.DataFrame.from_records([{**rec, **tags} for rec in records]), errors, meta
+
+
+def _disambiguate(results, errors, metas):
+    """Suffix the executable to labels shared by several interpreters (e.g. pyenv and system 3.12.1)."""
+    labels = {exe: meta.get("interpreter") or exe for exe, meta in metas.items()}
+    counts = pd.Series(list(labels.values()), dtype=object).value_counts()
+    for exe, label in labels.items():
+        if counts[label] < 2:
+            continue
+        unique = f"{label} ({exe})"
+        results.loc[results["python_executable"] == exe, "interpreter"] = unique
+        metas[exe]["interpreter"] = unique
+        for err in errors:
+            if err.get("python_executable") == exe:
+                err["interpreter"] = unique
+    return results, errors
+
+
+def cross_interpreter_run(executables, operations, sizes, trials=3, distribution=None, seed=None,
+                          timeout=600, progress=None):
+    """
+    Run the same operation matrix under each interpreter, one at a time so
+    workers never compete for CPU; `timeout` applies per operation. Returns
+    (results, errors, metadata by executable). Interpreters reporting the
+    same label are told apart by their executable path.
+    """
+    frames, errors, metas = [], [], {}
+    for idx, exe in enumerate(executables):
+        try:
+            df, errs, meta = run_on_interpreter(exe, operations, sizes, trials, distribution, seed, timeout)
+        except (OSError, subprocess.SubprocessError, RuntimeError) as exc:
+            errors.append({"interpreter": exe, "python_executable": exe, "operation": "*", "message": str(exc)})
+        else:
+            frames.append(df)
+            errors.extend(errs)
+            metas[exe] = meta
+        if progress:
+            progress(idx + 1, len(executables))
+    results = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return _disambiguate(results, errors, metas) + (metas,)
+
+
+def interpreter_comparison(results, baseline=None):
+    """
+    Median time per (operation, size, interpreter) with speedup relative to
+    the baseline interpreter (default: the first one in the results) and the
+    rank of each interpreter per (operation, size), 1 = fastest.
+    """
+    summary = results.groupby(["operation", "size", "interpreter"], sort=False)["time_ms"].median().reset_index()
+    baseline = baseline or summary["interpreter"].iloc[0]
+    base = summary[summary["interpreter"] == baseline].set_index(["operation", "size"])["time_ms"]
+    summary["speedup_vs_baseline"] = [
+        base.get((r.operation, r.size), float("nan")) / r.time_ms if r.time_ms > 0 else float("nan")
+        for r in summary.itertuples()
+    ]
+    summary["rank"] = summary.groupby(["operation", "size"])["time_ms"].rank(method="min").astype(int)
+    return summary
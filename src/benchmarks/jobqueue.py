@@ -0,0 +1,333 @@
+"""
+File-based job queue for spreading a benchmark matrix over many worker processes or hosts.
+
+Layout under the queue root (any directory all workers can see, e.g. an NFS share):
+    pending/<job_id>.json   published, waiting for a worker
+    claimed/<job_id>.json   claimed by a worker; its mtime is the worker's heartbeat
+    done/<job_id>.json      finished
+    failed/<job_id>.json    gave up after max_attempts
+    results/<job_id>.json   measurements + worker metadata for one job
+
+A claim is an atomic rename from pending/ to claimed/, so exactly one worker wins.
+
+    python -m src.benchmarks.jobqueue worker --root /shared/queue
+    python -m src.benchmarks.jobqueue status --root /shared/queue
+"""
+import argparse
+import hashlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+from src.utils.env_info import REPO_ROOT, machine_fingerprint, run_metadata
+from src.utils.workloads import DEFAULT_SEED, SharedWorkloads, attach_shared
+
+STATES = ("pending", "claimed", "done", "failed")
+DEFAULT_STALE_S = 300.0   # a claim without a heartbeat for this long is presumed crashed
+DEFAULT_MAX_ATTEMPTS = 3
+HANDOFF_SUFFIX = ".handoff"  # a claim being moved by fail(); still counts as claimed
+
+
+def job_id(spec: Dict) -> str:
+    """Content hash of the job spec, so re-publishing the same plan is a no-op"""
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def plan_jobs(operations: Sequence[str], sizes: Sequence[int], distributions: Sequence[Optional[str]] = (None,),
+              trials: int = 3, seed: int = DEFAULT_SEED) -> List[Dict]:
+    """One job per (operation, size, distribution) cell, carrying all of its trials"""
+    jobs = []
+    for op in operations:
+        for dist in distributions:
+            for n in sizes:
+                spec = {"operation": op, "size": int(n), "distribution": dist, "trials": int(trials), "seed": seed}
+                jobs.append({"job_id": job_id(spec), **spec})
+    return jobs
+
+
+def _write_json(path: str, obj) -> None:
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "w") as fh:
+        json.dump(obj, fh, default=lambda v: v.item() if hasattr(v, "item") else str(v))
+    os.replace(tmp, path)  # readers never see a half-written file
+
+
+def _read_json(path: str):
+    with open(path) as fh:
+        return json.load(fh)
+
+
+class JobQueue:
+    def __init__(self, root: str, stale_after_s: float = DEFAULT_STALE_S, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.root = root
+        self.stale_after_s = stale_after_s
+        self.max_attempts = max_attempts
+        for state in (*STATES, "results"):
+            os.makedirs(os.path.join(root, state), exist_ok=True)
+
+    def _path(self, state: str, jid: str) -> str:
+        return os.path.join(self.root, state, f"{jid}.json")
+
+    def _ids(self, state: str) -> List[str]:
+        return sorted(f[:-5] for f in os.listdir(os.path.join(self.root, state)) if f.endswith(".json"))
+
+    def publish(self, jobs: Iterable[Dict]) -> int:
+        """Queue jobs that are not already known in any state; returns how many were added"""
+        added = 0
+        for job in jobs:
+            jid = job["job_id"]
+            if any(os.path.exists(self._path(state, jid)) for state in STATES):
+                continue
+            _write_json(self._path("pending", jid), {**job, "attempts": 0})
+            added += 1
+        return added
+
+    def claim(self, worker: str) -> Optional[Dict]:
+        """Atomically take one pending job, or None when nothing is left"""
+        for jid in self._ids("pending"):
+            claimed = self._path("claimed", jid)
+            try:
+                os.rename(self._path("pending", jid), claimed)
+            except FileNotFoundError:
+                continue  # another worker won this one
+            job = _read_json(claimed)
+            if os.path.exists(self._path("results", jid)):
+                # a presumed-dead worker finished after all; nothing left to do
+                os.replace(claimed, self._path("done", jid))
+                continue
+            job.update(attempts=job.get("attempts", 0) + 1, worker=worker, claimed_at=time.time())
+            _write_json(claimed, job)
+            return job
+        return None
+
+    def heartbeat(self, job: Dict) -> None:
+        try:
+            os.utime(self._path("claimed", job["job_id"]))
+        except FileNotFoundError:
+            pass  # requeued by the coordinator; our result still counts if we finish
+
+    def complete(self, job: Dict, records: List[Dict], meta: Dict) -> None:
+        jid = job["job_id"]
+        _write_json(self._path("results", jid), {"job": job, "meta": meta, "records": records})
+        try:
+            os.replace(self._path("claimed", jid), self._path("done", jid))
+        except FileNotFoundError:
+            _write_json(self._path("done", jid), job)
+        if os.path.exists(self._path("pending", jid)):
+            try:
+                os.remove(self._path("pending", jid))
+            except FileNotFoundError:
+                pass
+
+    def fail(self, job: Dict, error: str) -> bool:
+        """
+        Return a job to pending, or park it in failed/ once it has used
+        max_attempts. The claim is first renamed to a name only this call
+        knows, so a concurrent complete() or fail() on the same job cannot
+        interleave; returns False when someone else already handled it.
+        """
+        jid = job["job_id"]
+        handoff = f"{self._path('claimed', jid)}.{uuid.uuid4().hex}{HANDOFF_SUFFIX}"
+        try:
+            os.rename(self._path("claimed", jid), handoff)
+        except FileNotFoundError:
+            return False  # completed by the worker or requeued by the coordinator
+        if os.path.exists(self._path("results", jid)):
+            os.replace(handoff, self._path("done", jid))  # the worker finished after all
+            return False
+        job = {**job, "last_error": error}
+        state = "failed" if job.get("attempts", 0) >= self.max_attempts else "pending"
+        _write_json(handoff, job)
+        os.replace(handoff, self._path(state, jid))
+        return True
+
+    def requeue_stale(self) -> List[str]:
+        """Give claims without a recent heartbeat back to the queue (the worker presumably crashed)"""
+        requeued, now = [], time.time()
+        for jid in self._ids("claimed"):
+            path = self._path("claimed", jid)
+            try:
+                if now - os.path.getmtime(path) < self.stale_after_s:
+                    continue
+                job = _read_json(path)
+            except (FileNotFoundError, ValueError):
+                continue  # finished or being rewritten right now
+            if self.fail(job, f"stale claim by {job.get('worker')}"):
+                requeued.append(jid)
+        return requeued
+
+    def status(self) -> Dict[str, int]:
+        return {state: len(self._ids(state)) for state in STATES}
+
+    def finished(self) -> bool:
+        counts = self.status()
+        handoffs = any(f.endswith(HANDOFF_SUFFIX) for f in os.listdir(os.path.join(self.root, "claimed")))
+        return counts["pending"] == 0 and counts["claimed"] == 0 and not handoffs
+
+    def collect(self, job_ids: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Merge job records (all results, or only `job_ids`) into the usual
+        Benchmark result schema, tagged with worker and machine
+        """
+        wanted = set(job_ids) if job_ids is not None else None
+        rows = []
+        for jid in self._ids("results"):
+            if wanted is not None and jid not in wanted:
+                continue
+            result = _read_json(self._path("results", jid))
+            meta = result["meta"]
+            tags = {"job_id": jid, "worker": meta.get("worker"), "hostname": meta.get("hostname"),
+                    "fingerprint": meta.get("fingerprint")}
+            rows.extend({**rec, **tags} for rec in result["records"])
+        df = pd.DataFrame.from_records(rows)
+        if df.empty:
+            return df
+        return df.sort_values(["operation", "size", "trial"], kind="stable").reset_index(drop=True)
+
+    def failures(self, job_ids: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Jobs parked in failed/ (all, or only `job_ids`), each with its last_error"""
+        wanted = set(job_ids) if job_ids is not None else None
+        return [_read_json(self._path("failed", jid)) for jid in self._ids("failed")
+                if wanted is None or jid in wanted]
+
+
+def _run_job(job: Dict) -> List[Dict]:
+    from src.benchmarks.benchmark import Benchmark
+    bench = Benchmark([job["size"]], job["trials"], seed=job["seed"], distribution=job["distribution"])
+    return [bench.measure(job["operation"], job["size"], t) for t in range(1, job["trials"] + 1)]
+
+
+def _keep_alive(queue: JobQueue, job: Dict, stop: threading.Event, interval: float) -> None:
+    while not stop.wait(interval):
+        queue.heartbeat(job)
+
+
+def run_worker(root: str, worker: Optional[str] = None, max_jobs: Optional[int] = None, poll_s: float = 0.5,
+               exit_when_idle: bool = True, stale_after_s: float = DEFAULT_STALE_S,
+               max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+    """Claim and run jobs until the queue is drained; returns how many jobs this worker completed"""
+    queue = JobQueue(root, stale_after_s=stale_after_s, max_attempts=max_attempts)
+    attach_shared()  # set for local workers; remote ones generate their inputs
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    meta = {**run_metadata(), "worker": worker}
+    meta["fingerprint"] = machine_fingerprint(meta)
+    done = 0
+    while max_jobs is None or done < max_jobs:
+        job = queue.claim(worker)
+        if job is None:
+            if exit_when_idle and queue.finished():
+                break
+            time.sleep(poll_s)
+            continue
+        stop = threading.Event()
+        beat = threading.Thread(target=_keep_alive, args=(queue, job, stop, max(0.05, stale_after_s / 3)),
+                                daemon=True)
+        beat.start()
+        try:
+            records = _run_job(job)
+        except Exception as exc:
+            queue.fail(job, f"{type(exc).__name__}: {exc}")
+            continue
+        finally:
+            stop.set()
+            beat.join()
+        queue.complete(job, records, meta)
+        done += 1
+    return done
+
+
+def job_workload_keys(jobs: Iterable[Dict]) -> List[tuple]:
+    """Workload cache keys the jobs' trials will ask for, to publish once for all local workers"""
+    from src.benchmarks.benchmark import Benchmark
+    keys = []
+    for job in jobs:
+        bench = Benchmark([job["size"]], job["trials"], seed=job["seed"], distribution=job["distribution"])
+        keys += bench.workload_keys()
+    return list(dict.fromkeys(keys))
+
+
+def spawn_local_workers(root: str, count: int, stale_after_s: float = DEFAULT_STALE_S,
+                        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                        env: Optional[Dict[str, str]] = None) -> List[subprocess.Popen]:
+    cmd = [sys.executable, "-m", "src.benchmarks.jobqueue", "worker", "--root", root,
+           "--stale-after", str(stale_after_s), "--max-attempts", str(max_attempts)]
+    env = {**os.environ, **(env or {}), "PYTHONPATH": REPO_ROOT}
+    return [subprocess.Popen(cmd + ["--worker", f"local-{i}"], cwd=REPO_ROOT, env=env,
+                             stdout=subprocess.DEVNULL) for i in range(count)]
+
+
+def coordinate(root: str, jobs: Sequence[Dict], local_workers: int = 0, stale_after_s: float = DEFAULT_STALE_S,
+               max_attempts: int = DEFAULT_MAX_ATTEMPTS, poll_s: float = 0.5, timeout_s: Optional[float] = None,
+               progress=None):
+    """
+    Publish `jobs`, optionally start local worker processes, requeue stale
+    claims until everything is done or failed, then return (results,
+    failures) for these jobs only: failures lists jobs that used up
+    max_attempts, so a non-empty list means the matrix is partial.
+    Local workers map the jobs' input keys from shared memory; workers on
+    other hosts just run `python -m src.benchmarks.jobqueue worker` against
+    the same root and generate their own.
+    """
+    queue = JobQueue(root, stale_after_s=stale_after_s, max_attempts=max_attempts)
+    queue.publish(jobs)
+    job_ids = [job["job_id"] for job in jobs]
+    shared = SharedWorkloads(job_workload_keys(jobs) if local_workers else ())
+    procs = spawn_local_workers(root, local_workers, stale_after_s, max_attempts, env=shared.env())
+    started = time.time()
+    try:
+        while not queue.finished():
+            if timeout_s is not None and time.time() - started > timeout_s:
+                raise TimeoutError(f"queue not drained after {timeout_s:.0f}s: {queue.status()}")
+            queue.requeue_stale()
+            if progress:
+                progress(queue.status())
+            if procs and all(p.poll() is not None for p in procs) and not queue.finished():
+                # replace crashed workers
+                procs = spawn_local_workers(root, local_workers, stale_after_s, max_attempts, env=shared.env())
+            time.sleep(poll_s)
+    finally:
+        # idle workers would exit on their own; a stuck one must not mask the real outcome
+        for p in procs:
+            if p.poll() is None:
+                p.terminate()
+        for p in procs:
+            try:
+                p.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                p.kill()
+                p.wait()
+        shared.close()
+    return queue.collect(job_ids), queue.failures(job_ids)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="File-based benchmark job queue")
+    sub = parser.add_subparsers(dest="command", required=True)
+    w = sub.add_parser("worker", help="claim and run jobs until the queue is drained")
+    w.add_argument("--root", required=True)
+    w.add_argument("--worker", default=None)
+    w.add_argument("--stale-after", type=float, default=DEFAULT_STALE_S)
+    w.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+    w.add_argument("--wait", action="store_true", help="keep polling when the queue is empty")
+    s = sub.add_parser("status", help="print job counts per state")
+    s.add_argument("--root", required=True)
+    args = parser.parse_args(argv)
+    if args.command == "worker":
+        n = run_worker(args.root, args.worker, exit_when_idle=not args.wait,
+                       stale_after_s=args.stale_after, max_attempts=args.max_attempts)
+        print(f"{args.worker or 'worker'}: completed {n} jobs")
+    else:
+        print(json.dumps(JobQueue(args.root).status()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import pandas as pd
+
+from src.benchmarks.benchmark import Benchmark
+from src.utils.workloads import KEY_DISTRIBUTIONS
+
+# these operations fix their own input (ordered keys, a seeded weighted grid), so they are not part of the distribution axis
+FIXED_INPUT_OPERATIONS = {
+    "BST: insert_ordered",
+    "Graph: dijkstra(indexed heap)",
+    "Graph: dijkstra(lazy heap)",
+    "Graph: astar(manhattan)",
+}
+
+
+def distribution_operations():
+    return [op for op in Benchmark([1]).operations() if op not in FIXED_INPUT_OPERATIONS]
+
+
+def run_distribution_matrix(operations, distributions, size, trials=3, seed=None, progress=None):
+    """Run every (operation, distribution) cell at one size; returns the raw trial frame."""
+    frames = []
+    cells = [(d, op) for d in distributions for op in operations]
+    for idx, (dist, op) in enumerate(cells):
+        kwargs = {"distribution": dist}
+        if seed is not None:
+            kwargs["seed"] = seed
+        bench = Benchmark([size], trials, **kwargs)
+        frames.append(bench.run(op))
+        if progress:
+            progress(idx + 1, len(cells), op, dist)
+    return pd.concat(frames, ignore_index=True)
+
+
+def matrix_pivot(result_df, normalize=False):
+    """Median time per (operation, distribution); optionally relative to the uniform column."""
+    pivot = result_df.pivot_table(index="operation", columns="distribution",
+                                  values="time_ms", aggfunc="median")
+    pivot = pivot[[d for d in KEY_DISTRIBUTIONS if d in pivot.columns]]
+    if normalize and "uniform" in pivot.columns:
+        pivot = pivot.div(pivot["uniform"], axis=0)
+    return pivot
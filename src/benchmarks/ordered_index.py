@@ -0,0 +1,42 @@
+import pandas as pd
+
+from src.benchmarks.benchmark import Benchmark
+
+INDEX_OPERATIONS = {
+    "insert": ("BST: insert", "BTree: insert"),
+    "search": ("BST: search_many", "BTree: search_many"),
+    "delete": ("BST: delete", "BTree: delete"),
+}
+
+INDEX_SIZES = (100_000, 1_000_000, 10_000_000)
+
+
+def index_comparison(sizes=INDEX_SIZES, orders=(16, 64, 256), operations=("insert", "search", "delete"),
+                     trials=1, distribution=None):
+    """
+    Time the B+-tree at each node order next to the one-key-per-node BST
+    (reported as order 1). Both see the same shuffled keys at each size.
+    """
+    frames = []
+    for kind in operations:
+        bst_op, btree_op = INDEX_OPERATIONS[kind]
+        df = Benchmark(sizes, trials, distribution=distribution).run(bst_op)
+        frames.append(df.assign(structure="BST", kind=kind, order=1))
+        for order in orders:
+            df = Benchmark(sizes, trials, distribution=distribution, btree_order=order).run(btree_op)
+            frames.append(df.assign(structure="BTree", kind=kind, order=order))
+    return pd.concat(frames, ignore_index=True)
+
+
+def index_summary(comparison_df):
+    """Median time per (kind, order, size) with speedup over the BST baseline."""
+    summary = comparison_df.groupby(["kind", "structure", "order", "size"])["time_ms"].median().reset_index()
+    base = summary[summary["structure"] == "BST"].set_index(["kind", "size"])["time_ms"]
+    summary["speedup_vs_bst"] = [
+        base[(r.kind, r.size)] / r.time_ms if r.time_ms > 0 else float("nan")
+        for r in summary.itertuples()
+    ]
+    if "height" in comparison_df.columns:
+        heights = comparison_df.groupby(["kind", "order", "size"])["height"].max()
+        summary["height"] = [heights.get((r.kind, r.order, r.size)) for r in summary.itertuples()]
+    return summary
@@ -0,0 +1,93 @@
+from time import perf_counter
+import math
+import numpy as np
+import pandas as pd
+
+from src.benchmarks.benchmark import Benchmark
+
+
+def fit_power_law(sizes, times):
+    """Least-squares fit of time = c * n^k in log-log space; returns (c, k) with k >= 0."""
+    pts = [(n, t) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if not pts:
+        return 0.0, 1.0
+    if len(pts) == 1:
+        n, t = pts[0]
+        return t / n, 1.0  # assume linear until there is a second point
+    xs = np.log([p[0] for p in pts])
+    ys = np.log([p[1] for p in pts])
+    k, log_c = np.polyfit(xs, ys, 1)
+    k = max(0.0, float(k))
+    # refit the constant with the clamped exponent so predictions stay anchored to the data
+    log_c = float(np.mean(ys - k * xs))
+    return math.exp(log_c), k
+
+
+class BudgetScheduler:
+    """
+    Runs sizes smallest-first under a wall-clock budget for one operation.
+    After `min_fit_points` sizes are measured it fits a growth model, predicts
+    the cost of each remaining size, and reduces its trials or skips it when
+    the prediction would overrun what is left of the budget. Measured trials
+    are returned with `extrapolated=False`; each skipped size gets one row
+    with `extrapolated=True`, its `predicted_ms` and no `time_ms`, so callers
+    can show the prediction but must leave it out of statistics. `plan` has
+    the per-size schedule.
+    """
+    def __init__(self, sizes, trials=3, budget_s=30.0, min_fit_points=2, fit_window=4,
+                 measure_memory=False, distribution=None):
+        self.sizes = sorted(set(sizes))
+        self.trials = trials
+        self.budget_s = budget_s
+        self.min_fit_points = min_fit_points
+        self.fit_window = fit_window
+        self.bench = Benchmark(self.sizes, trials=trials, measure_memory=measure_memory,
+                               distribution=distribution)
+        self.plan = None
+
+    def run(self, target: str):
+        if target not in self.bench.operations():
+            raise KeyError(target)
+        records = []
+        plan = []
+        measured_n, measured_ms, measured_wall = [], [], []
+        start = perf_counter()
+        for n in self.sizes:
+            remaining_s = self.budget_s - (perf_counter() - start)
+            predicted_ms = predicted_wall_s = None
+            trials = self.trials
+            if len(measured_n) >= self.min_fit_points:
+                window = slice(-self.fit_window, None)
+                c, k = fit_power_law(measured_n[window], measured_ms[window])
+                cw, kw = fit_power_law(measured_n[window], measured_wall[window])
+                predicted_ms = c * n ** k
+                predicted_wall_s = cw * n ** kw
+                affordable = int(remaining_s // predicted_wall_s) if predicted_wall_s > 0 else trials
+                trials = min(trials, affordable)
+            elif remaining_s <= 0:
+                trials = 0
+
+            if trials <= 0:
+                records.append({"operation": target, "size": n, "trial": 0, "time_ms": np.nan,
+                                "predicted_ms": np.nan if predicted_ms is None else predicted_ms,
+                                "extrapolated": True})
+                plan.append({"size": n, "predicted_ms": predicted_ms, "trials_planned": self.trials,
+                             "trials_run": 0, "status": "extrapolated"})
+                continue
+
+            times, walls = [], []
+            for t in range(1, trials + 1):
+                wall_start = perf_counter()
+                record = self.bench.measure(target, n, t)
+                walls.append(perf_counter() - wall_start)
+                records.append({**record, "extrapolated": False})
+                times.append(record["time_ms"])
+            measured_n.append(n)
+            measured_ms.append(float(np.median(times)))
+            measured_wall.append(float(np.median(walls)))
+            plan.append({"size": n, "predicted_ms": predicted_ms, "trials_planned": self.trials,
+                         "trials_run": trials,
+                         "status": "measured" if trials == self.trials else "reduced"})
+
+        self.plan = pd.DataFrame(plan)
+        return pd.DataFrame.from_records(records)
@@ -1,3 +1,6 @@
+import bisect
+from collections import deque
+
 class ArrayDS:
     """Wrapper around Python list to standardize operations for benchmarking."""
     def __init__(self, iterable=None):
@@ -9,6 +12,9 @@ class ArrayDS:
     def insert_front(self, value):
         self.data.insert(0, value)
 
+    def insert_at(self, index, value):
+        self.data.insert(index, value)
+
     def pop_back(self):
         if self.data:
             self.data.pop()
@@ -25,3 +31,50 @@ class ArrayDS:
 
     def __len__(self):
         return len(self.data)
+
+
+class SortedArrayDS(ArrayDS):
+    """ArrayDS kept in ascending order: bisect gives O(log n) search and positioned insert/delete."""
+    def __init__(self, iterable=None):
+        self.data = sorted(iterable) if iterable is not None else []
+
+    def insert(self, value):
+        bisect.insort(self.data, value)
+
+    # values land at their sorted position, so positional inserts would silently mean `insert`
+    def _positional(self, *args):
+        raise TypeError("SortedArrayDS keeps values in order; use insert() instead of a positional insert")
+
+    append = insert_front = insert_at = _positional
+
+    def remove_value(self, value):
+        i = bisect.bisect_left(self.data, value)
+        if i < len(self.data) and self.data[i] == value:
+            del self.data[i]
+            return True
+        return False
+
+    def search_binary(self, value):
+        i = bisect.bisect_left(self.data, value)
+        return i < len(self.data) and self.data[i] == value
+
+    def search_many(self, values):
+        data, n = self.data, len(self.data)
+        out = []
+        for v in values:
+            i = bisect.bisect_left(data, v)
+            out.append(i < n and data[i] == v)
+        return out
+
+    def range(self, lo, hi):
+        """All values in [lo, hi)."""
+        return self.data[bisect.bisect_left(self.data, lo):bisect.bisect_left(self.data, hi)]
+
+
+class DequeArrayDS(ArrayDS):
+    """ArrayDS on collections.deque: O(1) at both ends, O(n) in the middle."""
+    def __init__(self, iterable=None):
+        self.data = deque(iterable) if iterable is not None else deque()
+
+    def insert_front(self, value):
+        self.data.appendleft(value)
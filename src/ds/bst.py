@@ -7,11 +7,18 @@ class BSTNode:
 
 class BinarySearchTree:
     """Unbalanced BST for benchmarking average vs worst cases."""
-    def __init__(self):
+    def __init__(self, track_stats=True):
         self.root = None
         self._size = 0
+        # shape stats: kept current on insert when tracking, otherwise (and after a delete) recounted by stats()
+        self.track_stats = track_stats
+        self._height = 0
+        self._depth_sum = 0  # sum of node depths, root at depth 1
+        self._shape_stale = not track_stats
 
     def insert(self, key):
+        if self.track_stats:
+            return self._insert_tracked(key)
         if self.root is None:
             self.root = BSTNode(key)
             self._size += 1
@@ -33,6 +40,32 @@ class BinarySearchTree:
             else:
                 return  # duplicate ignore
 
+    def _insert_tracked(self, key):
+        """insert() that also counts the new node's depth; kept separate so untracked inserts pay nothing."""
+        depth = 1
+        if self.root is None:
+            self.root = BSTNode(key)
+        else:
+            cur = self.root
+            while True:
+                depth += 1
+                if key < cur.key:
+                    if cur.left is None:
+                        cur.left = BSTNode(key)
+                        break
+                    cur = cur.left
+                elif key > cur.key:
+                    if cur.right is None:
+                        cur.right = BSTNode(key)
+                        break
+                    cur = cur.right
+                else:
+                    return  # duplicate ignore
+        self._size += 1
+        self._depth_sum += depth
+        if depth > self._height:
+            self._height = depth
+
     def search(self, key):
         cur = self.root
         while cur:
@@ -71,7 +104,36 @@ class BinarySearchTree:
         self.root, deleted = delete_node(self.root, key)
         if deleted:
             self._size -= 1
+            self._shape_stale = True  # removing a node can shorten many paths at once
         return deleted
 
+    def _recount(self):
+        """Walk the tree to recompute size, height and depth sum (after deletes or a direct rebuild)."""
+        size = height = depth_sum = 0
+        stack = [(self.root, 1)] if self.root else []
+        while stack:
+            node, depth = stack.pop()
+            size += 1
+            depth_sum += depth
+            if depth > height:
+                height = depth
+            if node.left:
+                stack.append((node.left, depth + 1))
+            if node.right:
+                stack.append((node.right, depth + 1))
+        self._size, self._height, self._depth_sum = size, height, depth_sum
+        self._shape_stale = not self.track_stats  # untracked inserts don't keep these current
+
+    @property
+    def height(self):
+        if self._shape_stale:
+            self._recount()
+        return self._height
+
+    def stats(self):
+        """Height and mean node depth (the comparisons a successful search makes on average)."""
+        height = self.height
+        return {"height": height, "avg_depth": self._depth_sum / self._size if self._size else 0.0}
+
     def __len__(self):
         return self._size
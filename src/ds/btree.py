@@ -0,0 +1,166 @@
+from bisect import bisect_left, bisect_right
+
+
+class BTreeNode:
+    __slots__ = ("keys", "children", "next")
+    def __init__(self, keys=None, children=None):
+        self.keys = keys if keys is not None else []
+        self.children = children  # None for leaves
+        self.next = None          # right sibling, leaves only
+
+
+class BPlusTree:
+    """
+    B+-tree ordered index: every node holds a sorted key list searched with
+    bisect, keys live in the leaves and leaves are linked for range scans.
+    `order` is the maximum number of keys per node.
+    """
+    def __init__(self, order=64):
+        if order < 3:
+            raise ValueError("order must be at least 3")
+        self.order = order
+        self._min_keys = order // 2
+        self.root = BTreeNode()
+        self._size = 0
+
+    def _find_leaf(self, key, path=None):
+        node = self.root
+        while node.children is not None:
+            i = bisect_right(node.keys, key)
+            if path is not None:
+                path.append((node, i))
+            node = node.children[i]
+        return node
+
+    def search(self, key):
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+    def insert(self, key):
+        path = []
+        leaf = self._find_leaf(key, path)
+        keys = leaf.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return  # duplicate ignore
+        keys.insert(i, key)
+        self._size += 1
+        if len(keys) <= self.order:
+            return
+
+        mid = len(keys) // 2
+        new = BTreeNode(keys[mid:])
+        del keys[mid:]
+        new.next = leaf.next
+        leaf.next = new
+        sep = new.keys[0]
+        while path:
+            parent, i = path.pop()
+            parent.keys.insert(i, sep)
+            parent.children.insert(i + 1, new)
+            if len(parent.keys) <= self.order:
+                return
+            mid = len(parent.keys) // 2
+            sep = parent.keys[mid]
+            new = BTreeNode(parent.keys[mid + 1:], parent.children[mid + 1:])
+            del parent.keys[mid:]
+            del parent.children[mid + 1:]
+        self.root = BTreeNode([sep], [self.root, new])
+
+    def delete(self, key):
+        path = []
+        leaf = self._find_leaf(key, path)
+        i = bisect_left(leaf.keys, key)
+        if i == len(leaf.keys) or leaf.keys[i] != key:
+            return False
+        del leaf.keys[i]
+        self._size -= 1
+        self._rebalance(leaf, path)
+        return True
+
+    def _rebalance(self, node, path):
+        min_keys = self._min_keys
+        while path and len(node.keys) < min_keys:
+            parent, idx = path.pop()
+            left = parent.children[idx - 1] if idx > 0 else None
+            right = parent.children[idx + 1] if idx + 1 < len(parent.children) else None
+            if node.children is None:
+                if left and len(left.keys) > min_keys:
+                    node.keys.insert(0, left.keys.pop())
+                    parent.keys[idx - 1] = node.keys[0]
+                    return
+                if right and len(right.keys) > min_keys:
+                    node.keys.append(right.keys.pop(0))
+                    parent.keys[idx] = right.keys[0]
+                    return
+                if left:
+                    left.keys.extend(node.keys)
+                    left.next = node.next
+                    del parent.keys[idx - 1]
+                    del parent.children[idx]
+                else:
+                    node.keys.extend(right.keys)
+                    node.next = right.next
+                    del parent.keys[idx]
+                    del parent.children[idx + 1]
+            else:
+                if left and len(left.keys) > min_keys:
+                    node.keys.insert(0, parent.keys[idx - 1])
+                    parent.keys[idx - 1] = left.keys.pop()
+                    node.children.insert(0, left.children.pop())
+                    return
+                if right and len(right.keys) > min_keys:
+                    node.keys.append(parent.keys[idx])
+                    parent.keys[idx] = right.keys.pop(0)
+                    node.children.append(right.children.pop(0))
+                    return
+                if left:
+                    left.keys.append(parent.keys[idx - 1])
+                    left.keys.extend(node.keys)
+                    left.children.extend(node.children)
+                    del parent.keys[idx - 1]
+                    del parent.children[idx]
+                else:
+                    node.keys.append(parent.keys[idx])
+                    node.keys.extend(right.keys)
+                    node.children.extend(right.children)
+                    del parent.keys[idx]
+                    del parent.children[idx + 1]
+            node = parent
+        if self.root.children is not None and not self.root.keys:
+            self.root = self.root.children[0]
+
+    def range_scan(self, lo, hi):
+        """All keys k with lo <= k <= hi, in order, by walking the leaf chain."""
+        leaf = self._find_leaf(lo)
+        out = []
+        i = bisect_left(leaf.keys, lo)
+        while leaf:
+            keys = leaf.keys
+            j = bisect_right(keys, hi)
+            out.extend(keys[i:j])
+            if j < len(keys):
+                break
+            leaf = leaf.next
+            i = 0
+        return out
+
+    @property
+    def height(self):
+        h, node = 1, self.root
+        while node.children is not None:
+            node = node.children[0]
+            h += 1
+        return h
+
+    def __iter__(self):
+        node = self.root
+        while node.children is not None:
+            node = node.children[0]
+        while node:
+            yield from node.keys
+            node = node.next
+
+    def __len__(self):
+        return self._size
@@ -0,0 +1,182 @@
+from src.ds.hash_table import HashTable
+
+
+class CacheNode:
+    __slots__ = ("key", "value", "freq", "prev", "next")
+    def __init__(self, key=None, value=None):
+        self.key = key
+        self.value = value
+        self.freq = 1
+        self.prev = None
+        self.next = None
+
+
+class _NodeList:
+    """Circular doubly linked list with a sentinel; front is most recent."""
+    __slots__ = ("head", "size")
+    def __init__(self):
+        self.head = CacheNode()
+        self.head.prev = self.head.next = self.head
+        self.size = 0
+
+    def push_front(self, node):
+        node.prev = self.head
+        node.next = self.head.next
+        self.head.next.prev = node
+        self.head.next = node
+        self.size += 1
+
+    def unlink(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+
+    def pop_back(self):
+        node = self.head.prev
+        if node is self.head:
+            return None
+        self.unlink(node)
+        return node
+
+
+class _BoundedCache:
+    """Shared hit/miss accounting for the eviction policies below."""
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        # twice the capacity keeps HashTable chains short at full occupancy
+        self.table = HashTable(capacity=max(16, capacity * 2))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __contains__(self, key):
+        return self.table.get(key) is not None
+
+    def __len__(self):
+        return len(self.table)
+
+
+class LRUCache(_BoundedCache):
+    """O(1) least-recently-used cache: HashTable index over a doubly linked recency list."""
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._order = _NodeList()
+
+    def get(self, key):
+        node = self.table.get(key)
+        if node is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._order.unlink(node)
+        self._order.push_front(node)
+        return node.value
+
+    def put(self, key, value):
+        node = self.table.get(key)
+        if node is not None:
+            node.value = value
+            self._order.unlink(node)
+            self._order.push_front(node)
+            return
+        if len(self.table) >= self.capacity:
+            victim = self._order.pop_back()
+            self.table.delete(victim.key)
+            self.evictions += 1
+        node = CacheNode(key, value)
+        self.table.put(key, node)
+        self._order.push_front(node)
+
+
+class LFUCache(_BoundedCache):
+    """O(1) least-frequently-used cache; ties inside a frequency evict the least recent."""
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._freqs = {}  # freq -> _NodeList
+        self._min_freq = 0
+
+    def _touch(self, node):
+        bucket = self._freqs[node.freq]
+        bucket.unlink(node)
+        if bucket.size == 0:
+            del self._freqs[node.freq]
+            if self._min_freq == node.freq:
+                self._min_freq += 1
+        node.freq += 1
+        self._freqs.setdefault(node.freq, _NodeList()).push_front(node)
+
+    def get(self, key):
+        node = self.table.get(key)
+        if node is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch(node)
+        return node.value
+
+    def put(self, key, value):
+        node = self.table.get(key)
+        if node is not None:
+            node.value = value
+            self._touch(node)
+            return
+        if len(self.table) >= self.capacity:
+            bucket = self._freqs[self._min_freq]
+            victim = bucket.pop_back()
+            if bucket.size == 0:
+                del self._freqs[self._min_freq]
+            self.table.delete(victim.key)
+            self.evictions += 1
+        node = CacheNode(key, value)
+        self.table.put(key, node)
+        self._freqs.setdefault(1, _NodeList()).push_front(node)
+        self._min_freq = 1
+
+
+class ClockCache(_BoundedCache):
+    """CLOCK (second-chance) approximation of LRU over fixed slot arrays."""
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._keys = [None] * capacity
+        self._values = [None] * capacity
+        self._ref = bytearray(capacity)
+        self._hand = 0
+        self._used = 0
+
+    def get(self, key):
+        slot = self.table.get(key)
+        if slot is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._ref[slot] = 1
+        return self._values[slot]
+
+    def put(self, key, value):
+        slot = self.table.get(key)
+        if slot is not None:
+            self._values[slot] = value
+            self._ref[slot] = 1
+            return
+        if self._used < self.capacity:
+            slot = self._used
+            self._used += 1
+        else:
+            while self._ref[self._hand]:
+                self._ref[self._hand] = 0
+                self._hand = (self._hand + 1) % self.capacity
+            slot = self._hand
+            self._hand = (self._hand + 1) % self.capacity
+            self.table.delete(self._keys[slot])
+            self.evictions += 1
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._ref[slot] = 0
+        self.table.put(key, slot)
@@ -0,0 +1,142 @@
+import threading
+
+from src.ds.hash_table import HashTable
+
+
+class ConcurrentHashTable:
+    """
+    Thread-safe separate chaining hash table with one lock per stripe of buckets.
+
+    Each bucket is an immutable tuple of (key, value) pairs that writers replace
+    wholesale while holding the bucket's stripe lock. Readers never lock: loading
+    a bucket reference is atomic, so `get` sees either the old or the new chain.
+    """
+    def __init__(self, capacity=1024, stripes=16):
+        self.capacity = capacity
+        self.stripes = max(1, min(stripes, capacity))
+        self.buckets = [()] * capacity
+        self._locks = [threading.Lock() for _ in range(self.stripes)]
+        self._counts = [0] * self.stripes  # per-stripe sizes, each guarded by its stripe lock
+
+    def _index(self, key):
+        return hash(key) % self.capacity
+
+    def _stripe(self, idx):
+        return idx % self.stripes
+
+    def put(self, key, value):
+        idx = self._index(key)
+        stripe = self._stripe(idx)
+        with self._locks[stripe]:
+            bucket = self.buckets[idx]
+            for i, (k, _) in enumerate(bucket):
+                if k == key:
+                    self.buckets[idx] = bucket[:i] + ((key, value),) + bucket[i + 1:]
+                    return
+            self.buckets[idx] = bucket + ((key, value),)
+            self._counts[stripe] += 1
+
+    def get(self, key):
+        for k, v in self.buckets[self._index(key)]:
+            if k == key:
+                return v
+        return None
+
+    def delete(self, key):
+        idx = self._index(key)
+        stripe = self._stripe(idx)
+        with self._locks[stripe]:
+            bucket = self.buckets[idx]
+            for i, (k, _) in enumerate(bucket):
+                if k == key:
+                    self.buckets[idx] = bucket[:i] + bucket[i + 1:]
+                    self._counts[stripe] -= 1
+                    return True
+        return False
+
+    def contains(self, key):
+        return self.get(key) is not None
+
+    def put_if_absent(self, key, value):
+        """Atomically insert `value` unless `key` exists; returns the existing value or None."""
+        idx = self._index(key)
+        stripe = self._stripe(idx)
+        with self._locks[stripe]:
+            bucket = self.buckets[idx]
+            for k, v in bucket:
+                if k == key:
+                    return v
+            self.buckets[idx] = bucket + ((key, value),)
+            self._counts[stripe] += 1
+            return None
+
+    def compute(self, key, fn):
+        """
+        Atomically replace the value for `key` with fn(current), where current is
+        None when absent. Returning None removes the key. Returns the new value.
+        `fn` runs under the stripe lock, so it must not touch this table.
+        """
+        idx = self._index(key)
+        stripe = self._stripe(idx)
+        with self._locks[stripe]:
+            bucket = self.buckets[idx]
+            for i, (k, v) in enumerate(bucket):
+                if k == key:
+                    new = fn(v)
+                    if new is None:
+                        self.buckets[idx] = bucket[:i] + bucket[i + 1:]
+                        self._counts[stripe] -= 1
+                    else:
+                        self.buckets[idx] = bucket[:i] + ((key, new),) + bucket[i + 1:]
+                    return new
+            new = fn(None)
+            if new is not None:
+                self.buckets[idx] = bucket + ((key, new),)
+                self._counts[stripe] += 1
+            return new
+
+    def __len__(self):
+        return sum(self._counts)
+
+
+class GlobalLockHashTable:
+    """`HashTable` behind a single lock: the baseline that striping is measured against."""
+    def __init__(self, capacity=1024):
+        self.table = HashTable(capacity=capacity)
+        self.capacity = capacity
+        self._lock = threading.Lock()
+
+    def put(self, key, value):
+        with self._lock:
+            self.table.put(key, value)
+
+    def get(self, key):
+        with self._lock:
+            return self.table.get(key)
+
+    def delete(self, key):
+        with self._lock:
+            return self.table.delete(key)
+
+    def contains(self, key):
+        return self.get(key) is not None
+
+    def put_if_absent(self, key, value):
+        with self._lock:
+            current = self.table.get(key)
+            if current is None:
+                self.table.put(key, value)
+            return current
+
+    def compute(self, key, fn):
+        with self._lock:
+            new = fn(self.table.get(key))
+            if new is None:
+                self.table.delete(key)
+            else:
+                self.table.put(key, new)
+            return new
+
+    def __len__(self):
+        with self._lock:
+            return len(self.table)
@@ -0,0 +1,54 @@
+class DisjointSet:
+    """Union-find with path compression and union by rank; tracks component sizes."""
+    def __init__(self, items=None):
+        self.parent = {}
+        self.rank = {}
+        self.size = {}
+        self.components = 0
+        if items:
+            for x in items:
+                self.add(x)
+
+    def add(self, x):
+        if x in self.parent:
+            return False
+        self.parent[x] = x
+        self.rank[x] = 0
+        self.size[x] = 1
+        self.components += 1
+        return True
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:  # compress the path behind us
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size.pop(rb)
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+        del self.rank[rb]  # only roots keep rank/size entries
+        self.components -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x):
+        return self.size[self.find(x)]
+
+    def __contains__(self, x):
+        return x in self.parent
+
+    def __len__(self):
+        return len(self.parent)
@@ -0,0 +1,78 @@
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+
+class FrozenHashTable:
+    """
+    Read-only HashTable over flat int64 arrays in CSR layout: bucket b's
+    entries are keys/values[offsets[b]:offsets[b + 1]]. Works directly on
+    memory-mapped arrays; scalar reads go through memoryviews (Python ints,
+    no NumPy scalar boxing).
+    """
+    def __init__(self, offsets, keys, values):
+        self.offsets, self.keys, self.values = offsets, keys, values
+        self.capacity = len(offsets) - 1
+        self._off, self._keys, self._values = memoryview(offsets), memoryview(keys), memoryview(values)
+
+    def get(self, key):
+        b = hash(key) % self.capacity
+        keys = self._keys
+        for j in range(self._off[b], self._off[b + 1]):
+            if keys[j] == key:
+                return self._values[j]
+        return None
+
+    def contains(self, key):
+        return self.get(key) is not None
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class FrozenBST:
+    """Read-only BST as parallel arrays: node i has keys[i] and child indexes left[i] / right[i] (-1 = none)."""
+    def __init__(self, keys, left, right, root):
+        self.keys, self.left, self.right = keys, left, right
+        self.root = root
+        self._keys, self._left, self._right = memoryview(keys), memoryview(left), memoryview(right)
+
+    def search(self, key):
+        keys, left, right = self._keys, self._left, self._right
+        i = self.root
+        while i != -1:
+            k = keys[i]
+            if key == k:
+                return True
+            i = left[i] if key < k else right[i]
+        return False
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class FrozenBTree:
+    """Read-only B+-tree leaf level: one sorted key array, searched with bisect or np.searchsorted."""
+    def __init__(self, keys):
+        self.keys = keys
+        self._keys = memoryview(keys)
+
+    def search(self, key):
+        i = bisect_left(self._keys, key)
+        return i < len(self._keys) and self._keys[i] == key
+
+    def search_many(self, probes):
+        """Vectorized membership for an array of keys."""
+        probes = np.asarray(probes, dtype=self.keys.dtype)
+        idx = np.minimum(np.searchsorted(self.keys, probes), max(0, len(self.keys) - 1))
+        return self.keys[idx] == probes if len(self.keys) else np.zeros(len(probes), dtype=bool)
+
+    def range_scan(self, lo, hi):
+        """Keys in [lo, hi] as an array view (no copy)."""
+        return self.keys[bisect_left(self._keys, lo):bisect_right(self._keys, hi)]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self.keys)
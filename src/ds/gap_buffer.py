@@ -0,0 +1,98 @@
+class GapBufferArrayDS:
+    """
+    Array with a movable gap at the edit cursor, as used by text editors.
+    Inserting at the cursor fills the gap in O(1); moving the cursor by k
+    positions copies k elements; a full gap is regrown proportionally to the
+    length, so repeated edits near one position are O(1) amortized.
+    Shares the ArrayDS interface.
+    """
+    def __init__(self, iterable=None, gap=16):
+        values = list(iterable) if iterable is not None else []
+        self._min_gap = max(1, gap)
+        self._buf = values + [None] * self._min_gap
+        self._gap_start = len(values)
+        self._gap_end = len(self._buf)
+
+    @property
+    def cursor(self):
+        return self._gap_start
+
+    @property
+    def data(self):
+        """Copy of the contents in order (the buffer itself contains the gap)."""
+        return self._buf[:self._gap_start] + self._buf[self._gap_end:]
+
+    def _grow(self):
+        extra = max(self._min_gap, len(self))
+        self._buf[self._gap_end:self._gap_end] = [None] * extra
+        self._gap_end += extra
+
+    def move_cursor(self, pos):
+        pos = max(0, min(pos, len(self)))
+        buf, gs, ge = self._buf, self._gap_start, self._gap_end
+        if pos < gs:
+            k = gs - pos
+            buf[ge - k:ge] = buf[pos:gs]
+            self._gap_start, self._gap_end = pos, ge - k
+            # release references left behind in the slots that are now gap
+            clear_end = min(gs, self._gap_end)
+            buf[pos:clear_end] = [None] * (clear_end - pos)
+        elif pos > gs:
+            k = pos - gs
+            buf[gs:pos] = buf[ge:ge + k]
+            self._gap_start, self._gap_end = pos, ge + k
+            clear_start = max(ge, self._gap_start)
+            buf[clear_start:self._gap_end] = [None] * (self._gap_end - clear_start)
+
+    def insert(self, value):
+        """Insert at the cursor and advance past it."""
+        if self._gap_start == self._gap_end:
+            self._grow()
+        self._buf[self._gap_start] = value
+        self._gap_start += 1
+
+    def insert_at(self, index, value):
+        self.move_cursor(index)
+        self.insert(value)
+
+    def append(self, value):
+        self.insert_at(len(self), value)
+
+    def insert_front(self, value):
+        self.insert_at(0, value)
+
+    def _delete_at(self, index):
+        self.move_cursor(index)
+        self._buf[self._gap_end] = None
+        self._gap_end += 1
+
+    def pop_back(self):
+        if len(self):
+            self._delete_at(len(self) - 1)
+
+    def _index(self, value):
+        try:
+            return self._buf.index(value, 0, self._gap_start)
+        except ValueError:
+            pass
+        try:
+            return self._buf.index(value, self._gap_end) - (self._gap_end - self._gap_start)
+        except ValueError:
+            return -1
+
+    def remove_value(self, value):
+        i = self._index(value)
+        if i < 0:
+            return False
+        self._delete_at(i)
+        return True
+
+    def search_linear(self, value):
+        return self._index(value) >= 0
+
+    def __iter__(self):
+        yield from self._buf[:self._gap_start]
+        yield from self._buf[self._gap_end:]
+
+    def __len__(self):
+        return len(self._buf) - (self._gap_end - self._gap_start)
@@ -1,27 +1,81 @@
 from collections import deque
+import heapq
+
+from src.ds.disjoint_set import DisjointSet
+from src.ds.indexed_heap import IndexedMinHeap
 
 class Graph:
     """Undirected graph via adjacency list."""
-    def __init__(self):
+    def __init__(self, track_stats=True):
         self.adj = {}
         self._edges = 0
+        self._weights = {}  # (u, v) -> weight, stored both ways; edges absent here weigh 1
+        # connectivity index: kept current on inserts, rebuilt lazily after a delete
+        self._components = DisjointSet()
+        self._components_stale = False
+        # highest degree: kept current on add_edge when tracking, otherwise (and after a delete) recounted
+        self.track_stats = track_stats
+        self._max_degree = 0
+        self._max_degree_stale = not track_stats
 
     def add_node(self, u):
         if u not in self.adj:
             self.adj[u] = set()
+            if not self._components_stale:
+                self._components.add(u)
 
-    def add_edge(self, u, v):
+    def add_edge(self, u, v, weight=1):
+        if weight < 0:
+            raise ValueError("edge weights must be non-negative")
         self.add_node(u)
         self.add_node(v)
         if v not in self.adj[u]:
             self.adj[u].add(v)
             self.adj[v].add(u)
             self._edges += 1
+            if self.track_stats and (len(self.adj[u]) > self._max_degree or len(self.adj[v]) > self._max_degree):
+                self._max_degree = max(len(self.adj[u]), len(self.adj[v]))
+            if not self._components_stale:
+                self._components.union(u, v)
+        if weight != 1:
+            self._weights[(u, v)] = self._weights[(v, u)] = weight
+        elif self._weights:
+            self._weights.pop((u, v), None)
+            self._weights.pop((v, u), None)
+
+    def weight(self, u, v):
+        return self._weights.get((u, v), 1)
 
-    def bfs_search(self, target):
+    def _connectivity(self):
+        if self._components_stale:
+            dsu = DisjointSet(self.adj)
+            for u, neighbours in self.adj.items():
+                for v in neighbours:
+                    dsu.union(u, v)
+            self._components = dsu
+            self._components_stale = False
+        return self._components
+
+    def connected(self, u, v):
+        if u not in self.adj or v not in self.adj:
+            return False
+        return self._connectivity().connected(u, v)
+
+    def component_count(self):
+        return self._connectivity().components
+
+    def component_size(self, u):
+        if u not in self.adj:
+            return 0
+        return self._connectivity().component_size(u)
+
+    def bfs_search(self, target, start=None):
         if not self.adj:
             return False
-        start = next(iter(self.adj))
+        if start is None:
+            start = next(iter(self.adj))
+        elif start not in self.adj:
+            return False
         visited = {start}
         q = deque([start])
         while q:
@@ -34,13 +88,90 @@ class Graph:
                     q.append(nei)
         return False
 
+    def dijkstra(self, source, target=None, lazy=False):
+        """
+        Shortest-path distances from source. Returns (dist, settled) where dist
+        maps every settled node to its distance. Stops once target is settled.
+        The default heap updates entries in place (decrease-key); lazy=True
+        pushes duplicates onto a heapq list and skips stale pops instead.
+        """
+        if source not in self.adj:
+            return {}, 0
+        weights = self._weights
+        dist = {}
+        if lazy:
+            heap = [(0, source)]
+            best = {source: 0}
+            while heap:
+                d, u = heapq.heappop(heap)
+                if u in dist:
+                    continue  # stale duplicate
+                dist[u] = d
+                if u == target:
+                    break
+                for v in self.adj[u]:
+                    if v in dist:
+                        continue
+                    nd = d + (weights.get((u, v), 1) if weights else 1)
+                    if nd < best.get(v, float("inf")):
+                        best[v] = nd
+                        heapq.heappush(heap, (nd, v))
+            return dist, len(dist)
+        heap = IndexedMinHeap()
+        heap.push(source, 0)
+        while heap:
+            u, d = heap.pop()
+            dist[u] = d
+            if u == target:
+                break
+            for v in self.adj[u]:
+                if v not in dist:
+                    heap.push_or_decrease(v, d + (weights.get((u, v), 1) if weights else 1))
+        return dist, len(dist)
+
+    def astar(self, source, target, heuristic=None):
+        """
+        A* search from source to target. heuristic(u, target) must be
+        consistent (e.g. Manhattan distance times the smallest edge weight on
+        a grid) so settled nodes never reopen. Returns (distance, settled),
+        with distance = inf when target is unreachable.
+        """
+        if source not in self.adj or target not in self.adj:
+            return float("inf"), 0
+        if heuristic is None:
+            heuristic = lambda u, t: 0  # plain Dijkstra with early exit
+        weights = self._weights
+        g_score = {source: 0}
+        closed = set()
+        heap = IndexedMinHeap()
+        heap.push(source, heuristic(source, target))
+        while heap:
+            u, _ = heap.pop()
+            closed.add(u)
+            if u == target:
+                return g_score[u], len(closed)
+            g = g_score[u]
+            for v in self.adj[u]:
+                if v in closed:
+                    continue
+                ng = g + (weights.get((u, v), 1) if weights else 1)
+                if ng < g_score.get(v, float("inf")):
+                    g_score[v] = ng
+                    heap.push_or_decrease(v, ng + heuristic(v, target))
+        return float("inf"), len(closed)
+
     def delete_node(self, u):
         if u not in self.adj:
             return False
         for v in list(self.adj[u]):
             self.adj[v].remove(u)
             self._edges -= 1
+            if self._weights:
+                self._weights.pop((u, v), None)
+                self._weights.pop((v, u), None)
         del self.adj[u]
+        self._components_stale = True  # union-find cannot split a set
+        self._max_degree_stale = True
         return True
 
     def node_count(self):
@@ -48,3 +179,21 @@ class Graph:
 
     def edge_count(self):
         return self._edges
+
+    def degree_histogram(self):
+        """Number of nodes with degree 0, 1, 2, ... (a full scan, not for hot paths)."""
+        counts = [0] * (max((len(n) for n in self.adj.values()), default=0) + 1)
+        for neighbours in self.adj.values():
+            counts[len(neighbours)] += 1
+        return counts
+
+    def stats(self):
+        """Mean and max degree; a max far above the mean means hubs dominate traversal cost."""
+        if self._max_degree_stale:
+            self._max_degree = max((len(n) for n in self.adj.values()), default=0)
+            self._max_degree_stale = not self.track_stats
+        nodes = len(self.adj)
+        return {
+            "mean_degree": 2 * self._edges / nodes if nodes else 0.0,
+            "max_degree": self._max_degree,
+        }
@@ -1,9 +1,14 @@
 class HashTable:
     """Simple separate chaining hash table for integer-like keys."""
-    def __init__(self, capacity=1024):
+    def __init__(self, capacity=1024, track_stats=True):
         self.capacity = capacity
         self.buckets = [[] for _ in range(capacity)]
         self._size = 0
+        # chain stats: kept current on put when tracking, otherwise (and after a delete) recounted by stats()
+        self.track_stats = track_stats
+        self._used_buckets = 0
+        self._max_chain = 0
+        self._chains_stale = not track_stats
 
     def _index(self, key):
         return hash(key) % self.capacity
@@ -17,6 +22,11 @@ class HashTable:
                 return
         bucket.append((key, value))
         self._size += 1
+        if self.track_stats:
+            if len(bucket) == 1:
+                self._used_buckets += 1
+            if len(bucket) > self._max_chain:
+                self._max_chain = len(bucket)
 
     def get(self, key):
         idx = self._index(key)
@@ -32,11 +42,37 @@ class HashTable:
             if k == key:
                 bucket.pop(i)
                 self._size -= 1
+                self._chains_stale = True  # the longest chain may have shrunk
                 return True
         return False
 
     def contains(self, key):
         return self.get(key) is not None
 
+    def _recount(self):
+        """Recompute size and chain stats from the buckets (after deletes or a direct rebuild)."""
+        lengths = [len(b) for b in self.buckets]
+        self._size = sum(lengths)
+        self._used_buckets = self.capacity - lengths.count(0)
+        self._max_chain = max(lengths, default=0)
+        self._chains_stale = not self.track_stats
+
+    def chain_lengths(self):
+        """Number of buckets holding 0, 1, 2, ... entries (a full scan, not for hot paths)."""
+        counts = [0] * (max((len(b) for b in self.buckets), default=0) + 1)
+        for bucket in self.buckets:
+            counts[len(bucket)] += 1
+        return counts
+
+    def stats(self):
+        """Load factor and chain lengths (mean over non-empty buckets): the cost of a get."""
+        if self._chains_stale:
+            self._recount()
+        return {
+            "load_factor": self._size / self.capacity,
+            "max_chain": self._max_chain,
+            "mean_chain": self._size / self._used_buckets if self._used_buckets else 0.0,
+        }
+
     def __len__(self):
         return self._size
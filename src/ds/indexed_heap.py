@@ -0,0 +1,85 @@
+class IndexedMinHeap:
+    """
+    Binary min-heap over (priority, item) with a position index, so an item's
+    priority can be lowered in place (decrease-key) in O(log n).
+    """
+    def __init__(self):
+        self._heap = []  # [priority, item] pairs
+        self._pos = {}   # item -> index in _heap
+
+    def _swap(self, i, j):
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._pos[heap[i][1]] = i
+        self._pos[heap[j][1]] = j
+
+    def _sift_up(self, i):
+        heap = self._heap
+        while i > 0:
+            parent = (i - 1) >> 1
+            if heap[i][0] >= heap[parent][0]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i):
+        heap = self._heap
+        n = len(heap)
+        while True:
+            smallest = i
+            left = 2 * i + 1
+            if left < n and heap[left][0] < heap[smallest][0]:
+                smallest = left
+            if left + 1 < n and heap[left + 1][0] < heap[smallest][0]:
+                smallest = left + 1
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
+
+    def push(self, item, priority):
+        if item in self._pos:
+            raise KeyError(f"{item!r} already in heap")
+        self._heap.append([priority, item])
+        self._pos[item] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def decrease_key(self, item, priority):
+        i = self._pos[item]
+        if priority > self._heap[i][0]:
+            raise ValueError("new priority is larger than the current one")
+        self._heap[i][0] = priority
+        self._sift_up(i)
+
+    def push_or_decrease(self, item, priority):
+        """Insert the item or lower its priority; returns False if the current priority is already lower."""
+        i = self._pos.get(item)
+        if i is None:
+            self.push(item, priority)
+            return True
+        if priority >= self._heap[i][0]:
+            return False
+        self._heap[i][0] = priority
+        self._sift_up(i)
+        return True
+
+    def pop(self):
+        """Remove and return (item, priority) with the smallest priority."""
+        heap = self._heap
+        if not heap:
+            raise IndexError("pop from empty heap")
+        self._swap(0, len(heap) - 1)
+        priority, item = heap.pop()
+        del self._pos[item]
+        if heap:
+            self._sift_down(0)
+        return item, priority
+
+    def priority(self, item):
+        return self._heap[self._pos[item]][0]
+
+    def __contains__(self, item):
+        return item in self._pos
+
+    def __len__(self):
+        return len(self._heap)
@@ -0,0 +1,77 @@
+import numpy as np
+
+
+class NumpyArrayDS:
+    """
+    Typed integer array on a NumPy buffer with amortized doubling growth.
+    Bulk membership and removal run vectorized instead of one Python call per key.
+    """
+    def __init__(self, iterable=None, dtype=np.int64, capacity=16):
+        if iterable is None:
+            iterable = []
+        values = np.asarray(iterable if isinstance(iterable, np.ndarray) else list(iterable), dtype=dtype)
+        self._buf = np.empty(max(capacity, len(values)), dtype=dtype)
+        self._buf[:len(values)] = values
+        self._len = len(values)
+
+    @property
+    def data(self):
+        """Live view of the used prefix (no copy)."""
+        return self._buf[:self._len]
+
+    def _reserve(self, needed):
+        if needed <= len(self._buf):
+            return
+        new_cap = max(needed, 2 * len(self._buf), 16)
+        buf = np.empty(new_cap, dtype=self._buf.dtype)
+        buf[:self._len] = self._buf[:self._len]
+        self._buf = buf
+
+    def append(self, value):
+        self._reserve(self._len + 1)
+        self._buf[self._len] = value
+        self._len += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._buf.dtype)
+        self._reserve(self._len + len(values))
+        self._buf[self._len:self._len + len(values)] = values
+        self._len += len(values)
+
+    def insert_front(self, value):
+        self._reserve(self._len + 1)
+        self._buf[1:self._len + 1] = self._buf[:self._len]  # overlapping copy is memmove-safe
+        self._buf[0] = value
+        self._len += 1
+
+    def pop_back(self):
+        if self._len:
+            self._len -= 1
+
+    def remove_value(self, value):
+        hits = np.flatnonzero(self.data == value)
+        if not len(hits):
+            return False
+        i = int(hits[0])
+        self._buf[i:self._len - 1] = self._buf[i + 1:self._len]
+        self._len -= 1
+        return True
+
+    def search_linear(self, value):
+        return bool((self.data == value).any())
+
+    def search_many(self, values):
+        """Boolean array: membership of each of `values` (np.isin)."""
+        return np.isin(np.asarray(values, dtype=self._buf.dtype), self.data)
+
+    def remove_many(self, values):
+        """Remove every occurrence of each of `values`; returns how many elements were removed."""
+        keep = np.isin(self.data, np.asarray(values, dtype=self._buf.dtype), invert=True)
+        kept = self.data[keep]
+        removed = self._len - len(kept)
+        self._buf[:len(kept)] = kept
+        self._len = len(kept)
+        return removed
+
+    def __len__(self):
+        return self._len
@@ -0,0 +1,157 @@
+class UnrolledNode:
+    __slots__ = ("values", "count", "next")
+    def __init__(self, capacity):
+        self.values = [None] * capacity  # fixed-capacity chunk; slots past `count` stay None
+        self.count = 0
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    Linked list whose nodes hold a fixed-capacity array of values. Scanning a
+    chunk is a C-level list search, so a lookup does n / chunk_size pointer
+    hops instead of n. Full nodes split in half on insert; nodes that fall
+    below half full borrow from or merge with their successor on delete.
+    """
+    def __init__(self, iterable=None, chunk_size=64):
+        if chunk_size < 2:
+            raise ValueError("chunk_size must be at least 2")
+        self.chunk_size = chunk_size
+        self.head = None
+        self.tail = None
+        self._size = 0
+        if iterable:
+            for item in iterable:
+                self.append(item)
+
+    def _new_node(self):
+        return UnrolledNode(self.chunk_size)
+
+    def append(self, value):
+        tail = self.tail
+        if tail is None or tail.count == self.chunk_size:
+            # appends fill a fresh node instead of splitting, so append-built lists stay dense
+            node = self._new_node()
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            self.tail = tail = node
+        tail.values[tail.count] = value
+        tail.count += 1
+        self._size += 1
+
+    def _split(self, node):
+        half = node.count // 2
+        new = self._new_node()
+        moved = node.count - half
+        new.values[:moved] = node.values[half:node.count]
+        new.count = moved
+        node.values[half:node.count] = [None] * moved
+        node.count = half
+        new.next = node.next
+        node.next = new
+        if self.tail is node:
+            self.tail = new
+        return new
+
+    def insert(self, index, value):
+        """Insert before position `index` (clamped to [0, len])."""
+        if index >= self._size or self.head is None:
+            self.append(value)
+            return
+        index = max(0, index)
+        node = self.head
+        while index > node.count:
+            index -= node.count
+            node = node.next
+        if node.count == self.chunk_size:
+            new = self._split(node)
+            if index > node.count:
+                index -= node.count
+                node = new
+        vals = node.values
+        vals[index + 1:node.count + 1] = vals[index:node.count]
+        vals[index] = value
+        node.count += 1
+        self._size += 1
+
+    def _locate(self, value):
+        """Return (prev, node, index) of the first occurrence, or (None, None, -1)."""
+        prev = None
+        node = self.head
+        if value is None:
+            # empty slots hold None, so bound the scan to each node's live prefix
+            while node:
+                if None in node.values[:node.count]:
+                    return prev, node, node.values.index(None, 0, node.count)
+                prev, node = node, node.next
+            return None, None, -1
+        while node:
+            vals = node.values
+            if value in vals:  # C-level scan of the whole chunk; padding never matches
+                return prev, node, vals.index(value)
+            prev, node = node, node.next
+        return None, None, -1
+
+    def find(self, value):
+        return self._locate(value)[1] is not None
+
+    def delete(self, value):
+        prev, node, idx = self._locate(value)
+        if node is None:
+            return False
+        vals = node.values
+        vals[idx:node.count - 1] = vals[idx + 1:node.count]
+        node.count -= 1
+        vals[node.count] = None
+        self._size -= 1
+        self._rebalance(prev, node)
+        return True
+
+    def _rebalance(self, prev, node):
+        if node.count == 0:
+            if prev:
+                prev.next = node.next
+            else:
+                self.head = node.next
+            if self.tail is node:
+                self.tail = prev
+            return
+        half = self.chunk_size // 2
+        nxt = node.next
+        if node.count >= half or nxt is None:
+            return
+        if node.count + nxt.count <= self.chunk_size:
+            # merge successor into this node
+            node.values[node.count:node.count + nxt.count] = nxt.values[:nxt.count]
+            node.count += nxt.count
+            node.next = nxt.next
+            if self.tail is nxt:
+                self.tail = node
+        else:
+            # borrow from successor until this node is half full
+            take = half - node.count
+            node.values[node.count:node.count + take] = nxt.values[:take]
+            node.count += take
+            nxt.values[:nxt.count - take] = nxt.values[take:nxt.count]
+            nxt.values[nxt.count - take:nxt.count] = [None] * take
+            nxt.count -= take
+
+    def node_count(self):
+        count = 0
+        node = self.head
+        while node:
+            count += 1
+            node = node.next
+        return count
+
+    def __iter__(self):
+        node = self.head
+        while node:
+            for i in range(node.count):
+                yield node.values[i]
+            node = node.next
+
+    def __len__(self):
+        return self._size
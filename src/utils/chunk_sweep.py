@@ -0,0 +1,56 @@
+"""
+Unrolled list page: effect of chunk size on search and delete throughput
+"""
+import plotly.graph_objects as go
+import streamlit as st
+from src.benchmarks.chunking import chunk_size_sweep, sweep_summary
+
+def show_chunk_sweep_page():
+    st.title("🧩 Unrolled Linked List: Chunk Size Sweep")
+    st.caption("Array-chunked nodes vs the one-value-per-node LinkedList")
+
+    st.sidebar.header("Sweep Configuration")
+    size = int(st.sidebar.number_input("Input size (n)", value=20000, min_value=100, step=5000))
+    chunk_sizes = st.sidebar.multiselect("Chunk sizes", [2, 4, 8, 16, 32, 64, 128, 256, 512, 1024],
+                                         default=[4, 16, 64, 256, 1024])
+    trials = st.sidebar.slider("Trials", 1, 10, 3)
+
+    if not chunk_sizes:
+        st.warning("⚠️ Select at least one chunk size")
+        return
+
+    if st.sidebar.button("🚀 Run Sweep", type="primary"):
+        with st.spinner("⏳ Sweeping chunk sizes..."):
+            st.session_state['chunk_sweep'] = chunk_size_sweep([size], sorted(chunk_sizes), trials=trials)
+
+    df = st.session_state.get('chunk_sweep')
+    if df is None:
+        st.info("👈 Pick chunk sizes and click Run Sweep")
+        return
+
+    summary = sweep_summary(df)
+    col1, col2 = st.columns(2)
+    for col, kind in ((col1, "search"), (col2, "delete")):
+        part = summary[summary["kind"] == kind]
+        if part.empty:
+            continue
+        unrolled = part[part["structure"] == "UnrolledList"]
+        baseline = part[part["structure"] == "LinkedList"]["ops_per_s"]
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=unrolled["chunk_size"], y=unrolled["ops_per_s"],
+                                 mode="lines+markers", name="UnrolledList"))
+        if not baseline.empty:
+            fig.add_hline(y=float(baseline.iloc[0]), line_dash="dash", annotation_text="LinkedList")
+        fig.update_layout(title=f"{kind.title()} throughput", xaxis_type="log",
+                          xaxis_title="Chunk size (values per node)", yaxis_title="Operations / second",
+                          height=400)
+        col.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("Summary")
+    st.dataframe(
+        summary.style.format({"time_ms": "{:.4f}", "ops_per_s": "{:,.0f}", "speedup_vs_linked_list": "{:.2f}x"}),
+        use_container_width=True,
+    )
+
+if __name__ == "__main__":
+    show_chunk_sweep_page()
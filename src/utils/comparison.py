@@ -18,6 +18,9 @@ def show_comparison_page():
         "LinkedList: insert_tail": st.sidebar.checkbox("LinkedList: Insert (tail)", value=True),
         "BST: insert": st.sidebar.checkbox("BST: Insert (random)", value=True),
         "HashTable: put": st.sidebar.checkbox("HashTable: Put", value=True),
+        "Array: insert_front": st.sidebar.checkbox("Array: Insert (front)", value=False),
+        "Deque: insert_front": st.sidebar.checkbox("Deque: Insert (front)", value=False),
+        "GapBuffer: insert_front": st.sidebar.checkbox("GapBuffer: Insert (front)", value=False),
         "Array: search": st.sidebar.checkbox("Array: Search", value=False),
         "LinkedList: search": st.sidebar.checkbox("LinkedList: Search", value=False),
         "BST: search": st.sidebar.checkbox("BST: Search", value=False),
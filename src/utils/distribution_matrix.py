@@ -0,0 +1,68 @@
+"""
+Distribution page: heatmap of operation vs input key distribution
+"""
+import plotly.graph_objects as go
+import streamlit as st
+from src.benchmarks.matrix import distribution_operations, matrix_pivot, run_distribution_matrix
+from src.utils.workloads import KEY_DISTRIBUTIONS
+
+def show_distribution_page():
+    st.title("🎲 Input Distribution Matrix")
+    st.caption("Median time of each operation under adversarial and skewed key distributions")
+
+    st.sidebar.header("Matrix Configuration")
+    all_ops = distribution_operations()
+    operations = st.sidebar.multiselect(
+        "Operations", all_ops,
+        default=[op for op in all_ops if op.startswith(("BST", "HashTable"))],
+    )
+    distributions = st.sidebar.multiselect("Distributions", list(KEY_DISTRIBUTIONS), default=list(KEY_DISTRIBUTIONS))
+    size = int(st.sidebar.number_input("Input size (n)", value=2000, min_value=10, step=500))
+    trials = st.sidebar.slider("Trials per cell", 1, 10, 3)
+    normalize = st.sidebar.checkbox("Show relative to uniform", value=True,
+                                    help="Divide each row by its uniform-distribution time")
+
+    if not operations or not distributions:
+        st.warning("⚠️ Select at least one operation and one distribution")
+        return
+
+    if st.sidebar.button("🚀 Run Matrix", type="primary"):
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+
+        def progress(done, total, op, dist):
+            status_text.text(f"Running {op} on {dist} keys... ({done}/{total})")
+            progress_bar.progress(done / total)
+
+        result_df = run_distribution_matrix(operations, distributions, size, trials, progress=progress)
+        progress_bar.empty()
+        status_text.text("✅ Matrix complete!")
+        st.session_state['distribution_matrix'] = result_df
+
+    result_df = st.session_state.get('distribution_matrix')
+    if result_df is None:
+        st.info("👈 Pick operations and distributions, then click Run Matrix")
+        return
+
+    relative = normalize and "uniform" in set(result_df["distribution"])
+    pivot = matrix_pivot(result_df, normalize=relative)
+    fig = go.Figure(go.Heatmap(
+        z=pivot.values,
+        x=list(pivot.columns),
+        y=list(pivot.index),
+        colorscale="RdYlGn_r",
+        text=[[f"{v:.2f}x" if relative else f"{v:.4f}" for v in row] for row in pivot.values],
+        texttemplate="%{text}",
+        colorbar=dict(title="× uniform" if relative else "ms"),
+    ))
+    fig.update_layout(height=max(400, 40 * len(pivot.index)), xaxis_title="Key distribution")
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("Median Time (ms)")
+    st.dataframe(matrix_pivot(result_df).style.format("{:.4f}"), use_container_width=True)
+    csv = result_df.to_csv(index=False).encode('utf-8')
+    st.download_button("📥 Download Raw Data (CSV)", data=csv,
+                       file_name="distribution_matrix_raw.csv", mime="text/csv")
+
+if __name__ == "__main__":
+    show_distribution_page()
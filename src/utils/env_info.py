@@ -0,0 +1,49 @@
+"""
+Environment metadata attached to every recorded benchmark run
+"""
+import hashlib
+import os
+import platform
+import socket
+import subprocess
+import sys
+import sysconfig
+from typing import Dict, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def git_commit(short: bool = False) -> str:
+    """Return the current git commit hash, or 'unknown' outside a git checkout"""
+    cmd = ["git", "rev-parse", "--short", "HEAD"] if short else ["git", "rev-parse", "HEAD"]
+    try:
+        out = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return out.stdout.strip() if out.returncode == 0 and out.stdout.strip() else "unknown"
+
+
+def run_metadata() -> Dict[str, object]:
+    """Collect commit, interpreter and host details for the current process"""
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    return {
+        "git_commit": git_commit(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        # free-threaded builds share a version with the default build but not its timings
+        "interpreter": f"{platform.python_implementation()} {platform.python_version()}" + ("t" if free_threaded else ""),
+        "free_threaded": free_threaded,
+        "python_executable": sys.executable,
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count() or 0,
+    }
+
+
+def machine_fingerprint(meta: Optional[Dict[str, object]] = None) -> str:
+    """Short stable id of the host + interpreter, so results from different machines never mix silently"""
+    meta = meta or run_metadata()
+    keys = ("hostname", "machine", "platform", "cpu_count", "python_implementation", "python_version")
+    raw = "|".join(str(meta.get(k)) for k in keys)
+    return hashlib.sha1(raw.encode()).hexdigest()[:12]
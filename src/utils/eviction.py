@@ -0,0 +1,61 @@
+"""
+Cache page: compare LRU / LFU / CLOCK eviction on replayed key streams
+"""
+import plotly.graph_objects as go
+import streamlit as st
+from src.benchmarks.caching import CACHE_POLICIES, KEY_STREAMS, cache_benchmark
+
+def show_eviction_page():
+    st.title("🗃️ Cache Eviction Policies")
+    st.caption("Hit ratio, throughput and memory per entry for bounded caches built on HashTable")
+
+    st.sidebar.header("Cache Configuration")
+    policies = st.sidebar.multiselect("Policies", list(CACHE_POLICIES), default=list(CACHE_POLICIES))
+    streams = st.sidebar.multiselect("Key streams", list(KEY_STREAMS), default=list(KEY_STREAMS))
+    capacity = int(st.sidebar.number_input("Capacity (entries)", value=1000, min_value=1, step=500))
+    key_space = int(st.sidebar.number_input("Key space", value=20000, min_value=10, step=5000))
+    n_requests = int(st.sidebar.number_input("Requests", value=100000, min_value=1000, step=50000))
+    trials = st.sidebar.slider("Trials", 1, 10, 3)
+
+    if not policies or not streams:
+        st.warning("⚠️ Select at least one policy and one key stream")
+        return
+
+    if st.sidebar.button("🚀 Run Replay", type="primary"):
+        with st.spinner("⏳ Replaying key streams..."):
+            st.session_state['cache_bench'] = cache_benchmark(
+                policies=policies, streams=streams, capacity=capacity,
+                n_requests=n_requests, key_space=key_space, trials=trials,
+            )
+
+    df = st.session_state.get('cache_bench')
+    if df is None:
+        st.info("👈 Configure the replay and click Run Replay")
+        return
+
+    summary = df.groupby(["policy", "stream"]).agg(
+        hit_ratio=("hit_ratio", "mean"),
+        ops_per_s=("ops_per_s", "median"),
+        bytes_per_entry=("bytes_per_entry", "first"),
+    ).reset_index()
+
+    col1, col2 = st.columns(2)
+    for col, metric, title in ((col1, "hit_ratio", "Hit Ratio"), (col2, "ops_per_s", "Operations / second")):
+        fig = go.Figure()
+        for policy, group in summary.groupby("policy"):
+            fig.add_trace(go.Bar(x=group["stream"], y=group[metric], name=policy))
+        fig.update_layout(title=title, barmode="group", height=400, xaxis_title="Key stream")
+        col.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("Summary")
+    st.dataframe(
+        summary.style.format({"hit_ratio": "{:.1%}", "ops_per_s": "{:,.0f}", "bytes_per_entry": "{:.0f} B"})
+        .background_gradient(subset=["hit_ratio"], cmap="RdYlGn"),
+        use_container_width=True,
+    )
+    csv = df.to_csv(index=False).encode('utf-8')
+    st.download_button("📥 Download Raw Data (CSV)", data=csv,
+                       file_name="cache_replay.csv", mime="text/csv")
+
+if __name__ == "__main__":
+    show_eviction_page()
@@ -1,21 +1,21 @@
 """
 Utility functions for data generation and analysis
 """
-import random
 from typing import List
 
+from src.utils.workloads import generate_list
+
 def generate_random_data(n: int, seed: int = 42) -> List[int]:
-    """Generate n random integers"""
-    random.seed(seed)
-    return [random.randint(0, n * 10) for _ in range(n)]
+    """Generate n random integers in [0, 10n] without touching global random state"""
+    return generate_list("random", n, seed)
 
 def generate_sequential_data(n: int) -> List[int]:
     """Generate sequential integers from 0 to n-1"""
-    return list(range(n))
+    return generate_list("sequential", n)
 
 def generate_reverse_data(n: int) -> List[int]:
     """Generate reverse sequential integers"""
-    return list(range(n-1, -1, -1))
+    return generate_list("reverse", n)
 
 def format_time(ms: float) -> str:
     """Format time in human-readable format"""
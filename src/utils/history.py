@@ -0,0 +1,105 @@
+"""
+History page: trends of recorded benchmark runs across commits
+"""
+import streamlit as st
+import plotly.graph_objects as go
+from src.utils.results_db import ResultsDB, DEFAULT_DB_PATH, flag_regressions
+
+def show_history_page(db_path: str = DEFAULT_DB_PATH):
+    st.title("🕘 Benchmark History")
+    st.caption("How an operation's time at a given size changes across commits")
+
+    db = ResultsDB(db_path)
+    try:
+        operations = db.operations()
+        if not operations:
+            st.info("No runs recorded yet. Run a benchmark with **💾 Save run to history** enabled.")
+            return
+
+        st.sidebar.header("History Filters")
+        op = st.sidebar.selectbox("Operation", operations)
+        sizes = db.sizes(op)
+        size = st.sidebar.selectbox("Input size (n)", sizes, index=len(sizes) - 1)
+        runs_df = db.query(operation=op, size=size)
+        hosts = ["All hosts"] + sorted(runs_df["hostname"].dropna().unique().tolist())
+        host = st.sidebar.selectbox("Host", hosts)
+        # runs are only comparable within one key distribution, interpreter and memory setting
+        distribution = st.sidebar.selectbox("Key distribution", ["All"] + sorted(runs_df["distribution"].unique()))
+        interpreter = st.sidebar.selectbox("Interpreter", ["All"] + sorted(runs_df["interpreter"].dropna().unique()))
+        memory = st.sidebar.selectbox("Peak memory measured", ["All", "No", "Yes"],
+                                      help="tracemalloc slows timings down, so these runs form their own series")
+        threshold = st.sidebar.slider("Regression threshold", 1.05, 3.0, 1.2, 0.05,
+                                      help="Flag commits whose median is this many times slower than the best earlier commit")
+
+        trend_df = db.trend(
+            op, size,
+            hostname=None if host == "All hosts" else host,
+            distribution=None if distribution == "All" else distribution,
+            interpreter=None if interpreter == "All" else interpreter,
+            measure_memory=None if memory == "All" else memory == "Yes",
+        )
+        if trend_df.empty:
+            st.warning("No measurements for this selection.")
+            return
+        trend_df = flag_regressions(trend_df, threshold)
+        trend_df["commit"] = trend_df["git_commit"].str[:8]
+        trend_df["series"] = (trend_df["interpreter"].fillna("?") + " · " + trend_df["distribution"]
+                              + trend_df["measure_memory"].map({True: " · memory", False: ""}))
+        series = list(dict.fromkeys(trend_df["series"]))
+        if len(series) > 1:
+            st.info(f"ℹ️ {len(series)} separate series (interpreter · distribution · memory); "
+                    "each is compared only against its own earlier commits.")
+
+        fig = go.Figure()
+        for name in series:
+            part = trend_df[trend_df["series"] == name]
+            label = "" if len(series) == 1 else f" · {name}"
+            fig.add_trace(go.Scatter(
+                x=part["commit"], y=part["median_ms"],
+                mode="lines+markers", name=f"Median{label}",
+                line=dict(width=2), marker=dict(size=8),
+            ))
+            fig.add_trace(go.Scatter(
+                x=part["commit"], y=part["min_ms"],
+                mode="lines", name=f"Min{label}", line=dict(dash="dot"),
+            ))
+        regressions = trend_df[trend_df["regression"]]
+        if not regressions.empty:
+            fig.add_trace(go.Scatter(
+                x=regressions["commit"], y=regressions["median_ms"],
+                mode="markers", name="Regression",
+                marker=dict(size=14, color="red", symbol="x"),
+            ))
+        fig.update_layout(
+            title=f"{op} at n={size:,}",
+            xaxis_title="Commit (oldest → newest)",
+            yaxis_title="Time (ms)",
+            hovermode="x unified",
+            height=450,
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        if not regressions.empty:
+            for name, first in regressions.groupby("series", sort=False).head(1).set_index("series").iterrows():
+                where = "" if len(series) == 1 else f" in {name}"
+                st.error(f"🚨 Regression first appeared at `{first['commit']}`{where} "
+                         f"({first['ratio_vs_best']:.2f}x slower than the best earlier commit)")
+        else:
+            st.success("✅ No regressions above the threshold")
+
+        st.subheader("Per-commit Summary")
+        st.dataframe(
+            trend_df.drop(columns=["commit", "series"]).style.format({
+                "median_ms": "{:.4f}", "mean_ms": "{:.4f}",
+                "min_ms": "{:.4f}", "max_ms": "{:.4f}", "ratio_vs_best": "{:.2f}",
+            }),
+            use_container_width=True,
+        )
+
+        with st.expander("🗂️ Recent runs", expanded=False):
+            st.dataframe(db.runs(limit=50), use_container_width=True)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    show_history_page()
@@ -0,0 +1,57 @@
+"""
+Ordered index page: B+-tree node order vs the one-key-per-node BST
+"""
+import plotly.graph_objects as go
+import streamlit as st
+from src.benchmarks.ordered_index import INDEX_SIZES, index_comparison, index_summary
+
+def show_index_compare_page():
+    st.title("🌳 B+-Tree vs BST")
+    st.caption("Sorted key arrays searched with bisect vs one Python object per key")
+
+    st.sidebar.header("Index Configuration")
+    sizes = st.sidebar.multiselect("Keys (n)", [10_000, *INDEX_SIZES], default=[10_000, 100_000])
+    orders = st.sidebar.multiselect("B+-tree orders", [4, 8, 16, 32, 64, 128, 256, 512],
+                                    default=[16, 64, 256])
+    kinds = st.sidebar.multiselect("Operations", ["insert", "search", "delete"],
+                                   default=["insert", "search", "delete"])
+    trials = st.sidebar.slider("Trials", 1, 5, 1)
+    if max(sizes, default=0) >= 10_000_000:
+        st.sidebar.warning("⚠️ 10M keys takes minutes per structure to build")
+
+    if not sizes or not orders or not kinds:
+        st.warning("⚠️ Select at least one size, order and operation")
+        return
+
+    if st.sidebar.button("🚀 Run Comparison", type="primary"):
+        with st.spinner("⏳ Building indexes..."):
+            st.session_state['index_compare'] = index_comparison(
+                sorted(sizes), sorted(orders), operations=kinds, trials=trials)
+
+    df = st.session_state.get('index_compare')
+    if df is None:
+        st.info("👈 Pick sizes and orders and click Run Comparison")
+        return
+
+    summary = index_summary(df)
+    cols = st.columns(len(summary["kind"].unique()))
+    for col, (kind, part) in zip(cols, summary.groupby("kind", sort=False)):
+        fig = go.Figure()
+        for order, group in part.groupby("order"):
+            name = "BST" if order == 1 else f"BTree (order {order})"
+            fig.add_trace(go.Scatter(x=group["size"], y=group["time_ms"], mode="lines+markers", name=name))
+        fig.update_layout(title=kind.title(), xaxis_type="log", yaxis_type="log",
+                          xaxis_title="Keys (n)", yaxis_title="Time (ms)", height=400)
+        col.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("Summary")
+    st.dataframe(
+        summary.style.format({"time_ms": "{:.4f}", "speedup_vs_bst": "{:.2f}x"}),
+        use_container_width=True,
+    )
+    csv = df.to_csv(index=False).encode('utf-8')
+    st.download_button("📥 Download Raw Data (CSV)", data=csv,
+                       file_name="index_comparison.csv", mime="text/csv")
+
+if __name__ == "__main__":
+    show_index_compare_page()
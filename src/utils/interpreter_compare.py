@@ -0,0 +1,103 @@
+"""
+Interpreters page: the same operations measured under each local Python interpreter
+"""
+import plotly.graph_objects as go
+import streamlit as st
+from src.benchmarks.benchmark import Benchmark
+from src.benchmarks.interpreters import cross_interpreter_run, discover_interpreters, interpreter_comparison
+from src.utils.results_db import ResultsDB
+
+def show_interpreter_page():
+    st.title("🐍 Interpreter Comparison")
+    st.caption("Run the operation matrix in subprocess workers under every local interpreter and compare side by side")
+
+    if st.sidebar.button("🔍 Rescan interpreters") or 'interpreters' not in st.session_state:
+        with st.spinner("⏳ Probing local interpreters..."):
+            st.session_state['interpreters'] = discover_interpreters()
+    found = st.session_state['interpreters']
+    usable = found[found["usable"]]
+    with st.expander(f"Interpreters found: {len(usable)} usable of {len(found)}", expanded=usable.empty):
+        cols = [c for c in ("executable", "usable", "interpreter", "gil_enabled", "reason") if c in found.columns]
+        st.dataframe(found[cols], use_container_width=True)
+    if usable.empty:
+        st.warning("⚠️ No interpreter can import the benchmark suite; install requirements.txt into it")
+        return
+
+    st.sidebar.header("Matrix Configuration")
+    labels = {f"{r.interpreter} ({r.executable})": r.executable for r in usable.itertuples()}
+    chosen = st.sidebar.multiselect("Interpreters", list(labels), default=list(labels))
+    all_ops = list(Benchmark([1]).operations())
+    operations = st.sidebar.multiselect(
+        "Operations", all_ops,
+        default=[op for op in all_ops if op.startswith(("BST: insert", "HashTable: put", "LinkedList: search"))],
+    )
+    sizes_text = st.sidebar.text_input("Sizes (comma-separated)", value="1000,5000,10000")
+    trials = st.sidebar.slider("Trials", 1, 10, 3)
+    save_history = st.sidebar.checkbox("💾 Save runs to history", value=False,
+                                       help="Record each interpreter's results as its own run")
+    try:
+        sizes = sorted({int(s) for s in sizes_text.split(",") if s.strip()})
+    except ValueError:
+        st.error("Sizes must be integers")
+        return
+
+    if not chosen or not operations or not sizes:
+        st.warning("⚠️ Select at least one interpreter, operation and size")
+        return
+
+    if st.sidebar.button("🚀 Run on Interpreters", type="primary"):
+        progress_bar = st.progress(0)
+        executables = [labels[c] for c in chosen]
+        with st.spinner(f"⏳ Running {len(operations)} operations under {len(executables)} interpreters..."):
+            results, errors, metas = cross_interpreter_run(
+                executables, operations, sizes, trials,
+                progress=lambda done, total: progress_bar.progress(done / total))
+        progress_bar.empty()
+        if save_history and not results.empty:
+            with ResultsDB() as db:
+                for exe, meta in metas.items():
+                    part = results[results["python_executable"] == exe]
+                    db.record_run(part, sizes=sizes, trials=trials, metadata=meta,
+                                  params={"source": "interpreters"})
+        st.session_state['interpreter_results'] = (results, errors)
+
+    stored = st.session_state.get('interpreter_results')
+    if stored is None:
+        st.info("👈 Pick interpreters and operations, then click Run on Interpreters")
+        return
+    results, errors = stored
+    for err in errors:
+        st.error(f"{err['interpreter']} · {err['operation']}: {err['message']}")
+    if results.empty:
+        return
+
+    interpreters = list(dict.fromkeys(results["interpreter"]))
+    baseline = st.selectbox("Baseline interpreter", interpreters, index=0)
+    summary = interpreter_comparison(results, baseline=baseline)
+    largest = summary[summary["size"] == summary["size"].max()]
+
+    pivot = largest.pivot(index="operation", columns="interpreter", values="speedup_vs_baseline")[interpreters]
+    fig = go.Figure(go.Heatmap(
+        z=pivot.values, x=list(pivot.columns), y=list(pivot.index), colorscale="RdYlGn",
+        text=[[f"{v:.2f}x" for v in row] for row in pivot.values], texttemplate="%{text}",
+        colorbar=dict(title=f"× {baseline}"),
+    ))
+    fig.update_layout(title=f"Speedup vs {baseline} at n={int(largest['size'].iloc[0]):,}",
+                      height=max(350, 40 * len(pivot.index)))
+    st.plotly_chart(fig, use_container_width=True)
+
+    fig = go.Figure()
+    for interp, group in largest.groupby("interpreter", sort=False):
+        fig.add_trace(go.Bar(x=group["operation"], y=group["time_ms"], name=interp))
+    fig.update_layout(title="Median time per operation", barmode="group", yaxis_title="Time (ms)", height=400)
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("Side by side")
+    side = summary.pivot_table(index=["operation", "size"], columns="interpreter", values="time_ms")[interpreters]
+    st.dataframe(side.style.format("{:.4f}").highlight_min(axis=1, color="#c6efce"), use_container_width=True)
+    csv = results.to_csv(index=False).encode('utf-8')
+    st.download_button("📥 Download Raw Data (CSV)", data=csv,
+                       file_name="interpreter_comparison.csv", mime="text/csv")
+
+if __name__ == "__main__":
+    show_interpreter_page()
@@ -0,0 +1,305 @@
+"""
+SQLite-backed history of benchmark runs with trend queries across commits
+"""
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.utils.env_info import REPO_ROOT, run_metadata
+
+DEFAULT_DB_PATH = os.path.join(REPO_ROOT, "results", "history.sqlite")
+
+# Columns stored natively; anything else in a result frame goes to the JSON `extra` column
+CORE_COLUMNS = ("operation", "size", "trial", "time_ms", "memory_kb", "distribution")
+
+# Stored for measurements that used the operation's own default key order
+DEFAULT_DISTRIBUTION = "default"
+
+# Runs are only comparable within one of these; trends never mix them
+SERIES_COLUMNS = ("distribution", "interpreter", "measure_memory")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    python_version TEXT,
+    python_implementation TEXT,
+    interpreter TEXT,
+    hostname TEXT,
+    platform TEXT,
+    machine TEXT,
+    cpu_count INTEGER,
+    sizes TEXT,
+    trials INTEGER,
+    duration_s REAL,
+    measure_memory INTEGER NOT NULL DEFAULT 0,
+    params TEXT
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    operation TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    trial INTEGER NOT NULL,
+    time_ms REAL NOT NULL,
+    memory_kb REAL,
+    distribution TEXT NOT NULL DEFAULT 'default',
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_measurements_op_size ON measurements(operation, size);
+CREATE INDEX IF NOT EXISTS idx_measurements_run ON measurements(run_id);
+CREATE INDEX IF NOT EXISTS idx_runs_commit ON runs(git_commit);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_operation ON runs(operation);
+"""
+
+# Columns added after the first release, with the statement that backfills them from older rows
+_MIGRATIONS = (
+    ("runs", "interpreter", "TEXT",
+     "UPDATE runs SET interpreter = python_implementation || ' ' || python_version WHERE interpreter IS NULL"),
+    ("runs", "measure_memory", "INTEGER NOT NULL DEFAULT 0",
+     "UPDATE runs SET measure_memory = EXISTS (SELECT 1 FROM measurements m "
+     "WHERE m.run_id = runs.id AND m.memory_kb IS NOT NULL)"),
+    ("measurements", "distribution", "TEXT NOT NULL DEFAULT 'default'",
+     "UPDATE measurements SET distribution = json_extract(extra, '$.distribution') "
+     "WHERE json_extract(extra, '$.distribution') IS NOT NULL"),
+)
+
+
+def _json_default(value):
+    # numpy scalars and timestamps are not JSON serializable by default
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _to_float(value) -> Optional[float]:
+    if value is None or pd.isna(value):
+        return None
+    return float(value)
+
+
+class ResultsDB:
+    """Local results store recording every benchmark run and its measurements."""
+    def __init__(self, path: str = DEFAULT_DB_PATH, chunk_size: int = 50_000):
+        self.path = path
+        self.chunk_size = chunk_size
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _migrate(self):
+        """Bring databases written before a column existed up to the current schema"""
+        with self.conn:
+            for table, column, decl, backfill in _MIGRATIONS:
+                existing = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+                    self.conn.execute(backfill)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_measurements_dist "
+                              "ON measurements(operation, size, distribution)")
+
+    def _measurement_rows(self, run_id: int, result_df: pd.DataFrame) -> Iterator[Tuple]:
+        extra_cols = [c for c in result_df.columns if c not in CORE_COLUMNS]
+        has_memory = "memory_kb" in result_df.columns
+        has_dist = "distribution" in result_df.columns
+        for row in result_df.to_dict("records"):
+            extra = {c: row[c] for c in extra_cols if not (row[c] is None or pd.isna(row[c]))} if extra_cols else None
+            yield (
+                run_id,
+                row["operation"],
+                int(row["size"]),
+                int(row["trial"]),
+                float(row["time_ms"]),
+                _to_float(row["memory_kb"]) if has_memory else None,
+                row["distribution"] if has_dist and isinstance(row["distribution"], str) else DEFAULT_DISTRIBUTION,
+                json.dumps(extra, default=_json_default) if extra else None,
+            )
+
+    @staticmethod
+    def _chunks(rows: Iterable[Tuple], size: int) -> Iterator[List[Tuple]]:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def record_run(self, result_df: pd.DataFrame, sizes: Optional[Sequence[int]] = None,
+                   trials: Optional[int] = None, duration_s: Optional[float] = None,
+                   params: Optional[Dict] = None, metadata: Optional[Dict] = None,
+                   measure_memory: Optional[bool] = None) -> int:
+        """
+        Insert a run and all of its measurements in one transaction; returns the run id.
+        `measure_memory` defaults to whether the frame carries memory readings, since
+        tracemalloc slows the timings of such runs down. Extrapolated rows (sizes a
+        budgeted sweep skipped) have no measured time and are not stored.
+        """
+        if "extrapolated" in result_df.columns:
+            result_df = result_df[~result_df["extrapolated"].astype(bool)].drop(columns=["extrapolated", "predicted_ms"],
+                                                                                errors="ignore")
+        meta = metadata if metadata is not None else run_metadata()
+        if measure_memory is None:
+            measure_memory = "memory_kb" in result_df.columns and bool(result_df["memory_kb"].notna().any())
+        interpreter = meta.get("interpreter") or f"{meta.get('python_implementation')} {meta.get('python_version')}"
+        operations = list(dict.fromkeys(result_df["operation"])) if len(result_df) else []
+        if sizes is None:
+            sizes = sorted(int(s) for s in result_df["size"].unique()) if len(result_df) else []
+        with self.conn:
+            cur = self.conn.execute(
+                """INSERT INTO runs (created_at, operation, git_commit, python_version,
+                       python_implementation, interpreter, hostname, platform, machine, cpu_count,
+                       sizes, trials, duration_s, measure_memory, params)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    ", ".join(operations),
+                    meta.get("git_commit", "unknown"),
+                    meta.get("python_version"),
+                    meta.get("python_implementation"),
+                    interpreter,
+                    meta.get("hostname"),
+                    meta.get("platform"),
+                    meta.get("machine"),
+                    meta.get("cpu_count"),
+                    json.dumps([int(s) for s in sizes]),
+                    trials,
+                    duration_s,
+                    int(bool(measure_memory)),
+                    json.dumps(params, default=_json_default) if params else None,
+                ),
+            )
+            run_id = cur.lastrowid
+            for chunk in self._chunks(self._measurement_rows(run_id, result_df), self.chunk_size):
+                self.conn.executemany(
+                    """INSERT INTO measurements (run_id, operation, size, trial, time_ms, memory_kb,
+                                               distribution, extra)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    chunk,
+                )
+        return run_id
+
+    def runs(self, limit: int = 100) -> pd.DataFrame:
+        return pd.read_sql_query(
+            "SELECT * FROM runs ORDER BY id DESC LIMIT ?", self.conn, params=(limit,)
+        )
+
+    def operations(self) -> List[str]:
+        rows = self.conn.execute("SELECT DISTINCT operation FROM measurements ORDER BY operation")
+        return [r[0] for r in rows]
+
+    def sizes(self, operation: str) -> List[int]:
+        rows = self.conn.execute(
+            "SELECT DISTINCT size FROM measurements WHERE operation = ? ORDER BY size", (operation,)
+        )
+        return [r[0] for r in rows]
+
+    def query(self, operation: Optional[str] = None, size: Optional[int] = None,
+              git_commit: Optional[str] = None, hostname: Optional[str] = None,
+              since: Optional[str] = None, distribution: Optional[str] = None,
+              python_version: Optional[str] = None, interpreter: Optional[str] = None,
+              measure_memory: Optional[bool] = None) -> pd.DataFrame:
+        """Return measurements joined with their run metadata, filtered on indexed columns."""
+        clauses, params = [], []
+        if operation is not None:
+            clauses.append("m.operation = ?")
+            params.append(operation)
+        if size is not None:
+            clauses.append("m.size = ?")
+            params.append(int(size))
+        if git_commit is not None:
+            clauses.append("r.git_commit = ?")
+            params.append(git_commit)
+        if hostname is not None:
+            clauses.append("r.hostname = ?")
+            params.append(hostname)
+        if since is not None:
+            clauses.append("r.created_at >= ?")
+            params.append(since)
+        if distribution is not None:
+            clauses.append("m.distribution = ?")
+            params.append(distribution)
+        if python_version is not None:
+            clauses.append("r.python_version = ?")
+            params.append(python_version)
+        if interpreter is not None:
+            clauses.append("r.interpreter = ?")
+            params.append(interpreter)
+        if measure_memory is not None:
+            clauses.append("r.measure_memory = ?")
+            params.append(int(measure_memory))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"""
+            SELECT m.run_id, m.operation, m.size, m.trial, m.time_ms, m.memory_kb, m.distribution, m.extra,
+                   r.created_at, r.git_commit, r.python_version, r.python_implementation, r.interpreter,
+                   r.hostname, r.measure_memory
+            FROM measurements m JOIN runs r ON r.id = m.run_id
+            {where}
+            ORDER BY m.run_id, m.size, m.trial
+        """
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def trend(self, operation: str, size: int, hostname: Optional[str] = None,
+              distribution: Optional[str] = None, python_version: Optional[str] = None,
+              interpreter: Optional[str] = None, measure_memory: Optional[bool] = None) -> pd.DataFrame:
+        """
+        Per-commit timing summary for one (operation, size), ordered by first appearance.
+        Each (distribution, interpreter, measure_memory) series gets its own rows, so runs
+        that are not comparable are never blended into one median.
+        """
+        df = self.query(operation=operation, size=size, hostname=hostname, distribution=distribution,
+                        python_version=python_version, interpreter=interpreter, measure_memory=measure_memory)
+        columns = [*SERIES_COLUMNS, "git_commit", "first_seen", "first_run", "runs", "measurements",
+                   "median_ms", "mean_ms", "min_ms", "max_ms"]
+        if df.empty:
+            return pd.DataFrame(columns=columns)
+        df["measure_memory"] = df["measure_memory"].astype(bool)
+        trend = df.groupby([*SERIES_COLUMNS, "git_commit"], dropna=False).agg(
+            first_seen=("created_at", "min"),
+            first_run=("run_id", "min"),
+            runs=("run_id", "nunique"),
+            measurements=("time_ms", "size"),
+            median_ms=("time_ms", "median"),
+            mean_ms=("time_ms", "mean"),
+            min_ms=("time_ms", "min"),
+            max_ms=("time_ms", "max"),
+        ).reset_index()
+        return trend.sort_values([*SERIES_COLUMNS, "first_run"]).reset_index(drop=True)[columns]
+
+
+def flag_regressions(trend_df: pd.DataFrame, threshold: float = 1.2) -> pd.DataFrame:
+    """
+    Mark commits whose median is `threshold` times slower than the best median seen before them
+    in the same series. The first flagged row of a series is where its regression first appeared.
+    """
+    df = trend_df.copy()
+    keys = [c for c in SERIES_COLUMNS if c in df.columns]
+    if keys:
+        best_before = df.groupby(keys, dropna=False)["median_ms"].transform(lambda s: s.cummin().shift(1))
+    else:
+        best_before = df["median_ms"].cummin().shift(1)
+    df["ratio_vs_best"] = df["median_ms"] / best_before
+    df["regression"] = df["ratio_vs_best"] > threshold
+    return df
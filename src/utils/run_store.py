@@ -0,0 +1,160 @@
+"""
+Columnar (Parquet) storage for a run's raw trials, with aggregations, paging and chart downsampling
+"""
+import os
+import time
+import uuid
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.utils.env_info import REPO_ROOT
+
+RUNS_DIR = os.path.join(REPO_ROOT, "results", "runs")
+ROW_GROUP_SIZE = 65_536  # paging reads only the row groups that overlap the requested page
+DEFAULT_STATS = ("min", "mean", "max", "stddev", "count")
+IN_USE_S = 3600  # runs opened this recently may still be on screen in another session
+
+
+def _arrow():
+    """Import pyarrow on first use so the rest of the app loads without it"""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError("The columnar results store needs pyarrow: pip install pyarrow") from exc
+    return pa, pc, pq
+
+
+class RunStore:
+    """
+    One run's raw trials in a Parquet file. Queries read only the columns they
+    need and aggregate in Arrow, so the UI never holds the full frame.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        _, _, pq = _arrow()
+        self._meta = pq.ParquetFile(path).metadata
+        os.utime(path)  # mark as in use so prune_runs leaves it alone
+
+    @classmethod
+    def write(cls, df: pd.DataFrame, path: Optional[str] = None, runs_dir: str = RUNS_DIR) -> "RunStore":
+        pa, _, pq = _arrow()
+        if path is None:
+            os.makedirs(runs_dir, exist_ok=True)
+            path = os.path.join(runs_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet")
+        table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+        pq.write_table(table, path, row_group_size=ROW_GROUP_SIZE)
+        return cls(path)
+
+    @property
+    def num_rows(self) -> int:
+        return self._meta.num_rows
+
+    @property
+    def columns(self) -> List[str]:
+        return [self._meta.schema.column(i).name for i in range(self._meta.num_columns)]
+
+    def _read(self, columns: Sequence[str]):
+        _, _, pq = _arrow()
+        return pq.read_table(self.path, columns=list(columns))
+
+    def aggregate(self, column: str = "time_ms", by: str = "size", stats: Sequence[str] = DEFAULT_STATS,
+                  percentiles: Sequence[float] = ()) -> pd.DataFrame:
+        """
+        Per-group statistics computed in Arrow (e.g. min/mean/max/stddev/count/sum).
+        Percentiles (0-100) are exact, with the same linear interpolation as pandas.
+        Columns are named `<stat>` and `p<q>`; rows are sorted by `by`.
+        """
+        pa, pc, _ = _arrow()
+        table = self._read([by, column])
+        aggs = [(column, s, pc.VarianceOptions(ddof=1)) if s == "stddev" else (column, s) for s in stats]
+        out = table.group_by(by).aggregate(aggs).to_pandas() if aggs else pd.DataFrame({by: []})
+        out = out.rename(columns={f"{column}_{s}": s for s in stats}).sort_values(by).reset_index(drop=True)
+        if percentiles:
+            order = pc.sort_indices(table, sort_keys=[(by, "ascending"), (column, "ascending")])
+            groups = pc.take(table[by], order).to_numpy(zero_copy_only=False)
+            values = pc.take(table[column], order).to_numpy(zero_copy_only=False).astype(float)
+            keys, starts, counts = np.unique(groups, return_index=True, return_counts=True)
+            for q in percentiles:
+                pos = starts + (counts - 1) * (q / 100.0)
+                lo = np.floor(pos).astype(np.int64)
+                hi = np.minimum(lo + 1, starts + counts - 1)
+                pct = values[lo] + (values[hi] - values[lo]) * (pos - lo)
+                out[f"p{q:g}"] = pd.Series(pct, index=keys).reindex(out[by].to_numpy()).to_numpy()
+        return out
+
+    def overall(self, column: str) -> Dict[str, float]:
+        """Whole-run min / mean / median / max of one column"""
+        _, pc, _ = _arrow()
+        col = self._read([column])[column]
+        minmax = pc.min_max(col).as_py()
+        return {
+            "min": minmax["min"],
+            "mean": pc.mean(col).as_py(),
+            "median": pc.quantile(col, q=0.5).to_pylist()[0] if len(col) else None,
+            "max": minmax["max"],
+        }
+
+    def page(self, offset: int, limit: int, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Rows [offset, offset + limit), reading only the overlapping row groups"""
+        _, _, pq = _arrow()
+        pf = pq.ParquetFile(self.path)
+        groups, first_row, start = [], None, 0
+        for rg in range(pf.num_row_groups):
+            n = pf.metadata.row_group(rg).num_rows
+            if start + n > offset and start < offset + limit:
+                groups.append(rg)
+                first_row = start if first_row is None else first_row
+            start += n
+        if not groups:
+            return pd.DataFrame(columns=list(columns or self.columns))
+        table = pf.read_row_groups(groups, columns=list(columns) if columns else None)
+        df = table.slice(offset - first_row, limit).to_pandas()
+        df.index = range(offset, offset + len(df))
+        return df
+
+    def downsample(self, column: str = "time_ms", max_points: int = 2000) -> pd.DataFrame:
+        """
+        Min/max envelope of `column` in trial order, at most `max_points` points:
+        each bucket of consecutive rows keeps its extremes, so spikes survive.
+        Returns columns `sample`, `min`, `max`.
+        """
+        pa, _, _ = _arrow()
+        values = self._read([column])[column]
+        n = len(values)
+        if n <= max_points:
+            vals = values.to_numpy(zero_copy_only=False)
+            return pd.DataFrame({"sample": np.arange(n), "min": vals, "max": vals})
+        rows_per_bucket = -(-n // max(1, max_points // 2))  # two points (min, max) per bucket
+        buckets = pa.array(np.arange(n) // rows_per_bucket)
+        agg = pa.table({"bucket": buckets, column: values}).group_by("bucket").aggregate(
+            [(column, "min"), (column, "max")]).sort_by("bucket").to_pandas()
+        return pd.DataFrame({"sample": agg["bucket"] * rows_per_bucket,
+                             "min": agg[f"{column}_min"], "max": agg[f"{column}_max"]})
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return self._read(columns or self.columns).to_pandas()
+
+
+def prune_runs(keep: int = 20, runs_dir: str = RUNS_DIR, in_use_s: float = IN_USE_S) -> int:
+    """
+    Delete all but the `keep` most recently used run files, sparing any opened
+    in the last `in_use_s` seconds; returns how many were removed
+    """
+    if not os.path.isdir(runs_dir):
+        return 0
+    files = sorted((os.path.join(runs_dir, f) for f in os.listdir(runs_dir) if f.endswith(".parquet")),
+                   key=os.path.getmtime, reverse=True)
+    cutoff = time.time() - in_use_s
+    removed = 0
+    for path in files[keep:]:
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except FileNotFoundError:
+            pass  # pruned concurrently by another session
+    return removed
@@ -0,0 +1,223 @@
+"""
+Flat typed-array snapshots of HashTable / BST / B+-tree fixtures, reopened through mmap
+"""
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.ds.bst import BinarySearchTree, BSTNode
+from src.ds.btree import BPlusTree
+from src.ds.frozen import FrozenBST, FrozenBTree, FrozenHashTable
+from src.ds.hash_table import HashTable
+from src.utils import workloads
+from src.utils.env_info import REPO_ROOT
+
+FORMAT_VERSION = 1
+SNAPSHOT_DIR = os.path.join(REPO_ROOT, "results", "fixtures")
+KINDS = ("hash_table", "bst", "btree")
+Arrays = Dict[str, np.ndarray]
+
+
+def _hash_capacity(n: int) -> int:
+    return max(1024, n * 2)  # same sizing as the Benchmark hash table operations
+
+
+def _int64(values, what: str) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except (TypeError, ValueError, OverflowError) as exc:
+        raise TypeError(f"snapshots store int64 {what}; got non-integer data") from exc
+
+
+def to_arrays(structure) -> Tuple[str, Arrays, dict]:
+    """Flatten a structure (mutable or frozen) into (kind, arrays, meta)"""
+    if isinstance(structure, (HashTable, FrozenHashTable)):
+        if isinstance(structure, FrozenHashTable):
+            return "hash_table", {"offsets": structure.offsets, "keys": structure.keys,
+                                  "values": structure.values}, {}
+        lengths = [len(b) for b in structure.buckets]
+        offsets = np.zeros(structure.capacity + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        pairs = [kv for bucket in structure.buckets for kv in bucket]
+        keys = _int64([k for k, _ in pairs], "keys")
+        values = _int64([v for _, v in pairs], "values")
+        return "hash_table", {"offsets": offsets, "keys": keys, "values": values}, {}
+    if isinstance(structure, FrozenBST):
+        return "bst", {"keys": structure.keys, "left": structure.left, "right": structure.right}, \
+            {"root": structure.root}
+    if isinstance(structure, BinarySearchTree):
+        keys, left, right = [], [], []
+        if structure.root is not None:
+            # preorder numbering: a node's index is assigned before its children's
+            stack = [(structure.root, -1, None)]
+            while stack:
+                node, parent, side = stack.pop()
+                i = len(keys)
+                keys.append(node.key)
+                left.append(-1)
+                right.append(-1)
+                if side is not None:
+                    (left if side == "L" else right)[parent] = i
+                if node.right:
+                    stack.append((node.right, i, "R"))
+                if node.left:
+                    stack.append((node.left, i, "L"))
+        return "bst", {"keys": _int64(keys, "keys"), "left": np.asarray(left, dtype=np.int64),
+                       "right": np.asarray(right, dtype=np.int64)}, {"root": 0 if keys else -1}
+    if isinstance(structure, FrozenBTree):
+        return "btree", {"keys": structure.keys}, {}
+    if isinstance(structure, BPlusTree):
+        return "btree", {"keys": _int64(list(structure), "keys")}, {"order": structure.order}
+    raise TypeError(f"cannot snapshot {type(structure).__name__}")
+
+
+def build_arrays(kind: str, keys: np.ndarray) -> Tuple[Arrays, dict]:
+    """
+    Vectorized equivalent of inserting `keys` in order (value = key for the
+    hash table). Much faster than the Python insert loops for large n.
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    uniq, first = np.unique(keys, return_index=True)  # duplicates keep their first insertion
+    if kind == "btree":
+        return {"keys": uniq}, {}
+    if kind == "hash_table":
+        capacity = _hash_capacity(len(keys))
+        in_order = uniq[np.argsort(first)]
+        # hash(k) for ints: k mod (2**61 - 1) keeping the sign, and hash(-1) == -2
+        modulus = (1 << 61) - 1
+        h = np.where(in_order >= 0, in_order % modulus, -((-in_order) % modulus))
+        h[h == -1] = -2
+        buckets = h % capacity
+        perm = np.argsort(buckets, kind="stable")  # chains keep insertion order
+        offsets = np.zeros(capacity + 1, dtype=np.int64)
+        np.cumsum(np.bincount(buckets, minlength=capacity), out=offsets[1:])
+        chained = in_order[perm]
+        return {"offsets": offsets, "keys": chained, "values": chained.copy()}, {}
+    if kind == "bst":
+        # the BST built by inserting keys in order is the Cartesian tree of the
+        # sorted keys with priority = first insertion position (min at the root)
+        priority = first.tolist()
+        m = len(priority)
+        left, right = [-1] * m, [-1] * m
+        stack = []
+        for i in range(m):
+            last = -1
+            while stack and priority[stack[-1]] > priority[i]:
+                last = stack.pop()
+            left[i] = last
+            if stack:
+                right[stack[-1]] = i
+            stack.append(i)
+        return {"keys": uniq, "left": np.asarray(left, dtype=np.int64),
+                "right": np.asarray(right, dtype=np.int64)}, {"root": stack[0] if stack else -1}
+    raise ValueError(f"Unknown snapshot kind {kind!r}; expected one of {KINDS}")
+
+
+def _write(path: str, kind: str, arrays: Arrays, meta: dict) -> str:
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    # write into a sibling temp dir and rename, so concurrent builders never see a partial snapshot
+    tmp = tempfile.mkdtemp(prefix=".snapshot-", dir=parent)
+    try:
+        for name, arr in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(arr, dtype=np.int64))
+        header = {"format": FORMAT_VERSION, "kind": kind, "n": int(len(arrays["keys"])),
+                  "arrays": sorted(arrays), **meta}
+        with open(os.path.join(tmp, "meta.json"), "w") as fh:
+            json.dump(header, fh)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            if not os.path.exists(os.path.join(path, "meta.json")):
+                raise
+            shutil.rmtree(tmp)  # another process published the same snapshot first
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return path
+
+
+def save(structure, path: str) -> str:
+    """Write a structure as a snapshot directory (meta.json + one .npy per array)"""
+    kind, arrays, meta = to_arrays(structure)
+    return _write(path, kind, arrays, meta)
+
+
+def read_meta(path: str) -> dict:
+    with open(os.path.join(path, "meta.json")) as fh:
+        meta = json.load(fh)
+    if meta.get("format") != FORMAT_VERSION:
+        raise ValueError(f"{path}: snapshot format {meta.get('format')} != {FORMAT_VERSION}")
+    return meta
+
+
+def open_snapshot(path: str, mmap_mode: Optional[str] = "r"):
+    """
+    Attach a snapshot as its Frozen* variant without deserializing: arrays are
+    memory-mapped, so processes opening the same path share the page cache.
+    mmap_mode="c" gives private copy-on-write pages; None reads into memory.
+    """
+    meta = read_meta(path)
+    arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+              for name in meta["arrays"]}
+    if meta["kind"] == "hash_table":
+        return FrozenHashTable(arrays["offsets"], arrays["keys"], arrays["values"])
+    if meta["kind"] == "bst":
+        return FrozenBST(arrays["keys"], arrays["left"], arrays["right"], meta["root"])
+    if meta["kind"] == "btree":
+        return FrozenBTree(arrays["keys"])
+    raise ValueError(f"{path}: unknown snapshot kind {meta['kind']!r}; expected one of {KINDS}")
+
+
+def load(path: str):
+    """Rebuild the mutable structure from a snapshot (Python objects, so O(n) work)"""
+    meta = read_meta(path)
+    frozen = open_snapshot(path, mmap_mode=None)
+    if meta["kind"] == "hash_table":
+        ht = HashTable(capacity=frozen.capacity)
+        keys, values, offsets = frozen.keys.tolist(), frozen.values.tolist(), frozen.offsets.tolist()
+        for b in range(ht.capacity):
+            ht.buckets[b] = list(zip(keys[offsets[b]:offsets[b + 1]], values[offsets[b]:offsets[b + 1]]))
+        ht._recount()
+        return ht
+    if meta["kind"] == "bst":
+        bst = BinarySearchTree()
+        keys, left, right = frozen.keys.tolist(), frozen.left.tolist(), frozen.right.tolist()
+        nodes = [BSTNode(k) for k in keys]
+        for i, node in enumerate(nodes):
+            node.left = nodes[left[i]] if left[i] != -1 else None
+            node.right = nodes[right[i]] if right[i] != -1 else None
+        bst.root = nodes[meta["root"]] if nodes else None
+        bst._recount()
+        return bst
+    tree = BPlusTree(order=meta.get("order", 64))
+    for k in frozen.keys.tolist():
+        tree.insert(k)
+    return tree
+
+
+def fixture_path(kind: str, n: int, distribution: str = "shuffled", seed: int = workloads.DEFAULT_SEED,
+                 root: Optional[str] = None) -> str:
+    return os.path.join(root or SNAPSHOT_DIR, f"{kind}-{distribution}-n{n}-s{seed}")
+
+
+def fixture(kind: str, n: int, distribution: str = "shuffled", seed: int = workloads.DEFAULT_SEED,
+            root: Optional[str] = None, mmap_mode: Optional[str] = "r"):
+    """
+    Open the snapshot of `kind` built from generate(distribution, n, seed),
+    building and saving it on first use. Later calls (and other processes)
+    just attach.
+    """
+    path = fixture_path(kind, n, distribution, seed, root)
+    if not os.path.exists(os.path.join(path, "meta.json")):
+        arrays, meta = build_arrays(kind, workloads.generate(distribution, n, seed))
+        _write(path, kind, arrays, meta)
+    return open_snapshot(path, mmap_mode)
+
+
+def snapshot_bytes(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
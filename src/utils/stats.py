@@ -0,0 +1,50 @@
+"""
+Robust statistics for benchmark samples
+"""
+import math
+from statistics import NormalDist, median
+from typing import List, Sequence, Tuple
+
+
+def median_ci(samples: Sequence[float], confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    Distribution-free confidence interval for the median using order statistics
+    (normal approximation to the binomial). Wide for tiny samples by design.
+    """
+    xs = sorted(samples)
+    n = len(xs)
+    if n == 0:
+        raise ValueError("median_ci() requires at least one sample")
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    half = z * math.sqrt(n) / 2
+    lo = max(0, math.floor(n / 2 - half))
+    hi = min(n - 1, math.ceil(n / 2 + half) - 1)
+    return xs[lo], xs[max(lo, hi)]
+
+
+def relative_ci_width(samples: Sequence[float], confidence: float = 0.95) -> float:
+    """Half-width of the median CI divided by the median (0.05 means ±5%)."""
+    med = median(samples)
+    if med <= 0:
+        return math.inf
+    lo, hi = median_ci(samples, confidence)
+    return (hi - lo) / (2 * med)
+
+
+def tukey_outliers(samples: Sequence[float], k: float = 1.5) -> List[bool]:
+    """Flag samples outside [Q1 - k*IQR, Q3 + k*IQR]."""
+    if len(samples) < 4:
+        return [False] * len(samples)
+    xs = sorted(samples)
+    n = len(xs)
+
+    def quantile(q):
+        pos = (n - 1) * q
+        i = int(pos)
+        frac = pos - i
+        return xs[i] + (xs[min(i + 1, n - 1)] - xs[i]) * frac
+
+    q1, q3 = quantile(0.25), quantile(0.75)
+    iqr = q3 - q1
+    low, high = q1 - k * iqr, q3 + k * iqr
+    return [x < low or x > high for x in samples]
@@ -0,0 +1,77 @@
+"""
+Concurrency page: multi-threaded HashTable throughput and scaling
+"""
+import plotly.graph_objects as go
+import streamlit as st
+from src.benchmarks.concurrency import scaling_benchmark, gil_enabled
+
+def show_throughput_page():
+    st.title("🧵 Concurrent HashTable Throughput")
+    st.caption("Lock-striped table vs a single global lock, N threads sharing one table")
+
+    st.sidebar.header("Throughput Configuration")
+    thread_counts = st.sidebar.multiselect("Thread counts", [1, 2, 4, 8, 16, 32], default=[1, 2, 4, 8])
+    read_pcts = st.sidebar.multiselect("Read %", [50, 75, 90, 95, 99], default=[90, 50])
+    ops_per_thread = int(st.sidebar.number_input("Ops per thread", value=20000, min_value=1000, step=5000))
+    key_space = int(st.sidebar.number_input("Key space", value=10000, min_value=100, step=1000))
+    stripes = st.sidebar.slider("Stripes (striped table)", 1, 256, 16)
+    trials = st.sidebar.slider("Trials", 1, 10, 3)
+
+    if gil_enabled():
+        st.info("ℹ️ This interpreter runs with the GIL, so threads interleave rather than run in parallel; "
+                "striping mainly shows its cost here. Run on a free-threaded build to see scaling.")
+
+    if not thread_counts or not read_pcts:
+        st.warning("⚠️ Select at least one thread count and one read ratio")
+        return
+
+    if st.sidebar.button("🚀 Run Throughput", type="primary"):
+        with st.spinner("⏳ Running threads..."):
+            df = scaling_benchmark(
+                thread_counts=sorted(thread_counts),
+                read_ratios=[p / 100 for p in read_pcts],
+                ops_per_thread=ops_per_thread,
+                key_space=key_space,
+                stripes=stripes,
+                trials=trials,
+            )
+        st.session_state['throughput'] = df
+
+    df = st.session_state.get('throughput')
+    if df is None:
+        st.info("👈 Configure the workload and click Run Throughput")
+        return
+
+    summary = df.groupby(["implementation", "read_ratio", "threads"]).agg(
+        ops_per_s=("ops_per_s", "median"),
+        scaling=("scaling", "median"),
+    ).reset_index()
+
+    fig = go.Figure()
+    for (impl, ratio), group in summary.groupby(["implementation", "read_ratio"]):
+        fig.add_trace(go.Scatter(
+            x=group["threads"], y=group["ops_per_s"],
+            mode="lines+markers", name=f"{impl} ({ratio:.0%} reads)",
+            line=dict(width=2, dash="solid" if impl == "striped" else "dash"),
+            marker=dict(size=8),
+        ))
+    fig.update_layout(
+        title="Aggregate Throughput vs Thread Count",
+        xaxis_title="Threads", yaxis_title="Operations / second",
+        hovermode="x unified", height=450,
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("Scaling Summary")
+    st.dataframe(
+        summary.style.format({"ops_per_s": "{:,.0f}", "scaling": "{:.2f}x", "read_ratio": "{:.0%}"}),
+        use_container_width=True,
+    )
+    st.caption("scaling = ops/s relative to the same implementation and mix on 1 thread, "
+               "which is always measured as the baseline even when not selected")
+    csv = df.to_csv(index=False).encode('utf-8')
+    st.download_button("📥 Download Raw Data (CSV)", data=csv,
+                       file_name="hashtable_throughput.csv", mime="text/csv")
+
+if __name__ == "__main__":
+    show_throughput_page()
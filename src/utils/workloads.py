@@ -0,0 +1,222 @@
+"""
+Vectorized, reproducible workload data, cached per (distribution, n, seed),
+with a read-only shared-memory hand-off to local worker processes
+"""
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_SEED = 1337
+# Key distributions exposed as a benchmark dimension; `param` tunes the ones marked below
+KEY_DISTRIBUTIONS = (
+    "uniform",        # uniform random keys in [0, 10n], occasional duplicates
+    "sorted",         # 0..n-1 ascending
+    "reverse",        # n-1..0 descending
+    "nearly_sorted",  # ascending with `param` random swaps (default n // 100)
+    "zipf",           # Zipf-skewed keys with exponent `param` (default 1.2)
+    "duplicates",     # keys drawn from only `param` distinct values (default max(1, n // 100))
+)
+DISTRIBUTIONS = ("random", "sequential", "shuffled") + KEY_DISTRIBUTIONS
+# generated arrays kept for reuse, least recently used evicted first; a 10M-key array is 80 MB
+CACHE_MAX_BYTES = 256 * 2**20
+
+_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()  # Streamlit sessions run in threads of one process
+
+# (shared memory name, shape, dtype string): small and picklable, unlike the data itself
+Handle = Tuple[str, Tuple[int, ...], str]
+# environment variable through which a parent hands published workloads to its worker processes
+SHARED_ENV = "WORKLOADS_SHARED"
+_attached: Dict[Tuple, "SharedArray"] = {}  # workloads this process maps from its parent
+
+
+def make_rng(seed: int = DEFAULT_SEED) -> np.random.Generator:
+    """Per-run generator; never touches the global `random` / `np.random` state"""
+    return np.random.default_rng(seed)
+
+
+def _generate(distribution: str, n: int, seed: int, param: Optional[float]) -> np.ndarray:
+    rng = make_rng(seed)
+    if distribution in ("random", "uniform"):
+        data = rng.integers(0, n * 10, size=n, endpoint=True, dtype=np.int64)
+    elif distribution in ("sequential", "sorted"):
+        data = np.arange(n, dtype=np.int64)
+    elif distribution == "reverse":
+        data = np.arange(n - 1, -1, -1, dtype=np.int64)
+    elif distribution == "shuffled":
+        data = rng.permutation(n).astype(np.int64, copy=False)
+    elif distribution == "nearly_sorted":
+        data = np.arange(n, dtype=np.int64)
+        swaps = int(param) if param is not None else n // 100
+        if n > 1 and swaps > 0:
+            i = rng.integers(0, n, size=swaps)
+            j = rng.integers(0, n, size=swaps)
+            for a, b in zip(i, j):  # sequential so overlapping swaps compose like real edits
+                data[a], data[b] = data[b], data[a]
+    elif distribution == "zipf":
+        a = param if param is not None else 1.2
+        # rank 1 is the hottest key; fold the unbounded tail back into the key space
+        data = (rng.zipf(a, size=n) - 1) % max(1, n)
+        data = data.astype(np.int64, copy=False)
+    elif distribution == "duplicates":
+        distinct = int(param) if param is not None else max(1, n // 100)
+        data = rng.integers(0, max(1, distinct), size=n, dtype=np.int64)
+    else:
+        raise ValueError(f"Unknown distribution {distribution!r}; expected one of {DISTRIBUTIONS}")
+    data.flags.writeable = False  # cached and shared, so callers must copy before mutating
+    return data
+
+
+def generate(distribution: str, n: int, seed: int = DEFAULT_SEED, param: Optional[float] = None) -> np.ndarray:
+    """Read-only int64 array for (distribution, n, seed, param), cached up to CACHE_MAX_BYTES"""
+    global _cache_bytes
+    key = (distribution, int(n), int(seed), param)
+    if key in _attached:
+        return _attached[key].array
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    data = _generate(*key)
+    if data.nbytes > CACHE_MAX_BYTES:
+        return data
+    with _cache_lock:
+        if key not in _cache:
+            _cache[key] = data
+            _cache_bytes += data.nbytes
+            while _cache_bytes > CACHE_MAX_BYTES:
+                _, evicted = _cache.popitem(last=False)
+                _cache_bytes -= evicted.nbytes
+        return _cache[key]
+
+
+def generate_list(distribution: str, n: int, seed: int = DEFAULT_SEED, param: Optional[float] = None) -> list:
+    """Same data as `generate` as a fresh list of Python ints, for the pure-Python structures"""
+    return generate(distribution, n, seed, param).tolist()
+
+
+def clear_cache():
+    global _cache_bytes
+    with _cache_lock:
+        _cache.clear()
+        _cache_bytes = 0
+
+
+class SharedArray:
+    """
+    Read-only NumPy array living in POSIX shared memory.
+    The creating process owns (and finally unlinks) the block; workers
+    `SharedArray.attach(handle)` and get a zero-copy view without pickling the data.
+    """
+    def __init__(self, shm: shared_memory.SharedMemory, shape, dtype, owner: bool):
+        self._shm = shm
+        self.owner = owner
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+        self.array.flags.writeable = False
+
+    @classmethod
+    def create(cls, data: np.ndarray) -> "SharedArray":
+        data = np.ascontiguousarray(data)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+        staging = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        staging[...] = data
+        del staging
+        return cls(shm, data.shape, data.dtype, owner=True)
+
+    @classmethod
+    def attach(cls, handle: Handle) -> "SharedArray":
+        name, shape, dtype = handle
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            # a worker started with subprocess has its own resource tracker, which would
+            # unlink the owner's block when the worker exits
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, shape, dtype, owner=False)
+
+    @property
+    def handle(self) -> Handle:
+        return self._shm.name, self.shape, self.dtype.str
+
+    def close(self):
+        if self._shm is None:
+            return
+        self.array = None  # drop the exported buffer before closing the mapping
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def share(distribution: str, n: int, seed: int = DEFAULT_SEED, param: Optional[float] = None) -> SharedArray:
+    """Generate (or reuse) a workload and publish it to shared memory"""
+    return SharedArray.create(generate(distribution, n, seed, param))
+
+
+class SharedWorkloads:
+    """
+    Publishes a set of workloads for the lifetime of a `with` block. Pass
+    `env()` to worker processes, which call `attach_shared()` so `generate`
+    returns the parent's arrays instead of building their own.
+    """
+    def __init__(self, keys: Iterable[Tuple]):
+        self.shared = {}
+        try:
+            for distribution, n, seed, param in dict.fromkeys(keys):
+                key = (distribution, int(n), int(seed), param)
+                self.shared[key] = share(*key)
+        except BaseException:
+            self.close()
+            raise
+
+    def env(self) -> Dict[str, str]:
+        spec = [[list(key), [sa.handle[0], list(sa.handle[1]), sa.handle[2]]] for key, sa in self.shared.items()]
+        return {SHARED_ENV: json.dumps(spec)}
+
+    def close(self):
+        for sa in self.shared.values():
+            sa.close()
+        self.shared = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_shared(spec: Optional[str] = None) -> int:
+    """
+    Map the workloads a parent published (by default from $WORKLOADS_SHARED)
+    into this process; returns how many were attached. Blocks that are already
+    gone are skipped and regenerated on demand.
+    """
+    spec = os.environ.get(SHARED_ENV) if spec is None else spec
+    count = 0
+    for key, (name, shape, dtype) in json.loads(spec) if spec else ():
+        key = (key[0], int(key[1]), int(key[2]), key[3])
+        if key in _attached:
+            continue
+        try:
+            _attached[key] = SharedArray.attach((name, tuple(shape), dtype))
+        except FileNotFoundError:
+            continue
+        count += 1
+    return count
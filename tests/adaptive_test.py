@@ -0,0 +1,23 @@
+from src.benchmarks.adaptive import AdaptiveSampler
+from src.utils.stats import median_ci, relative_ci_width, tukey_outliers
+
+
+def test_median_ci_brackets_median():
+    xs = list(range(1, 101))
+    lo, hi = median_ci(xs)
+    assert lo < 50.5 < hi
+    assert relative_ci_width([5.0] * 10) == 0.0
+
+
+def test_tukey_flags_spike():
+    flags = tukey_outliers([1.0, 1.1, 0.9, 1.0, 1.05, 50.0])
+    assert flags == [False, False, False, False, False, True]
+
+
+def test_adaptive_respects_caps():
+    # a negative target can never be met, so every size runs to the trial cap
+    sampler = AdaptiveSampler([50, 100], target_rel_ci=-1.0, min_trials=3, max_trials=6, seed=1)
+    df = sampler.run("HashTable: get")
+    assert set(df.groupby("size")["trial"].count()) == {6}
+    assert set(sampler.summary["status"]) == {"trial_cap"}
+    assert "outlier" in df.columns
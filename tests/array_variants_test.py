@@ -0,0 +1,73 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.ds.array_ds import DequeArrayDS, SortedArrayDS
+from src.ds.gap_buffer import GapBufferArrayDS
+from src.ds.numpy_array import NumpyArrayDS
+
+
+def test_sorted_array_stays_sorted():
+    arr = SortedArrayDS([5, 1, 4])
+    arr.insert(3)
+    arr.insert(2)
+    assert arr.data == [1, 2, 3, 4, 5]
+    for positional in (lambda: arr.append(0), lambda: arr.insert_front(0), lambda: arr.insert_at(1, 0)):
+        with pytest.raises(TypeError):
+            positional()
+    assert arr.data == [1, 2, 3, 4, 5]
+    assert arr.search_binary(4) and not arr.search_binary(6)
+    assert arr.search_many([1, 6]) == [True, False]
+    assert arr.remove_value(3) and not arr.remove_value(3)
+    assert arr.range(2, 5) == [2, 4]
+
+
+def test_numpy_array_growth_and_bulk_ops():
+    arr = NumpyArrayDS(capacity=2)
+    for v in range(10):
+        arr.append(v)
+    arr.insert_front(-1)
+    assert arr.data.tolist() == [-1] + list(range(10))
+    assert arr.search_linear(9) and not arr.search_linear(42)
+    assert arr.search_many([0, 42, 5]).tolist() == [True, False, True]
+    assert arr.remove_many(np.array([0, 1, 42])) == 2
+    assert arr.remove_value(9) and not arr.remove_value(9)
+    arr.pop_back()
+    assert arr.data.tolist() == [-1, 2, 3, 4, 5, 6, 7]
+    assert len(arr) == 7
+
+
+def test_deque_array_front_insert():
+    arr = DequeArrayDS([2, 3])
+    arr.insert_front(1)
+    arr.append(4)
+    arr.insert_at(2, 9)
+    assert list(arr.data) == [1, 2, 9, 3, 4]
+    assert arr.remove_value(9) and arr.search_linear(4) and len(arr) == 4
+
+
+def test_gap_buffer_matches_list():
+    rng = random.Random(11)
+    gb, ref = GapBufferArrayDS(gap=2), []
+    for i in range(500):
+        roll = rng.random()
+        if roll < 0.3:
+            gb.insert_front(i)
+            ref.insert(0, i)
+        elif roll < 0.6:
+            pos = rng.randint(0, len(ref))
+            gb.insert_at(pos, i)
+            ref.insert(pos, i)
+        elif roll < 0.8:
+            gb.append(i)
+            ref.append(i)
+        elif ref:
+            v = rng.choice(ref)
+            assert gb.remove_value(v)
+            ref.remove(v)
+    assert gb.data == ref == list(gb)
+    assert len(gb) == len(ref)
+    assert gb.search_linear(ref[0]) and not gb.search_linear(-1)
+    gb.pop_back()
+    assert gb.data == ref[:-1]
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from src.benchmarks.ordered_index import index_comparison, index_summary
+from src.ds.btree import BPlusTree
+
+
+def _check_invariants(tree):
+    leaves = []
+    def walk(node, lo, hi, depth):
+        assert node.keys == sorted(node.keys)
+        assert all((lo is None or k >= lo) and (hi is None or k < hi) for k in node.keys)
+        if node is not tree.root:
+            assert tree.order // 2 <= len(node.keys) <= tree.order
+        if node.children is None:
+            leaves.append((node, depth))
+            return
+        assert len(node.children) == len(node.keys) + 1
+        bounds = [lo, *node.keys, hi]
+        for i, child in enumerate(node.children):
+            walk(child, bounds[i], bounds[i + 1], depth + 1)
+    walk(tree.root, None, None, 1)
+    assert len({depth for _, depth in leaves}) == 1  # all leaves on one level
+    for (leaf, _), (nxt, _) in zip(leaves, leaves[1:]):
+        assert leaf.next is nxt
+    assert leaves[-1][0].next is None
+
+
+@pytest.mark.parametrize("order", [3, 4, 16])
+def test_matches_set_under_random_edits(order):
+    rng = random.Random(order)
+    tree, ref = BPlusTree(order), set()
+    for _ in range(3000):
+        k = rng.randrange(500)
+        if rng.random() < 0.6:
+            tree.insert(k)
+            ref.add(k)
+        else:
+            assert tree.delete(k) == (k in ref)
+            ref.discard(k)
+    _check_invariants(tree)
+    assert list(tree) == sorted(ref) and len(tree) == len(ref)
+    assert all(tree.search(k) == (k in ref) for k in range(500))
+    assert tree.range_scan(100, 300) == [k for k in sorted(ref) if 100 <= k <= 300]
+
+
+def test_delete_everything_collapses_root():
+    tree = BPlusTree(order=4)
+    for k in range(200):
+        tree.insert(k)
+    assert tree.height > 2
+    for k in range(200):
+        assert tree.delete(k)
+    assert len(tree) == 0 and tree.height == 1 and list(tree) == []
+
+
+def test_index_comparison_includes_bst_baseline():
+    summary = index_summary(index_comparison([2000], orders=(8, 64), operations=("search",)))
+    assert set(summary["order"]) == {1, 8, 64}
+    assert (summary[summary["structure"] == "BST"]["speedup_vs_bst"] == 1.0).all()
+    assert summary[summary["structure"] == "BTree"]["height"].notna().all()
@@ -0,0 +1,58 @@
+import pytest
+
+from src.benchmarks.benchmark import Benchmark
+from src.benchmarks.caching import cache_benchmark, key_stream
+from src.ds.cache import LRUCache, LFUCache, ClockCache
+
+
+def test_lru_evicts_least_recent():
+    c = LRUCache(2)
+    c.put(1, "a")
+    c.put(2, "b")
+    assert c.get(1) == "a"
+    c.put(3, "c")
+    assert c.get(2) is None and c.get(1) == "a" and c.get(3) == "c"
+    assert len(c) == 2 and c.evictions == 1
+
+
+def test_lfu_evicts_least_frequent():
+    c = LFUCache(2)
+    c.put(1, "a")
+    c.put(2, "b")
+    c.get(1)
+    c.get(1)
+    c.get(2)
+    c.put(3, "c")
+    assert 2 not in c and 1 in c and 3 in c
+
+
+def test_clock_gives_second_chance():
+    c = ClockCache(2)
+    c.put(1, "a")
+    c.put(2, "b")
+    c.get(1)
+    c.put(3, "c")
+    assert 1 in c and 2 not in c
+    assert c.get(3) == "c"
+
+
+@pytest.mark.parametrize("cls", [LRUCache, LFUCache, ClockCache])
+def test_capacity_is_respected(cls):
+    c = cls(50)
+    for k in key_stream("zipf", 5000, 500):
+        if c.get(k) is None:
+            c.put(k, k)
+    assert len(c) == 50
+    assert 0.0 < c.hit_ratio() < 1.0
+
+
+def test_scan_defeats_lru():
+    df = cache_benchmark(policies=("LRU",), streams=("scan",), capacity=100,
+                         n_requests=2000, key_space=500, trials=1)
+    assert df["hit_ratio"].iloc[0] == 0.0
+    assert df["bytes_per_entry"].iloc[0] > 0
+
+
+def test_cache_operation_reports_hit_ratio():
+    df = Benchmark([500], trials=1).run("Cache: LRU replay")
+    assert "hit_ratio" in df.columns
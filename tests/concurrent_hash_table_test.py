@@ -0,0 +1,46 @@
+import threading
+
+from src.benchmarks.concurrency import scaling_benchmark
+from src.ds.concurrent_hash_table import ConcurrentHashTable, GlobalLockHashTable
+
+
+def test_basic_operations():
+    for ht in (ConcurrentHashTable(capacity=8, stripes=4), GlobalLockHashTable(capacity=8)):
+        ht.put("a", 1)
+        ht.put("a", 2)
+        assert ht.get("a") == 2 and len(ht) == 1
+        assert ht.put_if_absent("a", 3) == 2
+        assert ht.put_if_absent("b", 4) is None and ht.get("b") == 4
+        assert ht.compute("a", lambda v: v + 10) == 12
+        assert ht.compute("a", lambda v: None) is None and not ht.contains("a")
+        assert ht.delete("b") and not ht.delete("b")
+        assert len(ht) == 0
+
+
+def test_compute_is_atomic_across_threads():
+    ht = ConcurrentHashTable(capacity=4, stripes=2)
+    def bump():
+        for _ in range(2000):
+            ht.compute("hits", lambda v: (v or 0) + 1)
+    threads = [threading.Thread(target=bump) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert ht.get("hits") == 16000
+
+
+def test_scaling_benchmark_reports_throughput():
+    df = scaling_benchmark(thread_counts=(1, 2), read_ratios=(0.9,), ops_per_thread=500,
+                           key_space=200, trials=1)
+    assert set(df["implementation"]) == {"striped", "global_lock"}
+    assert (df["ops_per_s"] > 0).all()
+    assert (df.loc[df["threads"] == 1, "scaling"] == 1.0).all()
+
+
+def test_scaling_is_relative_to_one_thread_even_when_not_requested():
+    df = scaling_benchmark(thread_counts=(2, 4), read_ratios=(0.9,), ops_per_thread=500,
+                           key_space=200, implementations=("global_lock",), trials=1)
+    assert sorted(df["threads"]) == [2, 4]
+    # against a 2-thread baseline the 2-thread row would be exactly 1.0
+    assert (df["scaling"] != 1.0).all()
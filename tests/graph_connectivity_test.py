@@ -0,0 +1,46 @@
+import random
+
+from src.ds.disjoint_set import DisjointSet
+from src.ds.graph import Graph
+
+
+def _bfs_components(g):
+    return {frozenset(u for u in g.adj if g.bfs_search(u, start=s)) for s in g.adj}
+
+
+def test_disjoint_set_sizes_and_count():
+    dsu = DisjointSet(range(6))
+    assert dsu.union(0, 1) and dsu.union(2, 3) and dsu.union(1, 3)
+    assert not dsu.union(0, 2)
+    assert dsu.components == 3
+    assert dsu.component_size(3) == 4 and dsu.component_size(5) == 1
+    assert dsu.connected(0, 2) and not dsu.connected(0, 4)
+
+
+def test_index_matches_bfs_after_inserts_and_deletes():
+    rng = random.Random(5)
+    g = Graph()
+    for _ in range(120):
+        g.add_edge(rng.randrange(80), rng.randrange(80))
+    for u in rng.sample(sorted(g.adj), 15):
+        g.delete_node(u)
+    g.add_edge(1000, 1001)  # inserted while the index is stale
+    comps = _bfs_components(g)
+    assert g.component_count() == len(comps)
+    for comp in comps:
+        u = next(iter(comp))
+        assert g.component_size(u) == len(comp)
+        assert all(g.connected(u, v) for v in comp)
+    assert not g.connected(1000, next(u for u in g.adj if u < 1000))
+    assert not g.connected(1000, -1) and g.component_size(-1) == 0
+
+
+def test_delete_splits_component():
+    g = Graph()
+    for i in range(4):
+        g.add_edge(i, i + 1)
+    assert g.component_count() == 1
+    g.delete_node(2)
+    assert g.component_count() == 2
+    assert g.connected(0, 1) and not g.connected(1, 3)
+    assert not g.bfs_search(4, start=0) and g.bfs_search(4, start=3)
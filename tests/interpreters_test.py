@@ -0,0 +1,64 @@
+import sys
+
+import pandas as pd
+
+from src.benchmarks.interpreters import cross_interpreter_run, interpreter_comparison, probe, run_on_interpreter
+
+
+def test_probe_current_and_missing_interpreter(tmp_path):
+    current = probe(sys.executable)
+    assert current["usable"] and current["python_version"].count(".") == 2
+    assert current["interpreter"].endswith(current["python_version"]) or current["free_threaded"]
+    missing = probe(str(tmp_path / "no-python"))
+    assert not missing["usable"] and missing["reason"]
+
+
+def test_worker_records_are_tagged():
+    results, errors, metas = cross_interpreter_run([sys.executable], ["Array: search", "Nope: op"], [50, 100], 2)
+    assert len(results) == 4 and set(results["operation"]) == {"Array: search"}
+    assert (results["python_executable"] == sys.executable).all()
+    assert results["interpreter"].nunique() == 1
+    assert [e["operation"] for e in errors] == ["Nope: op"]
+    assert metas[sys.executable]["git_commit"]
+
+
+def test_comparison_ranks_interpreters():
+    results = pd.DataFrame({
+        "operation": ["X"] * 4, "size": [10] * 4,
+        "interpreter": ["A", "A", "B", "B"], "time_ms": [2.0, 2.0, 1.0, 1.0],
+    })
+    summary = interpreter_comparison(results).set_index("interpreter")
+    assert summary.loc["B", "speedup_vs_baseline"] == 2.0
+    assert summary.loc["B", "rank"] == 1 and summary.loc["A", "rank"] == 2
+
+
+def test_same_version_interpreters_stay_apart(tmp_path):
+    alias = tmp_path / "python-alias"
+    alias.symlink_to(sys.executable)
+    calls = []
+    results, errors, metas = cross_interpreter_run(
+        [sys.executable, str(alias), str(tmp_path / "missing")], ["Array: search"], [50], 1,
+        progress=lambda done, total: calls.append(done))
+    assert calls == [1, 2, 3]  # the missing interpreter still advances the progress bar
+    assert results["interpreter"].nunique() == 2
+    assert all(label.endswith(f"({exe})") for exe, label in
+               results.groupby("python_executable")["interpreter"].first().items())
+    assert [e["operation"] for e in errors] == ["*"]
+
+
+def test_timeout_is_per_operation_and_keeps_finished_trials(tmp_path):
+    # stand-in interpreter without the suite's imports: "slow" reports one trial, then hangs
+    fake = tmp_path / "fake-python"
+    fake.write_text(f"""#!{sys.executable}
+import json, sys, time
+op = sys.argv[sys.argv.index("--op") + 1]
+print(json.dumps({{"type": "meta", "interpreter": "Fake 0.0", "python_version": "0.0"}}), flush=True)
+print(json.dumps({{"type": "record", "operation": op, "size": 10, "trial": 1, "time_ms": 1.0}}), flush=True)
+if op == "slow":
+    time.sleep(60)
+print(json.dumps({{"type": "record", "operation": op, "size": 10, "trial": 2, "time_ms": 1.0}}), flush=True)
+""")
+    fake.chmod(0o755)
+    df, errors, _ = run_on_interpreter(str(fake), ["slow", "fast"], [10], trials=2, timeout=2)
+    assert sorted(zip(df["operation"], df["trial"])) == [("fast", 1), ("fast", 2), ("slow", 1)]
+    assert [(e["operation"], e["message"]) for e in errors] == [("slow", "timed out after 2s")]
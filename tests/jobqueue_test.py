@@ -0,0 +1,82 @@
+import os
+import time
+
+import pytest
+
+from src.benchmarks.jobqueue import JobQueue, coordinate, plan_jobs, run_worker
+
+
+def test_publish_is_idempotent(tmp_path):
+    queue = JobQueue(str(tmp_path))
+    jobs = plan_jobs(["Array: search", "HashTable: get"], [50, 100], trials=2)
+    assert len({j["job_id"] for j in jobs}) == 4
+    assert queue.publish(jobs) == 4
+    assert queue.publish(plan_jobs(["Array: search"], [50, 100], trials=2)) == 0
+    assert queue.status() == {"pending": 4, "claimed": 0, "done": 0, "failed": 0}
+
+
+def test_stale_claim_is_retried_then_failed(tmp_path):
+    queue = JobQueue(str(tmp_path), stale_after_s=0.0, max_attempts=2)
+    queue.publish(plan_jobs(["Array: search"], [50], trials=2))
+    crashed = queue.claim("crashed-worker")
+    time.sleep(0.01)
+    assert queue.requeue_stale() == [crashed["job_id"]]
+    assert run_worker(str(tmp_path), "healthy", stale_after_s=60) == 1
+    df = queue.collect()
+    assert len(df) == 2 and set(df["worker"]) == {"healthy"} and df["fingerprint"].nunique() == 1
+    assert {"operation", "size", "trial", "time_ms"} <= set(df.columns)
+
+    queue.publish(plan_jobs(["Nope: op"], [50], trials=1))
+    run_worker(str(tmp_path), "healthy", stale_after_s=60, max_attempts=2)
+    [failed] = queue.failures()
+    assert failed["attempts"] == 2 and failed["last_error"]
+
+
+def test_fail_after_another_process_handled_the_claim(tmp_path):
+    queue = JobQueue(str(tmp_path), stale_after_s=0.0)
+    queue.publish(plan_jobs(["Array: search"], [50, 100], trials=1))
+    finished, requeued = queue.claim("w1"), queue.claim("w2")
+
+    queue.complete(finished, [], {"worker": "w1"})
+    assert queue.fail(finished, "stale claim by w1") is False  # must not resurrect the claim
+    assert queue.fail(requeued, "stale claim by w2") is True
+    assert queue.fail(requeued, "worker error") is False  # the coordinator already requeued it
+    assert queue.status() == {"pending": 1, "claimed": 0, "done": 1, "failed": 0}
+    assert queue.finished() is False
+
+    again = queue.claim("w3")
+    queue.complete(again, [], {"worker": "w3"})
+    assert queue.status() == {"pending": 0, "claimed": 0, "done": 2, "failed": 0}
+    assert sorted(os.listdir(tmp_path / "claimed")) == []
+
+
+def test_fail_with_a_result_on_disk_completes_the_job(tmp_path):
+    queue = JobQueue(str(tmp_path))
+    queue.publish(plan_jobs(["Array: search"], [50], trials=1))
+    job = queue.claim("slow-worker")
+    # the worker wrote its result but had not moved the claim yet
+    os.makedirs(tmp_path / "results", exist_ok=True)
+    (tmp_path / "results" / f"{job['job_id']}.json").write_text('{"job": {}, "meta": {}, "records": []}')
+    assert queue.fail(job, "stale claim by slow-worker") is False
+    assert queue.status() == {"pending": 0, "claimed": 0, "done": 1, "failed": 0}
+
+
+def test_local_workers_drain_queue(tmp_path):
+    jobs = plan_jobs(["Array: search", "HashTable: get", "LinkedList: search"], [50, 100], trials=2)
+    df, failures = coordinate(str(tmp_path), jobs, local_workers=3, poll_s=0.1, timeout_s=120)
+    assert len(df) == len(jobs) * 2 and df["job_id"].nunique() == len(jobs) and failures == []
+    assert os.listdir(tmp_path / "pending") == [] and len(os.listdir(tmp_path / "done")) == len(jobs)
+
+    # reusing the root: only this call's jobs come back, and failed ones are reported
+    again = plan_jobs(["Array: search", "Nope: op"], [50], trials=1)
+    df, failures = coordinate(str(tmp_path), again, local_workers=1, max_attempts=1, poll_s=0.1, timeout_s=120)
+    assert set(df["job_id"]) == {again[0]["job_id"]} and len(df) == 1
+    assert [f["operation"] for f in failures] == ["Nope: op"]
+
+
+def test_timeout_stops_busy_workers(tmp_path):
+    jobs = plan_jobs(["Array: insert_front"], [3_000_000], trials=1)  # minutes of work
+    started = time.time()
+    with pytest.raises(TimeoutError):
+        coordinate(str(tmp_path), jobs, local_workers=1, poll_s=0.1, timeout_s=2)
+    assert time.time() - started < 30
@@ -0,0 +1,18 @@
+from src.benchmarks.benchmark import Benchmark
+from src.benchmarks.matrix import distribution_operations, matrix_pivot, run_distribution_matrix
+from src.utils.workloads import KEY_DISTRIBUTIONS
+
+
+def test_every_operation_accepts_every_distribution(tmp_path):
+    for dist in KEY_DISTRIBUTIONS:
+        bench = Benchmark([200], trials=1, distribution=dist, fixture_dir=str(tmp_path))
+        for op in distribution_operations():
+            df = bench.run(op)
+            assert (df["distribution"] == dist).all()
+
+
+def test_matrix_pivot_relative_to_uniform():
+    df = run_distribution_matrix(["HashTable: put", "BST: search"], ["uniform", "sorted"], 300, trials=1)
+    pivot = matrix_pivot(df, normalize=True)
+    assert list(pivot.columns) == ["uniform", "sorted"]
+    assert (pivot["uniform"] == 1.0).all()
@@ -0,0 +1,80 @@
+import pandas as pd
+
+from src.benchmarks.benchmark import Benchmark
+from src.utils.results_db import ResultsDB, flag_regressions
+
+
+def _meta(commit):
+    return {"git_commit": commit, "python_version": "3.11.0", "python_implementation": "CPython", "hostname": "box"}
+
+
+def test_record_and_query(tmp_path):
+    df = Benchmark([50, 100], trials=2, measure_memory=True).run("HashTable: put")
+    assert "memory_kb" in df.columns
+    with ResultsDB(str(tmp_path / "h.sqlite")) as db:
+        run_id = db.record_run(df, trials=2)
+        rows = db.query(operation="HashTable: put", size=100)
+        assert len(rows) == 2
+        assert set(rows["run_id"]) == {run_id}
+        assert db.operations() == ["HashTable: put"]
+        assert db.sizes("HashTable: put") == [50, 100]
+
+
+def test_trend_flags_first_regression(tmp_path):
+    with ResultsDB(str(tmp_path / "h.sqlite"), chunk_size=2) as db:
+        for commit, ms in [("f00", 1.0), ("c0f", 1.05), ("a11", 2.0), ("b22", 2.1)]:
+            df = pd.DataFrame({"operation": "BST: search", "size": 100,
+                               "trial": [1, 2, 3], "time_ms": [ms, ms, ms]})
+            db.record_run(df, metadata=_meta(commit))
+        trend = flag_regressions(db.trend("BST: search", 100))
+    assert list(trend["git_commit"]) == ["f00", "c0f", "a11", "b22"]
+    assert trend["measurements"].tolist() == [3, 3, 3, 3]
+    assert trend.loc[trend["regression"], "git_commit"].iloc[0] == "a11"
+
+
+def test_trend_keeps_distributions_interpreters_and_memory_runs_apart(tmp_path):
+    def frame(ms, **cols):
+        return pd.DataFrame({"operation": "BST: search", "size": 100, "trial": [1, 2], "time_ms": [ms, ms], **cols})
+
+    with ResultsDB(str(tmp_path / "h.sqlite")) as db:
+        for commit in ("f00", "a11"):
+            db.record_run(frame(1.0), metadata=_meta(commit))
+            db.record_run(frame(5.0, distribution="sorted"), metadata=_meta(commit))
+            db.record_run(frame(3.0, memory_kb=[1.0, 1.0]), metadata=_meta(commit))
+            db.record_run(frame(9.0), metadata={**_meta(commit), "interpreter": "CPython 3.13.0t"})
+        trend = flag_regressions(db.trend("BST: search", 100))
+        assert len(trend) == 8
+        assert set(trend.groupby(["distribution", "interpreter", "measure_memory"])["median_ms"].nunique()) == {1}
+        assert not trend["regression"].any()
+
+        assert set(db.query(distribution="sorted")["time_ms"]) == {5.0}
+        assert set(db.query(measure_memory=True)["time_ms"]) == {3.0}
+        assert set(db.query(interpreter="CPython 3.13.0t")["time_ms"]) == {9.0}
+        assert len(db.query(python_version="3.11.0")) == 16
+        default = db.trend("BST: search", 100, distribution="default", measure_memory=False,
+                           interpreter="CPython 3.11.0")
+        assert default["median_ms"].tolist() == [1.0, 1.0]
+
+
+def test_older_databases_are_migrated(tmp_path):
+    import json
+    import sqlite3
+    path = str(tmp_path / "old.sqlite")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, created_at TEXT NOT NULL, operation TEXT NOT NULL,
+            git_commit TEXT NOT NULL, python_version TEXT, python_implementation TEXT, hostname TEXT, platform TEXT,
+            machine TEXT, cpu_count INTEGER, sizes TEXT, trials INTEGER, duration_s REAL, params TEXT);
+        CREATE TABLE measurements (id INTEGER PRIMARY KEY AUTOINCREMENT, run_id INTEGER NOT NULL,
+            operation TEXT NOT NULL, size INTEGER NOT NULL, trial INTEGER NOT NULL, time_ms REAL NOT NULL,
+            memory_kb REAL, extra TEXT);
+        INSERT INTO runs (created_at, operation, git_commit, python_version, python_implementation)
+            VALUES ('2024-01-01', 'BST: search', 'f00', '3.11.0', 'CPython');
+    """)
+    conn.execute("INSERT INTO measurements (run_id, operation, size, trial, time_ms, memory_kb, extra) "
+                 "VALUES (1, 'BST: search', 100, 1, 2.0, 4.0, ?)", (json.dumps({"distribution": "zipf"}),))
+    conn.commit()
+    conn.close()
+    with ResultsDB(path) as db:
+        row = db.query().iloc[0]
+    assert (row["distribution"], row["interpreter"], row["measure_memory"]) == ("zipf", "CPython 3.11.0", 1)
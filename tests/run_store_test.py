@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.utils.run_store import RunStore, prune_runs
+
+
+def _frame(n=10_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "size": rng.choice([100, 200, 400], n),
+        "trial": np.arange(n),
+        "time_ms": rng.exponential(1.0, n),
+        "operation": "Array: search",
+        "outlier": rng.random(n) < 0.05,
+    })
+
+
+def test_aggregate_matches_pandas(tmp_path):
+    df = _frame()
+    store = RunStore.write(df, runs_dir=str(tmp_path))
+    agg = store.aggregate("time_ms", percentiles=(50, 99)).set_index("size")
+    expected = df.groupby("size")["time_ms"]
+    assert np.allclose(agg["mean"], expected.mean())
+    assert np.allclose(agg["stddev"], expected.std())
+    assert np.allclose(agg["p50"], expected.median())
+    assert np.allclose(agg["p99"], expected.quantile(0.99))
+    assert (agg["count"] == expected.count()).all()
+    outliers = store.aggregate("outlier", stats=("sum",)).set_index("size")["sum"]
+    assert (outliers == df.groupby("size")["outlier"].sum()).all()
+
+
+def test_page_and_downsample(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.run_store.ROW_GROUP_SIZE", 1000)
+    df = _frame()
+    store = RunStore.write(df, runs_dir=str(tmp_path))
+    page = store.page(2_950, 100)  # spans a row-group boundary
+    pd.testing.assert_frame_equal(page, df.iloc[2_950:3_050])
+    assert store.page(9_990, 100).index.tolist() == list(range(9_990, 10_000))
+    ds = store.downsample("time_ms", max_points=200)
+    assert len(ds) <= 200
+    assert ds["max"].max() == df["time_ms"].max() and ds["min"].min() == df["time_ms"].min()
+
+
+def test_prune_keeps_newest_and_runs_in_use(tmp_path):
+    paths = [str(tmp_path / f"run{seed}.parquet") for seed in range(5)]
+    for seed, path in enumerate(paths):
+        RunStore.write(_frame(10, seed), path=path)
+        os.utime(path, (seed, seed))  # written long ago, run4 newest
+    assert prune_runs(keep=4, runs_dir=str(tmp_path), in_use_s=0) == 1
+    RunStore(paths[1])  # another session redraws run1: it becomes recently used
+    assert prune_runs(keep=0, runs_dir=str(tmp_path)) == 3
+    assert [p.name for p in tmp_path.iterdir()] == ["run1.parquet"]
@@ -0,0 +1,52 @@
+from src.benchmarks import scheduler
+from src.benchmarks.scheduler import BudgetScheduler, fit_power_law
+from src.utils.results_db import ResultsDB
+
+
+def test_power_law_recovers_exponent():
+    c, k = fit_power_law([100, 200, 400], [1.0, 4.0, 16.0])
+    assert abs(k - 2.0) < 1e-9
+    assert abs(c * 800 ** k - 64.0) < 1e-6
+
+
+def test_zero_budget_extrapolates_large_sizes():
+    sched = BudgetScheduler([100, 200, 400, 800], trials=2, budget_s=0.0)
+    df = sched.run("Array: insert_end")
+    # nothing can be measured without budget, and nothing can be predicted without data
+    assert df["extrapolated"].all() and list(df["size"]) == [100, 200, 400, 800]
+    assert df["time_ms"].isna().all()
+    assert set(sched.plan["status"]) == {"extrapolated"}
+    assert sched.plan["predicted_ms"].isna().all()
+
+
+def test_generous_budget_measures_everything():
+    sched = BudgetScheduler([100, 200, 400, 800], trials=2, budget_s=60.0)
+    df = sched.run("Array: insert_end")
+    assert set(sched.plan["status"]) == {"measured"}
+    assert len(df) == 8 and not df["extrapolated"].any()
+    assert sched.plan["predicted_ms"].notna().sum() == 2
+
+
+def test_budget_limited_run_marks_skipped_sizes_as_extrapolated(tmp_path, monkeypatch):
+    # fake clock: each trial of size n "takes" n^2 ns, so the largest size would overrun the budget
+    clock = [0.0]
+    monkeypatch.setattr(scheduler, "perf_counter", lambda: clock[0])
+    sched = BudgetScheduler([100, 200, 400, 100_000], trials=2, budget_s=1.0)
+
+    def fake_measure(target, n, trial):
+        clock[0] += n * n * 1e-9
+        return {"size": n, "trial": trial, "time_ms": n * n * 1e-6, "operation": target}
+    monkeypatch.setattr(sched.bench, "measure", fake_measure)
+
+    df = sched.run("Array: insert_front")
+    skipped = sched.plan[sched.plan["status"] == "extrapolated"]
+    assert list(skipped["size"]) == [100_000] and skipped["predicted_ms"].notna().all()
+    predicted = df[df["extrapolated"]]
+    assert list(predicted["size"]) == [100_000] and predicted["time_ms"].isna().all()
+    assert abs(predicted["predicted_ms"].iloc[0] - 1e4) < 1e-6  # n^2 ns fitted from the measured sizes
+    measured = df[~df["extrapolated"]]
+    assert list(measured["size"].unique()) == [100, 200, 400] and measured["time_ms"].notna().all()
+    with ResultsDB(str(tmp_path / "h.sqlite")) as db:
+        db.record_run(df, sizes=sched.sizes, trials=2, params={"budget_s": 1.0})
+        rows = db.query(operation="Array: insert_front")
+        assert len(rows) == len(measured) == 6 and rows["extra"].isna().all()
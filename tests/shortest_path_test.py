@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from src.ds.graph import Graph
+from src.ds.indexed_heap import IndexedMinHeap
+
+
+def _grid(side, seed):
+    rng = random.Random(seed)
+    g = Graph()
+    for r in range(side):
+        for c in range(side):
+            u = r * side + c
+            if c + 1 < side:
+                g.add_edge(u, u + 1, rng.randint(1, 9))
+            if r + 1 < side:
+                g.add_edge(u, u + side, rng.randint(1, 9))
+    return g
+
+
+def _bellman_ford(g, source):
+    dist = {u: float("inf") for u in g.adj}
+    dist[source] = 0
+    for _ in range(len(g.adj)):
+        for u in g.adj:
+            for v in g.adj[u]:
+                dist[v] = min(dist[v], dist[u] + g.weight(u, v))
+    return dist
+
+
+def test_indexed_heap_decrease_key():
+    heap = IndexedMinHeap()
+    for item, p in [("a", 5), ("b", 3), ("c", 8)]:
+        heap.push(item, p)
+    heap.decrease_key("c", 1)
+    assert not heap.push_or_decrease("a", 7)
+    with pytest.raises(ValueError):
+        heap.decrease_key("b", 4)
+    assert [heap.pop() for _ in range(3)] == [("c", 1), ("b", 3), ("a", 5)]
+    assert len(heap) == 0 and "a" not in heap
+
+
+def test_dijkstra_and_astar_agree_with_reference():
+    side = 8
+    g = _grid(side, seed=2)
+    ref = _bellman_ford(g, 0)
+    for lazy in (False, True):
+        dist, settled = g.dijkstra(0, lazy=lazy)
+        assert dist == ref and settled == len(g.adj)
+    manhattan = lambda u, v: abs(u // side - v // side) + abs(u % side - v % side)
+    for t in (7, 35, 63):
+        cost, settled = g.astar(0, t, manhattan)
+        assert cost == ref[t]
+        assert settled <= g.dijkstra(0, t)[1]
+
+
+def test_weights_are_optional_and_cleaned_up():
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3, weight=5)
+    g.add_edge(1, 3, weight=7)
+    assert g.weight(1, 2) == 1 and g.weight(3, 2) == 5
+    assert g.dijkstra(1)[0] == {1: 0, 2: 1, 3: 6}
+    g.delete_node(2)
+    assert (2, 3) not in g._weights and (3, 2) not in g._weights
+    assert g.astar(1, 3) == (7, 2)
+    g.add_node(9)
+    assert g.astar(1, 9)[0] == float("inf")
+    with pytest.raises(ValueError):
+        g.add_edge(1, 3, weight=-1)
@@ -0,0 +1,67 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.ds.bst import BinarySearchTree
+from src.ds.btree import BPlusTree
+from src.ds.hash_table import HashTable
+from src.utils import snapshot
+
+
+def _preorder(node):
+    return [] if node is None else [node.key, *_preorder(node.left), *_preorder(node.right)]
+
+
+KEYS = [5, -1, -7, 3, 2**62, 0, 9, 5, -2, 40, 41]
+
+
+def test_vectorized_fixtures_match_python_inserts(tmp_path):
+    ht, bst, tree = HashTable(capacity=1024), BinarySearchTree(), BPlusTree(order=4)
+    for k in KEYS:
+        ht.put(k, k)
+        bst.insert(k)
+        tree.insert(k)
+    paths = {}
+    for kind, structure in (("hash_table", ht), ("bst", bst), ("btree", tree)):
+        built = snapshot._write(str(tmp_path / f"{kind}-built"), kind, *snapshot.build_arrays(kind, np.array(KEYS)))
+        saved = snapshot.save(structure, str(tmp_path / f"{kind}-saved"))
+        paths[kind] = built, saved
+    for kind in ("hash_table", "btree"):
+        built, saved = paths[kind]
+        for name in snapshot.read_meta(saved)["arrays"]:
+            assert np.array_equal(np.load(f"{built}/{name}.npy"), np.load(f"{saved}/{name}.npy"))
+    # BST node numbering differs (sorted vs preorder); compare the rebuilt shapes instead
+    for path in paths["bst"]:
+        assert _preorder(snapshot.load(path).root) == _preorder(bst.root)
+
+
+def test_frozen_lookups_on_mmap(tmp_path):
+    ht = snapshot.fixture("hash_table", 5000, "uniform", seed=3, root=str(tmp_path))
+    bst = snapshot.fixture("bst", 5000, "uniform", seed=3, root=str(tmp_path))
+    tree = snapshot.fixture("btree", 5000, "uniform", seed=3, root=str(tmp_path))
+    assert isinstance(tree.keys, np.memmap) and not tree.keys.flags.writeable
+    keys = set(snapshot.workloads.generate_list("uniform", 5000, 3))
+    probes = list(range(0, 50_000, 7))
+    assert [ht.get(p) == p for p in probes] == [p in keys for p in probes]
+    assert [bst.search(p) for p in probes] == [p in keys for p in probes]
+    assert tree.search_many(probes).tolist() == [p in keys for p in probes]
+    assert tree.range_scan(100, 900).tolist() == sorted(k for k in keys if 100 <= k <= 900)
+    assert len(ht) == len(bst) == len(tree) == len(keys)
+
+
+def test_rejects_non_integer_values(tmp_path):
+    ht = HashTable()
+    ht.put(1, "one")
+    with pytest.raises(TypeError):
+        snapshot.save(ht, str(tmp_path / "ht"))
+    assert not list(tmp_path.iterdir())
+
+
+def test_rejects_unknown_kind(tmp_path):
+    path = snapshot.save(BPlusTree(), str(tmp_path / "tree"))
+    meta = snapshot.read_meta(path)
+    with open(f"{path}/meta.json", "w") as fh:
+        json.dump({**meta, "kind": "trie"}, fh)
+    with pytest.raises(ValueError, match="trie"):
+        snapshot.open_snapshot(path)
@@ -0,0 +1,113 @@
+import random
+from collections import Counter
+
+from src.benchmarks.benchmark import Benchmark
+from src.ds.bst import BinarySearchTree
+from src.ds.graph import Graph
+from src.ds.hash_table import HashTable
+from src.utils import snapshot
+
+
+def _histogram(values):
+    counts = Counter(values)
+    return [counts.get(k, 0) for k in range(max(counts) + 1)]
+
+
+def test_bst_shape_tracks_inserts_and_deletes():
+    bst = BinarySearchTree()
+    for k in range(1, 8):
+        bst.insert(k)  # degenerate chain
+    assert bst.stats() == {"height": 7, "avg_depth": 4.0}
+    rng = random.Random(5)
+    keys = rng.sample(range(10_000), 2_000)
+    bst = BinarySearchTree()
+    for k in keys:
+        bst.insert(k)
+    incremental = bst.stats()
+    bst._recount()
+    assert bst.stats() == incremental
+    for k in keys[:500]:
+        bst.delete(k)
+    after = bst.stats()
+    fresh = BinarySearchTree()
+    fresh.root = bst.root
+    fresh._recount()
+    assert after == fresh.stats() and len(bst) == 1_500
+
+
+def test_hash_table_chain_lengths(tmp_path):
+    ht = HashTable(capacity=8)
+    for k in range(0, 80, 4):  # bad hashing: everything lands in buckets 0 and 4
+        ht.put(k, k)
+    ht.put(0, -1)  # overwrite, not a new entry
+    assert ht.stats() == {"load_factor": 2.5, "max_chain": 10, "mean_chain": 10.0}
+    for k in (0, 8, 16, 24, 32):
+        ht.delete(k)
+    assert ht.chain_lengths() == _histogram(len(b) for b in ht.buckets)
+    assert ht.chain_lengths() == [6, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+    ht.delete(4)
+    ht.delete(12)
+    assert ht.stats() == {"load_factor": 1.625, "max_chain": 8, "mean_chain": 6.5}
+
+    loaded = snapshot.load(snapshot.save(ht, str(tmp_path / "ht")))
+    assert loaded.stats() == ht.stats() and loaded.chain_lengths() == ht.chain_lengths()
+
+
+def test_graph_degree_distribution():
+    g = Graph()
+    rng = random.Random(3)
+    for _ in range(300):
+        u, v = rng.randrange(60), rng.randrange(60)
+        if u != v:
+            g.add_edge(u, v)
+    assert g.stats()["max_degree"] == max(len(nbrs) for nbrs in g.adj.values())
+    for u in rng.sample(sorted(g.adj), 10):
+        g.delete_node(u)
+    degrees = [len(nbrs) for nbrs in g.adj.values()]
+    assert g.degree_histogram() == _histogram(degrees)
+    assert g.stats() == {"mean_degree": sum(degrees) / len(degrees), "max_degree": max(degrees)}
+
+
+def test_benchmark_records_structure_stats():
+    bench = Benchmark([200], trials=1)
+    assert {"height", "avg_depth"} <= set(bench.measure("BST: insert_ordered", 200, 1))
+    assert bench.measure("BST: insert_ordered", 200, 1)["height"] == 200
+    assert {"load_factor", "max_chain", "mean_chain"} <= set(bench.measure("HashTable: get", 200, 1))
+    assert {"mean_degree", "max_degree"} <= set(bench.measure("Graph: delete_node", 200, 1))
+
+
+def test_untracked_structures_recount_the_same_stats():
+    rng = random.Random(11)
+    keys = rng.sample(range(5_000), 1_000)
+    edges = [(rng.randrange(200), rng.randrange(200)) for _ in range(600)]
+    pairs = []
+    for track in (True, False):
+        bst, ht, g = BinarySearchTree(track_stats=track), HashTable(64, track_stats=track), Graph(track_stats=track)
+        for k in keys[:500]:
+            bst.insert(k)
+            ht.put(k, k)
+        first = (bst.stats(), ht.stats())
+        for k in keys[500:]:  # stats() must stay right for inserts after a recount
+            bst.insert(k)
+            ht.put(k, k)
+        for u, v in edges:
+            if u != v:
+                g.add_edge(u, v)
+        pairs.append((first, bst.stats(), ht.stats(), g.stats()))
+    assert pairs[0] == pairs[1]
+    assert Benchmark([300], trials=1).track_stats is False
+
+
+def test_benchmark_counters_and_recount_agree():
+    # every stats op, with tracking on inside the timed block (counters) and off (recount after timing)
+    ops = ["BST: insert", "BST: insert_ordered", "BST: search", "BST: delete", "BST: search_many",
+           "HashTable: put", "HashTable: get", "HashTable: delete",
+           "Graph: add_edges(line)", "Graph: bfs_search(end)", "Graph: delete_node",
+           "Graph: connected(union-find)", "Graph: connected(bfs)"]
+    timing = {"time_ms", "lookups_per_s", "queries_per_s"}
+    tracked, untracked = Benchmark([300], trials=1, track_stats=True), Benchmark([300], trials=1)
+    for op in ops:
+        a, b = tracked.measure(op, 300, 1), untracked.measure(op, 300, 1)
+        stats = set(a) - timing - {"size", "trial", "operation"}
+        assert stats & {"height", "load_factor", "max_degree"}, op
+        assert {k: a[k] for k in stats} == {k: b[k] for k in stats}, op
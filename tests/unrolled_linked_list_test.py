@@ -0,0 +1,51 @@
+import random
+
+from src.benchmarks.chunking import chunk_size_sweep, sweep_summary
+from src.ds.unrolled_linked_list import UnrolledLinkedList
+
+
+def _check_invariants(ull):
+    node, total = ull.head, 0
+    while node:
+        assert 0 < node.count <= ull.chunk_size
+        assert all(v is None for v in node.values[node.count:])
+        total += node.count
+        last = node
+        node = node.next
+    assert total == len(ull)
+    if ull.head:
+        assert ull.tail is last
+
+
+def test_matches_list_under_random_edits():
+    rng = random.Random(3)
+    ull = UnrolledLinkedList(range(100), chunk_size=8)
+    ref = list(range(100))
+    for i in range(400):
+        if rng.random() < 0.5 and ref:
+            v = rng.choice(ref)
+            assert ull.delete(v)
+            ref.remove(v)
+        else:
+            pos = rng.randint(0, len(ref))
+            ull.insert(pos, 1000 + i)
+            ref.insert(pos, 1000 + i)
+        _check_invariants(ull)
+    assert list(ull) == ref
+    assert ull.find(ref[-1]) and not ull.find(-1)
+    assert not ull.delete(-1)
+
+
+def test_delete_everything():
+    ull = UnrolledLinkedList(range(50), chunk_size=4)
+    for v in range(50):
+        assert ull.delete(v)
+    assert len(ull) == 0 and ull.head is None and ull.tail is None
+    ull.append(7)
+    assert list(ull) == [7]
+
+
+def test_chunk_sweep_includes_baseline():
+    summary = sweep_summary(chunk_size_sweep([500], chunk_sizes=(8, 64), trials=1))
+    assert set(summary["chunk_size"]) == {1, 8, 64}
+    assert (summary[summary["structure"] == "LinkedList"]["speedup_vs_linked_list"] == 1.0).all()
@@ -1,33 +1,14 @@
 """Quick validation test for all operations"""
 from src.benchmarks.benchmark import Benchmark
 
-print("✅ Testing all 17 operations...")
 b = Benchmark([100], 1)
-
-operations = [
-    'Array: insert_end',
-    'Array: insert_front',
-    'Array: search',
-    'Array: delete',
-    'LinkedList: insert_tail',
-    'LinkedList: search',
-    'LinkedList: delete',
-    'BST: insert',
-    'BST: insert_ordered',
-    'BST: search',
-    'BST: delete',
-    'HashTable: put',
-    'HashTable: get',
-    'HashTable: delete',
-    'Graph: add_edges(line)',
-    'Graph: bfs_search(end)',
-    'Graph: delete_node',
-]
+operations = list(b.operations())
+print(f"✅ Testing all {len(operations)} operations...")
 
 for op in operations:
     result = b.run(op)
     avg_time = result['time_ms'].mean()
     print(f"{op:30s}: {avg_time:.4f} ms")
 
-print("\n✅ All 17 operations working perfectly!")
+print(f"\n✅ All {len(operations)} operations working perfectly!")
 print("✅ Project is production-ready!")
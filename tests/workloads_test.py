@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from src.utils import workloads
+
+
+def test_generate_is_cached_reproducible_and_read_only():
+    a = workloads.generate("shuffled", 1000, seed=7)
+    assert a is workloads.generate("shuffled", 1000, seed=7)
+    assert sorted(a.tolist()) == list(range(1000))
+    assert not np.array_equal(a, workloads.generate("shuffled", 1000, seed=8))
+    with pytest.raises(ValueError):
+        a[0] = 1
+    assert workloads.generate_list("reverse", 4) == [3, 2, 1, 0]
+
+
+def test_shared_workloads_are_mapped_read_only_by_worker_processes():
+    key = ("shuffled", 10_000, 7, None)
+    code = ("from src.utils import workloads; assert workloads.attach_shared() == 1; "
+            "a = workloads.generate('shuffled', 10_000, 7); "
+            "assert not a.flags.writeable and a.base is not None; print(int(a.sum()), int(a[0]))")
+    with workloads.SharedWorkloads([key, key]) as shared:
+        env = {**os.environ, **shared.env(), "PYTHONPATH": os.getcwd()}
+        for _ in range(2):  # the block must outlive each worker that attached to it
+            out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+            total, first = map(int, out.stdout.split())
+            assert total == sum(range(10_000)) and first == workloads.generate(*key)[0]
+    assert workloads.attach_shared(shared.env()[workloads.SHARED_ENV]) == 0  # gone: regenerated on demand
+
+
+def test_unknown_distribution():
+    with pytest.raises(ValueError):
+        workloads.generate("bogus", 10)
+
+
+def test_cache_is_bounded_by_bytes(monkeypatch):
+    workloads.clear_cache()
+    monkeypatch.setattr(workloads, "CACHE_MAX_BYTES", 3 * 8 * 1000)  # room for three 1000-key arrays
+    first = workloads.generate("sorted", 1000, seed=1)
+    for seed in (2, 3, 4):
+        workloads.generate("sorted", 1000, seed=seed)
+    assert workloads._cache_bytes <= workloads.CACHE_MAX_BYTES and len(workloads._cache) == 3
+    assert workloads.generate("sorted", 1000, seed=1) is not first  # evicted, regenerated
+    workloads.generate("sorted", 5000)  # larger than the whole cache: returned, not kept
+    assert ("sorted", 5000, workloads.DEFAULT_SEED, None) not in workloads._cache
+    workloads.clear_cache()
+
+
+def test_key_distributions_shapes():
+    n = 2000
+    assert workloads.generate_list("sorted", 5) == [0, 1, 2, 3, 4]
+    nearly = workloads.generate("nearly_sorted", n, param=5)
+    assert sorted(nearly.tolist()) == list(range(n))
+    assert 0 < int((nearly != np.arange(n)).sum()) <= 10
+    dup = workloads.generate("duplicates", n)
+    assert len(set(dup.tolist())) <= n // 100
+    zipf = workloads.generate("zipf", n)
+    assert zipf.min() >= 0 and zipf.max() < n
+    # the hottest key should dominate a Zipf stream
+    assert np.bincount(zipf).max() > n // 20